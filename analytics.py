@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Offline analytics for the 250 Card Game
+Loads the full match history as NumPy arrays and computes club-wide statistics in
+batch: player totals and win rates, bidder success by bid band, partner-pair
+synergy, location effects, and a re-derivation of every stored score using the
+same rules as the match handler (lib/scoring.js). It also replays every hand
+through the player rating rules (lib/rating.js) and can write the result back to
+the player_ratings table, to backfill or repair the incrementally kept ratings.
+
+Input is either the database itself or a CSV file in the long "one row per player
+per hand" format below.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Column order of the long format; booleans may be t/f, true/false or 1/0
+HISTORY_COLUMNS = [
+    "game_id", "location", "match_id", "match_number", "timestamp",
+    "bidder_id", "bid_amount", "won", "player_id", "is_partner", "score",
+]
+
+# Postgres assigns dense integer codes (players and games by id, matches in play
+# order) and packs each row into fixed-width big-endian fields, so a whole table
+# arrives as one bytea value that NumPy can view without parsing
+CODES_CTE = """
+    WITH pl AS (SELECT id, (row_number() OVER (ORDER BY id) - 1)::int AS ix FROM players),
+         gm AS (SELECT id, (row_number() OVER (ORDER BY id) - 1)::int AS ix FROM games),
+         mt AS (SELECT *, (row_number() OVER (ORDER BY timestamp, "gameId", "matchNumber") - 1)::int AS ix
+                FROM matches)
+"""
+
+MATCH_ROWS_QUERY = CODES_CTE + """
+    SELECT string_agg(int4send(mt.ix) || int4send(gm.ix) || int4send(mt."matchNumber")
+                      || int8send((extract(epoch FROM mt.timestamp) * 1000)::int8)
+                      || int4send(pl.ix) || int4send(mt."bidAmount") || int4send(mt.won::int), ''::bytea)
+    FROM mt JOIN gm ON gm.id = mt."gameId" JOIN pl ON pl.id = mt."bidderId"
+"""
+MATCH_ROW_DTYPE = np.dtype([("match", ">i4"), ("game", ">i4"), ("number", ">i4"), ("time", ">i8"),
+                            ("bidder", ">i4"), ("bid", ">i4"), ("won", ">i4")])
+
+SCORE_ROWS_QUERY = CODES_CTE + """
+    SELECT string_agg(int4send(mt.ix) || int4send(pl.ix) || int4send(s.score), ''::bytea)
+    FROM match_scores s JOIN mt ON mt.id = s."matchId" JOIN pl ON pl.id = s."playerId"
+"""
+SCORE_ROW_DTYPE = np.dtype([("match", ">i4"), ("player", ">i4"), ("score", ">i4")])
+
+PARTNER_ROWS_QUERY = CODES_CTE + """
+    SELECT string_agg(int4send(mt.ix) || int4send(pl.ix), ''::bytea)
+    FROM match_partners mp JOIN mt ON mt.id = mp."matchId" JOIN pl ON pl.id = mp."playerId"
+"""
+PARTNER_ROW_DTYPE = np.dtype([("match", ">i4"), ("player", ">i4")])
+
+ROLE_BIDDER, ROLE_PARTNER, ROLE_OTHER = 0, 1, 2
+
+# Rating rules, mirroring lib/rating.js
+INITIAL_RATING = 1500.0
+RATING_K = 24
+MIN_BID = 130
+BIDDER_SHARE = 2
+
+# Bid bands for bidder success, as [low, high] inclusive
+BID_BANDS = [(130, 145), (150, 165), (170, 185), (190, 205), (210, 225), (230, 245), (250, 250)]
+
+
+def log(message, level="INFO"):
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {level}: {message}")
+
+
+def _truthy(values):
+    return np.isin(np.char.lower(np.asarray(values, dtype=str)), ["t", "true", "1"])
+
+
+def _epoch_ms(values):
+    """ISO-8601 or Postgres timestamps (UTC) as epoch milliseconds"""
+    values = np.char.rstrip(np.asarray(values, dtype=str), "Z")
+    return values.astype("datetime64[ms]").astype(np.int64)
+
+
+def read_history_csv(path):
+    """Column name -> array of strings for a long-format CSV file"""
+    with open(path, newline="") as f:
+        header = next(csv.reader(f))
+        rows = np.loadtxt(f, delimiter=",", quotechar='"', dtype=str, ndmin=2)
+    if rows.shape[0] == 0:
+        rows = np.empty((0, len(header)), dtype=str)
+    return {name: rows[:, i] for i, name in enumerate(header)}
+
+
+class MatchHistory:
+    """Match history as flat arrays
+
+    Row-level arrays (one entry per player per hand): row_match, row_player,
+    row_role and row_score. Match-level arrays are indexed by match position:
+    match_ids, match_game, match_location, match_number, match_time (epoch ms),
+    bid, won, bidder and n_partners. Players, games and locations are integer
+    codes into the players, games and locations label arrays.
+    """
+
+    def __init__(self, *, players, games, locations, match_ids, match_game, match_location,
+                 match_number, match_time, bid, won, bidder, row_match, row_player, row_partner, row_score):
+        self.players, self.games, self.locations, self.match_ids = players, games, locations, match_ids
+        self.match_game = np.asarray(match_game, dtype=np.int64)
+        self.match_location = np.asarray(match_location, dtype=np.int64)
+        self.match_number = np.asarray(match_number, dtype=np.int64)
+        self.match_time = np.asarray(match_time, dtype=np.int64)
+        self.bid = np.asarray(bid, dtype=np.int64)
+        self.won = np.asarray(won, dtype=bool)
+        self.bidder = np.asarray(bidder, dtype=np.int64)
+        self.row_match = np.asarray(row_match, dtype=np.int64)
+        self.row_player = np.asarray(row_player, dtype=np.int64)
+        self.row_score = np.asarray(row_score, dtype=np.int64)
+
+        self.row_role = np.full(len(self.row_match), ROLE_OTHER, dtype=np.int8)
+        self.row_role[np.asarray(row_partner, dtype=bool)] = ROLE_PARTNER
+        self.row_role[self.row_player == self.bidder[self.row_match]] = ROLE_BIDDER
+        self.n_partners = np.bincount(self.row_match[self.row_role == ROLE_PARTNER],
+                                      minlength=len(match_ids))
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Factorize long-format string columns (see HISTORY_COLUMNS)"""
+        match_ids, first_row, row_match = np.unique(columns["match_id"], return_index=True, return_inverse=True)
+        players, row_player = np.unique(np.concatenate([columns["player_id"], columns["bidder_id"][first_row]]),
+                                        return_inverse=True)
+        take = lambda name: columns[name][first_row]
+        games, match_game = np.unique(take("game_id"), return_inverse=True)
+        locations, match_location = np.unique(take("location"), return_inverse=True)
+
+        return cls(
+            players=players, games=games, locations=locations, match_ids=match_ids,
+            match_game=match_game, match_location=match_location,
+            match_number=take("match_number").astype(np.int64), match_time=_epoch_ms(take("timestamp")),
+            bid=take("bid_amount").astype(np.int64), won=_truthy(take("won")),
+            bidder=row_player[len(columns["player_id"]):], row_match=row_match,
+            row_player=row_player[:len(columns["player_id"])], row_partner=_truthy(columns["is_partner"]),
+            row_score=columns["score"].astype(np.int64),
+        )
+
+    @classmethod
+    def from_csv(cls, path):
+        return cls.from_columns(read_history_csv(path))
+
+    @classmethod
+    def from_postgres(cls, url):
+        import psycopg  # only needed when reading straight from the database
+
+        from query_plan_benchmark import libpq_url
+
+        with psycopg.connect(libpq_url(url)) as conn:
+            # One snapshot, so the codes in every query agree
+            conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+            with conn.transaction(), conn.cursor() as cur:
+                players = np.array([row[0] for row in cur.execute("SELECT id FROM players ORDER BY id")], dtype=object)
+                game_rows = cur.execute("SELECT id, location FROM games ORDER BY id").fetchall()
+                match_ids = cur.execute(
+                    """SELECT string_agg(id, E'\\n' ORDER BY timestamp, "gameId", "matchNumber") FROM matches"""
+                ).fetchone()[0]
+                match_rows = np.frombuffer(cur.execute(MATCH_ROWS_QUERY).fetchone()[0] or b"", MATCH_ROW_DTYPE)
+                score_rows = np.frombuffer(cur.execute(SCORE_ROWS_QUERY).fetchone()[0] or b"", SCORE_ROW_DTYPE)
+                partner_rows = np.frombuffer(cur.execute(PARTNER_ROWS_QUERY).fetchone()[0] or b"", PARTNER_ROW_DTYPE)
+
+        games = np.array([game_id for game_id, _ in game_rows], dtype=object)
+        locations, game_location = np.unique(np.array([location for _, location in game_rows], dtype=object),
+                                             return_inverse=True)
+        match_rows = np.sort(match_rows, order="match")
+        match_game = match_rows["game"]
+        seat = lambda rows: rows["match"].astype(np.int64) * len(players) + rows["player"]
+
+        return cls(
+            players=players, games=games, locations=locations,
+            match_ids=np.array(match_ids.split("\n") if match_ids else [], dtype=object),
+            match_game=match_game, match_location=game_location[match_game] if len(games) else match_game,
+            match_number=match_rows["number"], match_time=match_rows["time"],
+            bid=match_rows["bid"], won=match_rows["won"], bidder=match_rows["bidder"],
+            row_match=score_rows["match"], row_player=score_rows["player"],
+            row_partner=np.isin(seat(score_rows), seat(partner_rows)), row_score=score_rows["score"],
+        )
+
+    @property
+    def hands(self):
+        return len(self.match_ids)
+
+    # Derived row-level views
+
+    def on_bidder_team(self):
+        return self.row_role != ROLE_OTHER
+
+    def row_won(self):
+        """True where the player's side won the hand (bidder team or challengers)"""
+        return self.won[self.row_match] == self.on_bidder_team()
+
+    def expected_scores(self):
+        """Scores re-derived with the match handler's rules"""
+        return rule_scores(self.bid[self.row_match], self.won[self.row_match], self.row_role,
+                           self.n_partners[self.row_match] == 0)
+
+
+def rule_scores(bid, won, role, solo):
+    """Per-row scores under the rules of lib/scoring.js, from each row's hand bid,
+    result, the player's role, and whether the bidder played without partners"""
+    bid, won, solo = np.asarray(bid), np.asarray(won, dtype=bool), np.asarray(solo, dtype=bool)
+    scores = np.zeros(len(role), dtype=np.int64)
+    winners_bidder = won & (role == ROLE_BIDDER)
+    scores[winners_bidder & solo] = bid[winners_bidder & solo]
+    scores[winners_bidder & ~solo] = bid[winners_bidder & ~solo] + 100
+    scores[won & (role == ROLE_PARTNER)] = bid[won & (role == ROLE_PARTNER)]
+    scores[~won & (role == ROLE_OTHER)] = bid[~won & (role == ROLE_OTHER)]
+    return scores
+
+
+def _rate(numerator, denominator):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1), 0.0)
+
+
+def player_summary(history):
+    """Totals and win rates per player, as arrays aligned with history.players"""
+    n = len(history.players)
+    team = history.on_bidder_team()
+    team_won = team & history.won[history.row_match]
+    is_bidder = history.row_role == ROLE_BIDDER
+
+    hands = np.bincount(history.row_player, minlength=n)
+    points = np.bincount(history.row_player, weights=history.row_score, minlength=n).astype(np.int64)
+    wins = np.bincount(history.row_player, weights=history.row_won(), minlength=n)
+    team_hands = np.bincount(history.row_player, weights=team, minlength=n)
+    team_wins = np.bincount(history.row_player, weights=team_won, minlength=n)
+    bids = np.bincount(history.row_player, weights=is_bidder, minlength=n)
+    bids_won = np.bincount(history.row_player, weights=is_bidder & team_won, minlength=n)
+
+    return {
+        "hands": hands,
+        "totalPoints": points,
+        "averagePoints": _rate(points, hands),
+        "winRate": _rate(wins, hands),
+        "bidderTeamHands": team_hands.astype(np.int64),
+        "bidderTeamWinRate": _rate(team_wins, team_hands),
+        "bids": bids.astype(np.int64),
+        "bidSuccessRate": _rate(bids_won, bids),
+    }
+
+
+def bid_band_success(history):
+    """Bidder success by bid band, club-wide and per player (players x bands)"""
+    lows = np.array([low for low, _ in BID_BANDS])
+    band = np.clip(np.searchsorted(lows, history.bid, side="right") - 1, 0, len(lows) - 1)
+    n_bands = len(BID_BANDS)
+
+    attempts = np.bincount(band, minlength=n_bands)
+    successes = np.bincount(band, weights=history.won, minlength=n_bands)
+
+    n = len(history.players)
+    cell = history.bidder * n_bands + band
+    player_attempts = np.bincount(cell, minlength=n * n_bands).reshape(n, n_bands)
+    player_successes = np.bincount(cell, weights=history.won, minlength=n * n_bands).reshape(n, n_bands)
+
+    return {
+        "bands": [f"{low}-{high}" if low != high else str(low) for low, high in BID_BANDS],
+        "attempts": attempts,
+        "successRate": _rate(successes, attempts),
+        "playerAttempts": player_attempts,
+        "playerSuccessRate": _rate(player_successes, player_attempts),
+    }
+
+
+def partner_synergy(history, min_hands=10):
+    """Win rate of every pair that sat on the bidder team together, against the
+    average of the two players' own bidder-team win rates"""
+    team = np.flatnonzero(history.on_bidder_team())
+    team = team[np.argsort(history.row_match[team], kind="stable")]
+    team_match = history.row_match[team]
+    team_player = history.row_player[team]
+
+    # Pair each team row with the rows after it in the same hand
+    max_team = int(np.bincount(team_match).max()) if len(team) else 0
+    left, right, matches = [], [], []
+    for offset in range(1, max_team):
+        same = team_match[:-offset] == team_match[offset:]
+        left.append(team_player[:-offset][same])
+        right.append(team_player[offset:][same])
+        matches.append(team_match[:-offset][same])
+    if not left:
+        return []
+    a, b, pair_match = np.concatenate(left), np.concatenate(right), np.concatenate(matches)
+
+    n = len(history.players)
+    low, high = np.minimum(a, b), np.maximum(a, b)
+    keys, pair_index = np.unique(low * n + high, return_inverse=True)
+    hands = np.bincount(pair_index)
+    wins = np.bincount(pair_index, weights=history.won[pair_match])
+
+    own = player_summary(history)["bidderTeamWinRate"]
+    first, second = keys // n, keys % n
+    pair_rate = _rate(wins, hands)
+    synergy = pair_rate - (own[first] + own[second]) / 2
+
+    keep = np.flatnonzero(hands >= min_hands)
+    keep = keep[np.argsort(-synergy[keep])]
+    return [{
+        "players": [history.players[first[i]], history.players[second[i]]],
+        "hands": int(hands[i]),
+        "winRate": round(float(pair_rate[i]), 4),
+        "synergy": round(float(synergy[i]), 4),
+    } for i in keep]
+
+
+def location_effects(history):
+    """Per location: hands, average bid and bidder success; per player x location:
+    points per hand relative to the player's overall points per hand"""
+    n_loc = len(history.locations)
+    hands = np.bincount(history.match_location, minlength=n_loc)
+    bid_total = np.bincount(history.match_location, weights=history.bid, minlength=n_loc)
+    successes = np.bincount(history.match_location, weights=history.won, minlength=n_loc)
+
+    n = len(history.players)
+    row_location = history.match_location[history.row_match]
+    cell = history.row_player * n_loc + row_location
+    cell_hands = np.bincount(cell, minlength=n * n_loc).reshape(n, n_loc)
+    cell_points = np.bincount(cell, weights=history.row_score, minlength=n * n_loc).reshape(n, n_loc)
+    overall = player_summary(history)["averagePoints"]
+
+    return {
+        "locations": list(history.locations),
+        "hands": hands,
+        "averageBid": _rate(bid_total, hands),
+        "bidSuccessRate": _rate(successes, hands),
+        "playerHands": cell_hands,
+        "playerPointsDelta": np.where(cell_hands > 0, _rate(cell_points, cell_hands) - overall[:, None], 0.0),
+    }
+
+
+def score_discrepancies(history):
+    """Rows whose stored score differs from the re-derived one"""
+    expected = history.expected_scores()
+    bad = np.flatnonzero(expected != history.row_score)
+    return [{
+        "matchId": history.match_ids[history.row_match[i]],
+        "playerId": history.players[history.row_player[i]],
+        "stored": int(history.row_score[i]),
+        "expected": int(expected[i]),
+    } for i in bad]
+
+
+def player_ratings(history):
+    """Replay every hand in play order through the rating rules of lib/rating.js
+
+    An Elo update depends on the ratings going into the hand, so the replay is one
+    sequential pass. Everything else is computed up front as arrays: hands in play
+    order with each hand's seats contiguous (bidder's team first), team sizes, and
+    each seat's fixed multiplier (K for the bid times the seat's share of the swing).
+    That leaves two means and one exponent per hand.
+    Returns (rating, hands) arrays indexed by player code.
+    """
+    n_players, n_hands = len(history.players), history.hands
+    order = np.lexsort((history.match_number, history.match_game, history.match_time))
+    rank = np.empty(n_hands, dtype=np.int64)
+    rank[order] = np.arange(n_hands)
+
+    on_team = history.on_bidder_team()
+    row_rank = rank[history.row_match]
+    seats = np.lexsort((~on_team, row_rank))
+    seat_counts = np.bincount(row_rank, minlength=n_hands)
+    team_size = np.bincount(row_rank[on_team], minlength=n_hands)
+    defenders = seat_counts - team_size
+
+    # Share of the swing per seat: the bidder's team splits team_size units of it,
+    # BIDDER_SHARE parts to the bidder and one to each partner; defenders split the loss
+    role, match = history.row_role, history.row_match
+    shares = BIDDER_SHARE + history.n_partners[match]
+    share = np.where(role == ROLE_BIDDER, BIDDER_SHARE / shares,
+                     np.where(role == ROLE_PARTNER, 1 / shares, -1 / np.maximum(defenders[row_rank], 1)))
+    multiplier = RATING_K * (history.bid[match] / MIN_BID) * team_size[row_rank] * share
+
+    seat_player = history.row_player[seats].tolist()
+    seat_multiplier = multiplier[seats].tolist()
+    bounds = np.concatenate([[0], np.cumsum(seat_counts)]).tolist()
+    team_size, defenders = team_size.tolist(), defenders.tolist()
+    won = history.won[order].astype(float).tolist()
+
+    rating = [INITIAL_RATING] * n_players
+    for h in range(n_hands):
+        if defenders[h] == 0:
+            continue
+        start, split, end = bounds[h], bounds[h] + team_size[h], bounds[h + 1]
+        team_mean = sum(rating[p] for p in seat_player[start:split]) / team_size[h]
+        defender_mean = sum(rating[p] for p in seat_player[split:end]) / defenders[h]
+        surprise = won[h] - 1 / (1 + 10 ** ((defender_mean - team_mean) / 400))
+        for p, m in zip(seat_player[start:end], seat_multiplier[start:end]):
+            rating[p] += m * surprise
+
+    return np.array(rating), np.bincount(history.row_player, minlength=n_players)
+
+
+def write_ratings(url, history, rating, hands):
+    """Replace the player_ratings table with rebuilt ratings
+
+    The table is locked first, so match inserts wait and then apply their hands on
+    top of the rebuilt ratings. Hands committed between reading the history and
+    taking the lock would be lost, so the write is refused if any exist.
+    """
+    import psycopg
+
+    from query_plan_benchmark import libpq_url
+
+    with psycopg.connect(libpq_url(url)) as conn:
+        with conn.transaction(), conn.cursor() as cur:
+            cur.execute("LOCK TABLE player_ratings IN EXCLUSIVE MODE")
+            played = cur.execute("SELECT count(*) FROM matches").fetchone()[0]
+            if played != history.hands:
+                raise RuntimeError(f"{played - history.hands} hands were played while rebuilding; run it again")
+            cur.execute("DELETE FROM player_ratings")
+            with cur.copy('COPY player_ratings ("playerId", rating, hands) FROM STDIN') as copy:
+                for i in np.flatnonzero(hands):
+                    copy.write_row((history.players[i], float(rating[i]), int(hands[i])))
+    return int(np.count_nonzero(hands))
+
+
+def build_report(history, min_pair_hands=10, ratings=None):
+    players = list(history.players)
+    summary = player_summary(history)
+    bands = bid_band_success(history)
+    locations = location_effects(history)
+    discrepancies = score_discrepancies(history)
+    rating, hands = ratings or player_ratings(history)
+
+    return {
+        "hands": history.hands,
+        "players": {
+            player: {key: round(float(values[i]), 4) if values.dtype.kind == "f" else int(values[i])
+                     for key, values in summary.items()}
+            for i, player in enumerate(players)
+        },
+        "bidBands": {
+            band: {"attempts": int(bands["attempts"][j]), "successRate": round(float(bands["successRate"][j]), 4)}
+            for j, band in enumerate(bands["bands"])
+        },
+        "partnerSynergy": partner_synergy(history, min_pair_hands),
+        "locations": {
+            location: {
+                "hands": int(locations["hands"][j]),
+                "averageBid": round(float(locations["averageBid"][j]), 1),
+                "bidSuccessRate": round(float(locations["bidSuccessRate"][j]), 4),
+            }
+            for j, location in enumerate(locations["locations"])
+        },
+        "scoreDiscrepancies": discrepancies,
+        "ratings": {
+            history.players[i]: {"rating": round(float(rating[i]), 1), "hands": int(hands[i])}
+            for i in np.argsort(-rating, kind="stable") if hands[i]
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch analytics over the full match history")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--csv", help="history export in the long CSV format")
+    source.add_argument("--database-url", default=os.environ.get("DATABASE_URL"),
+                        help="read straight from Postgres (defaults to DATABASE_URL)")
+    parser.add_argument("--min-pair-hands", type=int, default=10, help="minimum hands together for partner synergy")
+    parser.add_argument("--output", default="analytics_report.json", help="where to write the JSON report")
+    parser.add_argument("--write-ratings", action="store_true",
+                        help="replace the player_ratings table with ratings rebuilt from the history")
+    args = parser.parse_args()
+    if args.write_ratings and args.csv:
+        parser.error("--write-ratings reads the history from the database; drop --csv")
+
+    started = time.perf_counter()
+    if args.csv:
+        history = MatchHistory.from_csv(args.csv)
+    elif args.database_url:
+        history = MatchHistory.from_postgres(args.database_url)
+    else:
+        parser.error("--csv or --database-url (or DATABASE_URL) is required")
+    loaded = time.perf_counter()
+    log(f"Loaded {history.hands} hands, {len(history.row_match)} scores in {loaded - started:.2f}s")
+
+    ratings = player_ratings(history)
+    rated = time.perf_counter()
+    log(f"Replayed {history.hands} hands through the rating rules in {rated - loaded:.2f}s")
+    report = build_report(history, args.min_pair_hands, ratings)
+    log(f"Computed analytics in {time.perf_counter() - rated:.2f}s")
+
+    if report["scoreDiscrepancies"]:
+        log(f"⚠️  {len(report['scoreDiscrepancies'])} stored scores differ from the scoring rules", "WARNING")
+    else:
+        log("✅ Every stored score matches the scoring rules")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, default=str)
+    log(f"📄 Analytics report written to {args.output}")
+
+    if args.write_ratings:
+        written = write_ratings(args.database_url, history, *ratings)
+        log(f"✅ Rebuilt ratings for {written} players")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,119 +1,610 @@
+import { randomUUID } from 'crypto';
+import { promisify } from 'util';
+import { gzip, gunzip } from 'zlib';
 import { NextRequest, NextResponse } from 'next/server';
+import { Prisma } from '@prisma/client';
 import { prisma } from '@/lib/prisma';
+import { publishGameEvent, subscribeToGame, formatEvent } from '@/lib/events';
+import { responseCache, isNotModified } from '@/lib/cache';
+import { instrument, renderMetrics } from '@/lib/metrics';
+import { withIdempotency } from '@/lib/idempotency';
+import { warmDatabase, warmupStatus } from '@/lib/warmup';
+import { calculateScores, tallyTotals, tallyPlayerStats } from '@/lib/scoring';
+import { rateHand } from '@/lib/rating';
+
+// Serve a versioned read: 304 when the client already has this ETag, the cached body
+// when the server does, otherwise build the payload once and cache it under the ETag
+const cachedJson = async (request, cacheKey, etag, build) => {
+  const headers = { 'ETag': etag, 'Cache-Control': 'no-cache' };
+  
+  if (isNotModified(request, etag)) {
+    return new Response(null, { status: 304, headers });
+  }
+  
+  let cached = responseCache.get(cacheKey);
+  if (!cached || cached.etag !== etag) {
+    cached = { etag, body: JSON.stringify(await build()) };
+    responseCache.set(cacheKey, cached);
+  }
+  
+  return new Response(cached.body, {
+    headers: { ...headers, 'Content-Type': 'application/json' }
+  });
+};
+
+// Drop cached reads that include this game; the version checks would miss them anyway,
+// this just frees the memory straight away
+const invalidateGameReads = (gameId) => {
+  if (gameId) {
+    responseCache.delete(`game:${gameId}:full`);
+    responseCache.delete(`game:${gameId}:summary`);
+  }
+  responseCache.delete('games');
+  responseCache.delete('games:active:full');
+  responseCache.delete('games:active:summary');
+};
+
+const gzipAsync = promisify(gzip);
+const gunzipAsync = promisify(gunzip);
+
+// Serve a stored gzip body as-is to clients that accept gzip, otherwise inflate it
+const gzippedJson = async (request, body, etag) => {
+  const headers = {
+    'ETag': etag,
+    'Cache-Control': 'no-cache',
+    'Content-Type': 'application/json',
+    'Vary': 'Accept-Encoding'
+  };
+  
+  if (isNotModified(request, etag)) {
+    return new Response(null, { status: 304, headers });
+  }
+  if (/\bgzip\b/.test(request.headers.get('accept-encoding') || '')) {
+    return new Response(body, { headers: { ...headers, 'Content-Encoding': 'gzip' } });
+  }
+  return new Response(await gunzipAsync(body), { headers });
+};
+
+// Keyset page parameters (?after=<cursor>&limit=<n>); null when limit is out of range
+const pageParams = (searchParams, defaultLimit, maxLimit) => {
+  const limit = searchParams.has('limit') ? parseInt(searchParams.get('limit'), 10) : defaultLimit;
+  if (!Number.isInteger(limit) || limit < 1 || limit > maxLimit) return null;
+  return { after: searchParams.get('after'), limit };
+};
+
+// Rows are read with take: limit + 1, so an extra row means another page follows
+const pageOf = (rows, limit, cursorOf) => {
+  const items = rows.slice(0, limit);
+  return { items, nextCursor: rows.length > limit ? cursorOf(items[items.length - 1]) : null };
+};
+
+// ?fields=summary lists a game's players once and has matches refer to them by id,
+// instead of embedding a player record in every bidder, partner and score.
+// Returns 'full', 'summary', or null for anything else.
+const viewParam = (searchParams) => {
+  const fields = searchParams.get('fields');
+  if (!fields) return 'full';
+  return fields === 'summary' ? 'summary' : null;
+};
+
+const gameInclude = (view, matchArgs = {}) => ({
+  players: {
+    include: {
+      player: true
+    }
+  },
+  matches: {
+    include: view === 'summary' ? { partners: true, scores: true } : {
+      bidder: true,
+      partners: {
+        include: {
+          player: true
+        }
+      },
+      scores: {
+        include: {
+          player: true
+        }
+      }
+    },
+    ...matchArgs
+  }
+});
+
+const summarizeGame = ({ players, matches, ...game }) => ({
+  ...game,
+  players: players.map(({ player }) => player),
+  matches: matches.map(matchDelta)
+});
+
+// Same normalization as the generated normalizedName columns on players and locations
+const normalizeName = (name) => name.trim().replace(/\s+/g, ' ').toLowerCase();
+
+const isUniqueViolation = (error) =>
+  error instanceof Prisma.PrismaClientKnownRequestError && error.code === 'P2002';
+
+// Typeahead over a table's normalizedName: one or two characters match as a prefix
+// (text_pattern_ops index), longer queries as a substring (trigram index), and
+// prefix matches rank first
+const searchByName = (table, columns, query, limit) => {
+  const pattern = query.replace(/[\\%_]/g, '\\$&');
+  const match = query.length < 3 ? `${pattern}%` : `%${pattern}%`;
+  return prisma.$queryRaw`
+    SELECT ${Prisma.raw(columns)} FROM ${Prisma.raw(`"${table}"`)}
+    WHERE "normalizedName" LIKE ${match}
+    ORDER BY "normalizedName" LIKE ${`${pattern}%`} DESC, "normalizedName"
+    LIMIT ${limit}
+  `;
+};
+
+// A tally's entries in playerId order. Upserts lock their rows in VALUES order, so every
+// writer building its rows this way takes a shared player's rows in the same order and
+// concurrent hands from different games can't deadlock on them.
+const byPlayerId = (tally) => [...tally].sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0));
+
+// Add a tally of per-player points/wins/losses to a game's running totals in one statement.
+// Returns the updated totals rows for the players that changed.
+const applyGameTotals = async (tx, gameId, tally) => {
+  const rows = byPlayerId(tally).map(([playerId, t]) =>
+    Prisma.sql`(${gameId}, ${playerId}, ${t.totalPoints}, ${t.matchesWon}, ${t.matchesLost})`
+  );
+  if (rows.length === 0) return [];
+
+  return tx.$queryRaw`
+    INSERT INTO "game_totals" ("gameId", "playerId", "totalPoints", "matchesWon", "matchesLost")
+    VALUES ${Prisma.join(rows)}
+    ON CONFLICT ("gameId", "playerId") DO UPDATE SET
+      "totalPoints" = "game_totals"."totalPoints" + EXCLUDED."totalPoints",
+      "matchesWon" = "game_totals"."matchesWon" + EXCLUDED."matchesWon",
+      "matchesLost" = "game_totals"."matchesLost" + EXCLUDED."matchesLost"
+    RETURNING "playerId", "totalPoints", "matchesWon", "matchesLost"
+  `;
+};
+
+// Add a tally of career stat increments to player_stats, and count the hands
+// towards each player's location stats, in two statements. Both take their rows in
+// playerId order (one location per call, so that is also (playerId, location) order).
+const applyPlayerStats = async (tx, location, tally) => {
+  const entries = byPlayerId(tally);
+  const rows = entries.map(([playerId, t]) =>
+    Prisma.sql`(${playerId}, ${t.totalMatches}, ${t.matchesAsBidder}, ${t.matchesAsPartner}, ${t.wonMatches}, ${t.lostMatches}, ${t.totalPoints}, ${t.highestBid}, ${t.bids250}, ${t.bids250Won})`
+  );
+  if (rows.length === 0) return;
+
+  await tx.$executeRaw`
+    INSERT INTO "player_stats" (
+      "playerId", "totalMatches", "matchesAsBidder", "matchesAsPartner", "wonMatches", "lostMatches",
+      "totalPoints", "highestBid", "bids250", "bids250Won"
+    )
+    VALUES ${Prisma.join(rows)}
+    ON CONFLICT ("playerId") DO UPDATE SET
+      "totalMatches" = "player_stats"."totalMatches" + EXCLUDED."totalMatches",
+      "matchesAsBidder" = "player_stats"."matchesAsBidder" + EXCLUDED."matchesAsBidder",
+      "matchesAsPartner" = "player_stats"."matchesAsPartner" + EXCLUDED."matchesAsPartner",
+      "wonMatches" = "player_stats"."wonMatches" + EXCLUDED."wonMatches",
+      "lostMatches" = "player_stats"."lostMatches" + EXCLUDED."lostMatches",
+      "totalPoints" = "player_stats"."totalPoints" + EXCLUDED."totalPoints",
+      "highestBid" = GREATEST("player_stats"."highestBid", EXCLUDED."highestBid"),
+      "bids250" = "player_stats"."bids250" + EXCLUDED."bids250",
+      "bids250Won" = "player_stats"."bids250Won" + EXCLUDED."bids250Won"
+  `;
+
+  const locationRows = entries.map(([playerId, t]) =>
+    Prisma.sql`(${playerId}, ${location}, ${t.totalMatches})`
+  );
+  await tx.$executeRaw`
+    INSERT INTO "player_location_stats" ("playerId", "location", "matches")
+    VALUES ${Prisma.join(locationRows)}
+    ON CONFLICT ("playerId", "location") DO UPDATE SET
+      "matches" = "player_location_stats"."matches" + EXCLUDED."matches"
+  `;
+};
+
+// Apply hands to the players' ratings, in order. The rows are created if missing
+// and then locked in id order, so concurrent games sharing a player apply their
+// hands one after the other instead of overwriting each other. insertMatches takes
+// the stats rows the same way first, so the locks come in one order across tables.
+const applyRatings = async (tx, hands) => {
+  const playerIds = [...new Set(hands.flatMap(hand => hand.playerIds))].sort();
+  if (playerIds.length === 0) return;
+
+  await tx.$executeRaw`
+    INSERT INTO "player_ratings" ("playerId")
+    VALUES ${Prisma.join(playerIds.map(id => Prisma.sql`(${id})`))}
+    ON CONFLICT ("playerId") DO NOTHING
+  `;
+  const current = await tx.$queryRaw`
+    SELECT "playerId", "rating" FROM "player_ratings"
+    WHERE "playerId" IN (${Prisma.join(playerIds)})
+    ORDER BY "playerId" COLLATE "C"
+    FOR UPDATE
+  `;
+  
+  const ratings = new Map(current.map(row => [row.playerId, row.rating]));
+  const handCounts = new Map();
+  hands.forEach(hand => {
+    rateHand(hand, ratings);
+    hand.playerIds.forEach(id => handCounts.set(id, (handCounts.get(id) || 0) + 1));
+  });
+  
+  const rows = playerIds.map(id =>
+    Prisma.sql`(${id}, ${ratings.get(id)}::double precision, ${handCounts.get(id)}::integer)`
+  );
+  await tx.$executeRaw`
+    UPDATE "player_ratings" AS r
+    SET "rating" = v."rating", "hands" = r."hands" + v."hands", "updatedAt" = now()
+    FROM (VALUES ${Prisma.join(rows)}) AS v("playerId", "rating", "hands")
+    WHERE r."playerId" = v."playerId"
+  `;
+};
+
+// Largest number of hands accepted by a single batch request
+const MAX_BATCH_HANDS = 500;
+
+const isPlayerList = (value) => Array.isArray(value) && value.every(player => player?.id);
+
+// Why a batch hand can't be written, or null. Checked before the transaction so a bad
+// hand is a 400 naming it rather than a failed insert or unique violation for the batch.
+const handError = ({ bidder, partners = [], bidAmount, won, currentPlayers, timestamp }) => {
+  if (!bidder?.id || typeof bidAmount !== 'number' || typeof won !== 'boolean') {
+    return 'bidder, bidAmount and won are required';
+  }
+  if (!isPlayerList(partners) || (currentPlayers !== undefined && !isPlayerList(currentPlayers))) {
+    return 'partners and currentPlayers must be lists of players';
+  }
+  if (timestamp !== undefined && isNaN(new Date(timestamp).getTime())) {
+    return 'timestamp must be an ISO timestamp';
+  }
+  const partnerIds = partners.map(partner => partner.id);
+  if (partnerIds.includes(bidder.id)) {
+    return 'the bidder is also listed as a partner';
+  }
+  if (new Set(partnerIds).size !== partnerIds.length) {
+    return 'a partner is listed twice';
+  }
+  if (currentPlayers && new Set(currentPlayers.map(player => player.id)).size !== currentPlayers.length) {
+    return 'a player is listed twice';
+  }
+  return null;
+};
+
+// Bulk-insert hands for one game: a createMany each for matches, partners and scores,
+// plus one upsert each for running totals and player stats, and the rating update.
+// Must run inside a transaction. Per-player rows are locked table by table (totals,
+// stats, location stats, ratings), each in playerId order.
+// Returns the matches, in the same shape as a nested include of bidder/partners/scores,
+// and the updated running totals. A hand's clientId (the id an offline client gave it)
+// is not stored, only echoed on its match so the client can swap in the saved copy.
+const insertMatches = async (tx, game, gamePlayers, hands, firstMatchNumber) => {
+  const matchRows = [];
+  const partnerRows = [];
+  const scoreRows = [];
+  const totalsTally = new Map();
+  const statsTally = new Map();
+  const rated = [];
+  
+  const created = hands.map(({ bidder, partners = [], bidAmount, won, currentPlayers, timestamp, clientId }, index) => {
+    const matchId = randomUUID();
+    const players = currentPlayers || gamePlayers;
+    const playersById = new Map([bidder, ...partners, ...players].map(p => [p.id, p]));
+    const scores = calculateScores({ bidder, partners, bidAmount, won, players });
+    
+    const match = {
+      id: matchId,
+      gameId: game.id,
+      matchNumber: firstMatchNumber + index,
+      bidderId: bidder.id,
+      bidAmount,
+      won,
+      timestamp: timestamp ? new Date(timestamp) : new Date()
+    };
+    const matchPartners = partners.map(partner => ({ id: randomUUID(), matchId, playerId: partner.id }));
+    const matchScores = scores.map(score => ({ id: randomUUID(), matchId, ...score }));
+    matchRows.push(match);
+    partnerRows.push(...matchPartners);
+    scoreRows.push(...matchScores);
+    
+    const hand = {
+      bidderId: bidder.id,
+      partnerIds: partners.map(p => p.id),
+      bidAmount,
+      won,
+      scores
+    };
+    tallyTotals(hand, totalsTally);
+    tallyPlayerStats(hand, statsTally);
+    rated.push({ ...hand, playerIds: scores.map(score => score.playerId) });
+    
+    return {
+      ...match,
+      ...(clientId && { clientId }),
+      bidder,
+      partners: matchPartners.map(row => ({ ...row, player: playersById.get(row.playerId) })),
+      scores: matchScores.map(row => ({ ...row, player: playersById.get(row.playerId) }))
+    };
+  });
+  
+  await tx.match.createMany({ data: matchRows });
+  if (partnerRows.length > 0) {
+    await tx.matchPartner.createMany({ data: partnerRows });
+  }
+  await tx.matchScore.createMany({ data: scoreRows });
+  const totals = await applyGameTotals(tx, game.id, totalsTally);
+  await applyPlayerStats(tx, game.location, statsTally);
+  await applyRatings(tx, rated);
+  
+  return { matches: created, totals };
+};
+
+// Compact form of a match for live stream deltas; viewers already know the players
+const matchDelta = ({ id, clientId, matchNumber, bidderId, bidAmount, won, timestamp, partners, scores }) => ({
+  id,
+  ...(clientId && { clientId }),
+  matchNumber,
+  bidderId,
+  partnerIds: partners.map(p => p.playerId),
+  bidAmount,
+  won,
+  timestamp,
+  scores: scores.map(({ playerId, score }) => ({ playerId, score }))
+});
+
+// Reserve match numbers and write the hands in one transaction. Bumping the game's
+// matchCount takes the row lock, so concurrent writers get dense, unique numbers.
+// Once committed, one delta is pushed to the game's live stream.
+// Resolves to { matches, totals, totalMatches } (the stream payload, with full
+// matches), or null when the game does not exist.
+const recordHands = async (gameId, hands, options) => {
+  const result = await prisma.$transaction(async (tx) => {
+    const [game] = await tx.$queryRaw`
+      UPDATE "games" SET "matchCount" = "matchCount" + ${hands.length}, "version" = "version" + 1
+      WHERE "id" = ${gameId}
+      RETURNING "id", "location", "matchCount"
+    `;
+    if (!game) return null;
+    
+    // The roster is only needed for hands that don't say who is at the table
+    let gamePlayers = [];
+    if (hands.some(hand => !hand.currentPlayers)) {
+      const seats = await tx.gamePlayer.findMany({
+        where: { gameId },
+        include: { player: true }
+      });
+      gamePlayers = seats.map(gp => gp.player);
+    }
+    
+    const written = await insertMatches(tx, game, gamePlayers, hands, game.matchCount - hands.length + 1);
+    return { ...written, totalMatches: game.matchCount };
+  }, options);
+  
+  if (!result) return null;
+  
+  invalidateGameReads(gameId);
+  publishGameEvent(gameId, 'matches', {
+    matches: result.matches.map(matchDelta),
+    totals: result.totals,
+    totalMatches: result.totalMatches
+  });
+  return result;
+};
+
+// Final standings and headline numbers stored with an ended game
+const finalSummary = (game, totals) => {
+  const rankings = totals.map(({ player, totalPoints, matchesWon, matchesLost }) => ({
+    player,
+    totalPoints,
+    matchesWon,
+    matchesLost
+  }));
+  const scorer = (entry) => entry && { playerId: entry.player.id, name: entry.player.name, totalPoints: entry.totalPoints };
+  const bids250 = game.matches.filter(match => match.bidAmount === 250);
+  
+  return {
+    rankings,
+    totalMatches: game.matchCount,
+    stats: {
+      topScorer: scorer(rankings[0]),
+      leastScorer: scorer(rankings[rankings.length - 1]),
+      bidderWins: game.matches.filter(match => match.won).length,
+      highestBid: Math.max(0, ...game.matches.map(match => match.bidAmount)),
+      bids250: bids250.length,
+      bids250Won: bids250.filter(match => match.won).length
+    }
+  };
+};
+
+// Write the frozen snapshot of an ended game: the gzipped body of each view of
+// GET /api/games/:gameId, with the final standings, tagged with the game version
+// it was taken at. Run inside the transaction that ends the game so nothing can
+// be added in between. Returns the snapshot row and the final summary, or null
+// for a missing game.
+const freezeGame = async (tx, gameId) => {
+  const game = await tx.game.findUnique({
+    where: { id: gameId },
+    include: {
+      ...gameInclude('full', { orderBy: { matchNumber: 'asc' } }),
+      totals: {
+        include: {
+          player: true
+        },
+        orderBy: { totalPoints: 'desc' }
+      }
+    }
+  });
+  if (!game) return null;
+  
+  const { totals, ...gameFields } = game;
+  const final = finalSummary(gameFields, totals);
+  const [full, summary] = await Promise.all([
+    gzipAsync(JSON.stringify({ game: gameFields, final })),
+    gzipAsync(JSON.stringify({ game: summarizeGame(gameFields), final }))
+  ]);
+  
+  const fields = { version: game.version, full, summary };
+  const snapshot = await tx.gameSnapshot.upsert({
+    where: { gameId },
+    update: fields,
+    create: { gameId, ...fields }
+  });
+  return { snapshot, final };
+};
+
+// How often an idle stream sends a comment line to keep proxies from closing it
+const STREAM_HEARTBEAT_MS = 25000;
 
 // Game state management endpoints
 const gameRoutes = {
-  // Get all games
-  'GET /api/games': async () => {
-    const games = await prisma.game.findMany({
-      include: {
-        players: {
-          include: {
-            player: true
-          }
-        },
-        matches: {
-          include: {
-            bidder: true,
-            partners: {
-              include: {
-                player: true
-              }
-            },
-            scores: {
-              include: {
-                player: true
-              }
-            }
-          },
+  // Get all games, newest first (?after=<gameId>&limit=&fields=summary)
+  'GET /api/games': async (request) => {
+    const { searchParams } = new URL(request.url);
+    const page = pageParams(searchParams, 10, 50);
+    const view = viewParam(searchParams);
+    
+    if (!page || !view) {
+      return NextResponse.json({ error: 'limit must be 1-50 and fields must be summary' }, { status: 400 });
+    }
+    
+    // Any game created, played or ended changes the count or the version sum
+    const { _count, _sum } = await prisma.game.aggregate({
+      _count: true,
+      _sum: { version: true }
+    });
+    const query = searchParams.toString();
+    const etag = `"games-${_count}-${_sum.version || 0}${query ? `-${query}` : ''}"`;
+    
+    return cachedJson(request, query ? `games?${query}` : 'games', etag, async () => {
+      const rows = await prisma.game.findMany({
+        include: gameInclude(view, {
           orderBy: { matchNumber: 'desc' },
           take: 5
-        }
-      },
-      orderBy: { createdAt: 'desc' },
-      take: 10
+        }),
+        orderBy: [{ createdAt: 'desc' }, { id: 'desc' }],
+        take: page.limit + 1,
+        ...(page.after && { cursor: { id: page.after }, skip: 1 })
+      });
+      const { items, nextCursor } = pageOf(rows, page.limit, game => game.id);
+      return { games: items.map(view === 'summary' ? summarizeGame : game => game), nextCursor };
     });
-    return NextResponse.json({ games });
   },
 
   // Get active game
-  'GET /api/games/active': async () => {
-    const activeGame = await prisma.game.findFirst({
+  'GET /api/games/active': async (request) => {
+    const view = viewParam(new URL(request.url).searchParams);
+    if (!view) {
+      return NextResponse.json({ error: 'fields must be summary' }, { status: 400 });
+    }
+    
+    const current = await prisma.game.findFirst({
       where: { isActive: true },
-      include: {
-        players: {
-          include: {
-            player: true
-          }
-        },
-        matches: {
-          include: {
-            bidder: true,
-            partners: {
-              include: {
-                player: true
-              }
-            },
-            scores: {
-              include: {
-                player: true
-              }
-            }
-          }
-        }
-      }
+      select: { id: true, version: true }
+    });
+    const etag = current ? `"active-${current.id}-v${current.version}-${view}"` : '"active-none"';
+    
+    return cachedJson(request, `games:active:${view}`, etag, async () => {
+      const activeGame = current && await prisma.game.findUnique({
+        where: { id: current.id },
+        include: gameInclude(view)
+      });
+      return { game: activeGame && view === 'summary' ? summarizeGame(activeGame) : activeGame };
     });
-    return NextResponse.json({ game: activeGame });
   },
 
   // Get specific game by ID
   'GET /api/games/:gameId': async (request, gameId) => {
-    const game = await prisma.game.findUnique({
+    const view = viewParam(new URL(request.url).searchParams);
+    if (!view) {
+      return NextResponse.json({ error: 'fields must be summary' }, { status: 400 });
+    }
+    
+    // Cheap version check first; the nested read only runs when the game has changed
+    const current = await prisma.game.findUnique({
       where: { id: gameId },
-      include: {
-        players: {
-          include: {
-            player: true
-          }
-        },
-        matches: {
-          include: {
-            bidder: true,
-            partners: {
-              include: {
-                player: true
-              }
-            },
-            scores: {
-              include: {
-                player: true
-              }
-            }
-          }
-        }
+      select: { version: true, isActive: true }
+    });
+    
+    if (!current) {
+      return NextResponse.json({ error: 'Game not found' }, { status: 404 });
+    }
+    
+    const etag = `"game-${gameId}-v${current.version}-${view}"`;
+    
+    // An ended game is served from its frozen snapshot, written on first read for
+    // games ended before snapshots existed (or changed after they were taken)
+    if (!current.isActive) {
+      let snapshot = await prisma.gameSnapshot.findUnique({
+        where: { gameId },
+        select: { version: true, [view]: true }
+      });
+      if (!snapshot || snapshot.version !== current.version) {
+        const frozen = await prisma.$transaction(tx => freezeGame(tx, gameId), { timeout: 30000 });
+        snapshot = frozen?.snapshot;
       }
+      if (snapshot?.version === current.version) {
+        return gzippedJson(request, snapshot[view], etag);
+      }
+    }
+    
+    return cachedJson(request, `game:${gameId}:${view}`, etag, async () => {
+      const game = await prisma.game.findUnique({
+        where: { id: gameId },
+        include: gameInclude(view)
+      });
+      return { game: view === 'summary' ? summarizeGame(game) : game };
     });
+  },
+
+  // Page through a game's matches in play order (?after=<matchNumber>&limit=&fields=summary)
+  'GET /api/games/:gameId/matches': async (request, gameId) => {
+    const { searchParams } = new URL(request.url);
+    const page = pageParams(searchParams, 100, 500);
+    const view = viewParam(searchParams);
+    const after = page?.after ? parseInt(page.after, 10) : 0;
+    
+    if (!page || !view || isNaN(after)) {
+      return NextResponse.json({ error: 'after must be a match number, limit 1-500 and fields summary' }, { status: 400 });
+    }
+    
+    const [game, rows] = await Promise.all([
+      prisma.game.findUnique({
+        where: { id: gameId },
+        select: { id: true }
+      }),
+      prisma.match.findMany({
+        where: { gameId, matchNumber: { gt: after } },
+        include: gameInclude(view).matches.include,
+        orderBy: { matchNumber: 'asc' },
+        take: page.limit + 1
+      })
+    ]);
     
     if (!game) {
       return NextResponse.json({ error: 'Game not found' }, { status: 404 });
     }
     
-    return NextResponse.json({ game });
+    const { items, nextCursor } = pageOf(rows, page.limit, match => String(match.matchNumber));
+    return NextResponse.json({ matches: view === 'summary' ? items.map(matchDelta) : items, nextCursor });
   },
 
   // Create new game
   'POST /api/games': async (request) => {
     const { location, players } = await request.json();
     
-    // Deactivate any existing active games
-    await prisma.game.updateMany({
+    // Deactivate any existing active games, bumping their version so cached reads and
+    // ETags of those games stop claiming they are still active
+    const deactivated = await prisma.game.findMany({
       where: { isActive: true },
-      data: { isActive: false }
+      select: { id: true }
     });
+    if (deactivated.length > 0) {
+      await prisma.game.updateMany({
+        where: { id: { in: deactivated.map(game => game.id) }, isActive: true },
+        data: { isActive: false, version: { increment: 1 } }
+      });
+    }
     
-    // Ensure location exists in database
-    await prisma.location.upsert({
-      where: { name: location },
+    // Ensure location exists in database, reusing it under any spelling of its name
+    const { name: locationName } = await prisma.location.upsert({
+      where: { normalizedName: normalizeName(location) },
       update: {},
       create: { name: location }
     });
@@ -122,12 +613,17 @@ const gameRoutes = {
     
     const newGame = await prisma.game.create({
       data: {
-        location,
+        location: locationName,
         partnerCount,
         players: {
           create: players.map(player => ({
             playerId: player.id
           }))
+        },
+        totals: {
+          create: players.map(player => ({
+            playerId: player.id
+          }))
         }
       },
       include: {
@@ -139,6 +635,9 @@ const gameRoutes = {
       }
     });
     
+    deactivated.forEach(game => invalidateGameReads(game.id));
+    invalidateGameReads();
+    responseCache.delete('locations');
     return NextResponse.json({ game: newGame });
   },
 
@@ -146,122 +645,61 @@ const gameRoutes = {
   'POST /api/games/:gameId/matches': async (request, gameId) => {
     const { bidder, partners, bidAmount, won, currentPlayers } = await request.json();
     
-    const game = await prisma.game.findUnique({
-      where: { id: gameId },
-      include: {
-        players: {
-          include: {
-            player: true
-          }
-        }
-      }
-    });
+    const created = await recordHands(gameId, [{ bidder, partners, bidAmount, won, currentPlayers }]);
     
-    if (!game) {
+    if (!created) {
       return NextResponse.json({ error: 'Game not found' }, { status: 404 });
     }
     
-    const matchNumber = await prisma.match.count({
-      where: { gameId }
-    }) + 1;
-    
-    // Use current players if provided, otherwise fall back to original game players
-    const allPlayers = currentPlayers || game.players.map(gp => gp.player);
-    const nonPartners = allPlayers.filter(p => 
-      p.id !== bidder.id && !partners.some(partner => partner.id === p.id)
-    );
-    
-    // Calculate scores
-    const scores = [];
-    if (won) {
-      if (partners.length === 0) {
-        // Solo player case: bidder gets bid amount only (not bid + 100)
-        scores.push({ playerId: bidder.id, score: bidAmount });
-        nonPartners.forEach(player => {
-          scores.push({ playerId: player.id, score: 0 });
-        });
-      } else {
-        // Normal case: bidder gets bid + 100, partners get bid amount, non-partners get 0
-        scores.push({ playerId: bidder.id, score: bidAmount + 100 });
-        partners.forEach(partner => {
-          scores.push({ playerId: partner.id, score: bidAmount });
-        });
-        nonPartners.forEach(player => {
-          scores.push({ playerId: player.id, score: 0 });
-        });
-      }
-    } else {
-      // Bidder and partners get 0, each non-partner gets full bid amount
-      scores.push({ playerId: bidder.id, score: 0 });
-      partners.forEach(partner => {
-        scores.push({ playerId: partner.id, score: 0 });
-      });
-      nonPartners.forEach(player => {
-        scores.push({ playerId: player.id, score: bidAmount });
-      });
+    return NextResponse.json({ match: created.matches[0] });
+  },
+
+  // Add several hands to a game in one transaction (offline catch-up, archive imports)
+  'POST /api/games/:gameId/matches/batch': async (request, gameId) => {
+    const { hands } = await request.json();
+    
+    if (!Array.isArray(hands) || hands.length === 0) {
+      return NextResponse.json({ error: 'hands must be a non-empty array' }, { status: 400 });
     }
     
-    const newMatch = await prisma.match.create({
-      data: {
-        gameId,
-        matchNumber,
-        bidderId: bidder.id,
-        bidAmount,
-        won,
-        partners: {
-          create: partners.map(partner => ({
-            playerId: partner.id
-          }))
-        },
-        scores: {
-          create: scores
-        }
-      },
-      include: {
-        bidder: true,
-        partners: {
-          include: {
-            player: true
-          }
-        },
-        scores: {
-          include: {
-            player: true
-          }
-        }
+    if (hands.length > MAX_BATCH_HANDS) {
+      return NextResponse.json({ error: `At most ${MAX_BATCH_HANDS} hands per batch` }, { status: 400 });
+    }
+    
+    for (const [index, hand] of hands.entries()) {
+      const error = handError(hand || {});
+      if (error) {
+        return NextResponse.json({ error: `Hand ${index + 1}: ${error}` }, { status: 400 });
       }
-    });
+    }
+    
+    const created = await recordHands(gameId, hands, { timeout: 30000 });
+    
+    if (!created) {
+      return NextResponse.json({ error: 'Game not found' }, { status: 404 });
+    }
     
-    return NextResponse.json({ match: newMatch });
+    // Same shape as the stream's matches event, so a syncing client can apply either
+    return NextResponse.json({
+      matches: created.matches.map(matchDelta),
+      totals: created.totals,
+      totalMatches: created.totalMatches
+    });
   },
 
   // Get game totals
   'GET /api/games/:gameId/totals': async (request, gameId) => {
+    // Running totals are maintained on match insert, so this is a single indexed read
     const game = await prisma.game.findUnique({
       where: { id: gameId },
-      include: {
-        players: {
+      select: {
+        totals: {
           include: {
             player: true
-          }
-        },
-        matches: {
-          include: {
-            bidder: true,
-            partners: {
-              include: {
-                player: true
-              }
-            },
-            scores: {
-              include: {
-                player: true
-              }
-            }
           },
-          orderBy: { matchNumber: 'desc' },
-          take: 15
-        }
+          orderBy: { totalPoints: 'desc' }
+        },
+        matchCount: true
       }
     });
     
@@ -269,88 +707,129 @@ const gameRoutes = {
       return NextResponse.json({ error: 'Game not found' }, { status: 404 });
     }
     
-    // Get all unique players who have ever participated in this game
-    const allPlayerIds = new Set();
-    
-    // Add players from game setup
-    game.players.forEach(gp => {
-      allPlayerIds.add(gp.player.id);
-    });
-    
-    // Add players from all matches (bidder, partners, and anyone who scored)
-    game.matches.forEach(match => {
-      allPlayerIds.add(match.bidder.id);
-      match.partners.forEach(p => allPlayerIds.add(p.player.id));
-      match.scores.forEach(score => allPlayerIds.add(score.player.id));
-    });
-    
-    // Fetch all unique players
-    const allPlayers = await prisma.player.findMany({
-      where: {
-        id: {
-          in: Array.from(allPlayerIds)
+    const rankings = game.totals.map(({ player, totalPoints, matchesWon, matchesLost }) => ({
+      player,
+      totalPoints,
+      matchesWon,
+      matchesLost
+    }));
+    return NextResponse.json({ rankings, totalMatches: game.matchCount });
+  },
+
+  // End game
+  'PUT /api/games/:gameId/end': async (request, gameId) => {
+    // Ending bumps the version and takes the row lock, so the snapshot written in
+    // the same transaction is exactly the final state
+    const { game, final } = await prisma.$transaction(async (tx) => {
+      const ended = await tx.game.update({
+        where: { id: gameId },
+        data: { 
+          isActive: false, 
+          endedAt: new Date(),
+          version: { increment: 1 }
         }
-      }
+      });
+      const frozen = await freezeGame(tx, gameId);
+      return { game: ended, final: frozen.final };
+    }, { timeout: 30000 });
+    invalidateGameReads(gameId);
+    publishGameEvent(gameId, 'ended', { endedAt: game.endedAt });
+    return NextResponse.json({ success: true, final });
+  },
+
+  // Live updates for everyone viewing a game (Server-Sent Events)
+  'GET /api/games/:gameId/stream': async (request, gameId) => {
+    const game = await prisma.game.findUnique({
+      where: { id: gameId },
+      select: { id: true }
     });
     
-    const totals = {};
+    if (!game) {
+      return NextResponse.json({ error: 'Game not found' }, { status: 404 });
+    }
     
-    // Initialize totals for all players who have ever participated
-    allPlayers.forEach(player => {
-      totals[player.id] = {
-        player: player,
-        totalPoints: 0,
-        matchesWon: 0,
-        matchesLost: 0
-      };
-    });
+    const encoder = new TextEncoder();
+    let cleanup = () => {};
     
-    // Calculate totals from matches
-    game.matches.forEach(match => {
-      match.scores.forEach(score => {
-        if (totals[score.player.id]) {
-          totals[score.player.id].totalPoints += score.score;
-
-          const isOnBidderTeam = score.player.id === match.bidder.id ||
-            match.partners.some(p => p.player.id === score.player.id);
-          const isOnChallengerTeam = !isOnBidderTeam; // all others in the match
-
-          const playerWon = (match.won && isOnBidderTeam) || (!match.won && isOnChallengerTeam);
-          if (playerWon) {
-            totals[score.player.id].matchesWon++;
-          } else {
-            totals[score.player.id].matchesLost++;
+    const stream = new ReadableStream({
+      start(controller) {
+        const send = (frame) => controller.enqueue(encoder.encode(frame));
+        const unsubscribe = subscribeToGame(gameId, send);
+        const heartbeat = setInterval(() => send(': ping\n\n'), STREAM_HEARTBEAT_MS);
+        
+        cleanup = () => {
+          clearInterval(heartbeat);
+          unsubscribe();
+        };
+        request.signal.addEventListener('abort', () => {
+          cleanup();
+          try {
+            controller.close();
+          } catch (e) {
+            // Already closed by the client
           }
-        }
-      });
+        });
+        
+        send('retry: 3000\n\n');
+        send(formatEvent('ready', { gameId }));
+      },
+      cancel() {
+        cleanup();
+      }
     });
     
-    const rankings = Object.values(totals).sort((a, b) => b.totalPoints - a.totalPoints);
-    return NextResponse.json({ rankings, totalMatches: game.matches.length });
-  },
-
-  // End game
-  'PUT /api/games/:gameId/end': async (request, gameId) => {
-    await prisma.game.update({
-      where: { id: gameId },
-      data: { 
-        isActive: false, 
-        endedAt: new Date() 
+    return new Response(stream, {
+      headers: {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache, no-transform',
+        'Connection': 'keep-alive',
+        'X-Accel-Buffering': 'no'
       }
     });
-    return NextResponse.json({ success: true });
   }
 };
 
 // Player management endpoints
 const playerRoutes = {
-  // Get all players
-  'GET /api/players': async () => {
-    const players = await prisma.player.findMany({
-      orderBy: { name: 'asc' },
-      take: 50
+  // Get all players by name (?after=<playerId>&limit=)
+  'GET /api/players': async (request) => {
+    const page = pageParams(new URL(request.url).searchParams, 50, 500);
+    if (!page) {
+      return NextResponse.json({ error: 'limit must be between 1 and 500' }, { status: 400 });
+    }
+    
+    const rows = await prisma.player.findMany({
+      orderBy: [{ name: 'asc' }, { id: 'asc' }],
+      take: page.limit + 1,
+      ...(page.after && { cursor: { id: page.after }, skip: 1 })
     });
-    return NextResponse.json({ players });
+    const { items: players, nextCursor } = pageOf(rows, page.limit, player => player.id);
+    return NextResponse.json({ players, nextCursor });
+  },
+
+  // Club-wide ratings, best first (?limit=)
+  'GET /api/leaderboard': async (request) => {
+    const page = pageParams(new URL(request.url).searchParams, 20, 100);
+    if (!page) {
+      return NextResponse.json({ error: 'limit must be between 1 and 100' }, { status: 400 });
+    }
+    
+    const rows = await prisma.playerRating.findMany({
+      orderBy: [{ rating: 'desc' }, { playerId: 'asc' }],
+      take: page.limit,
+      include: {
+        player: {
+          select: { id: true, name: true, avatar: true }
+        }
+      }
+    });
+    const leaderboard = rows.map(({ player, rating, hands }, index) => ({
+      rank: index + 1,
+      player,
+      rating: Math.round(rating),
+      hands
+    }));
+    return NextResponse.json({ leaderboard });
   },
 
   // Create new player
@@ -371,14 +850,9 @@ const playerRoutes = {
     
     const capitalizedName = capitalizeName(name);
     
-    // Check if player already exists
-    const existingPlayer = await prisma.player.findFirst({
-      where: { 
-        name: {
-          equals: capitalizedName,
-          mode: 'insensitive'
-        }
-      }
+    // Check if player already exists (unique index on the normalized name)
+    const existingPlayer = await prisma.player.findUnique({
+      where: { normalizedName: normalizeName(capitalizedName) }
     });
     
     if (existingPlayer) {
@@ -387,123 +861,121 @@ const playerRoutes = {
     
     const avatarUrl = `https://api.dicebear.com/7.x/adventurer/svg?seed=${encodeURIComponent(capitalizedName)}`;
     
-    const newPlayer = await prisma.player.create({
-      data: {
-        name: capitalizedName,
-        avatar: avatarUrl
+    try {
+      const newPlayer = await prisma.player.create({
+        data: {
+          name: capitalizedName,
+          avatar: avatarUrl
+        }
+      });
+      return NextResponse.json({ player: newPlayer });
+    } catch (error) {
+      // Lost a race with a concurrent create of the same name
+      if (isUniqueViolation(error)) {
+        return NextResponse.json({ error: 'Player with this name already exists' }, { status: 409 });
       }
-    });
+      throw error;
+    }
+  },
+
+  // Typeahead search by name (?q=&limit=)
+  'GET /api/players/search': async (request) => {
+    const { searchParams } = new URL(request.url);
+    const page = pageParams(searchParams, 10, 50);
+    if (!page) {
+      return NextResponse.json({ error: 'limit must be between 1 and 50' }, { status: 400 });
+    }
     
-    return NextResponse.json({ player: newPlayer });
+    const query = normalizeName(searchParams.get('q') || '');
+    const players = query
+      ? await searchByName('players', '"id", "name", "avatar", "dateAdded"', query, page.limit)
+      : [];
+    return NextResponse.json({ players });
   },
 
   // Get player statistics
   'GET /api/players/:playerId/stats': async (request, playerId) => {
     try {
-      // Get all matches where this player participated
-      const matches = await prisma.match.findMany({
-        where: {
-          OR: [
-            { bidderId: playerId },
-            { 
-              partners: {
-                some: { playerId: playerId }
-              }
-            },
-            {
-              scores: {
-                some: { playerId: playerId }
+      // Career totals come from the maintained player_stats summary; only the
+      // handful of recent matches shown in the UI are read from the match tables
+      const [player, summary, topLocation, recentRoleMatches, matches] = await Promise.all([
+        prisma.player.findUnique({
+          where: { id: playerId }
+        }),
+        prisma.playerStat.findUnique({
+          where: { playerId }
+        }),
+        prisma.playerLocationStat.findFirst({
+          where: { playerId },
+          orderBy: { matches: 'desc' }
+        }),
+        // Recent performance (last 5 matches where player was bidder/partner)
+        prisma.match.findMany({
+          where: {
+            OR: [
+              { bidderId: playerId },
+              {
+                partners: {
+                  some: { playerId: playerId }
+                }
               }
-            }
-          ]
-        },
-        include: {
-          bidder: true,
-          partners: {
-            include: {
-              player: true
-            }
+            ]
           },
-          scores: {
-            include: {
-              player: true
+          select: { won: true },
+          orderBy: { timestamp: 'desc' },
+          take: 5
+        }),
+        // Every participant gets a score row, so this covers bidder, partners and the rest
+        prisma.match.findMany({
+          where: {
+            scores: {
+              some: { playerId: playerId }
             }
           },
-          game: {
-            select: {
-              location: true,
-              date: true
+          include: {
+            bidder: true,
+            partners: {
+              include: {
+                player: true
+              }
+            },
+            scores: {
+              where: { playerId: playerId }
+            },
+            game: {
+              select: {
+                location: true,
+                date: true
+              }
             }
-          }
-        },
-        orderBy: { timestamp: 'desc' }
-      });
-
-      // Get player info
-      const player = await prisma.player.findUnique({
-        where: { id: playerId }
-      });
+          },
+          orderBy: { timestamp: 'desc' },
+          take: 10
+        })
+      ]);
 
       if (!player) {
         return NextResponse.json({ error: 'Player not found' }, { status: 404 });
       }
 
-      // Calculate statistics
-      const totalMatches = matches.length;
-      const matchesAsBidder = matches.filter(match => match.bidderId === playerId).length;
-      const matchesAsPartner = matches.filter(match => 
-        match.partners.some(p => p.playerId === playerId)
-      ).length;
-      
-      const wonMatches = matches.filter(match => {
-        const isBidderOrPartner = match.bidderId === playerId || 
-          match.partners.some(p => p.playerId === playerId);
-        return isBidderOrPartner && match.won;
-      }).length;
-      
-      const lostMatches = matches.filter(match => {
-        const isBidderOrPartner = match.bidderId === playerId || 
-          match.partners.some(p => p.playerId === playerId);
-        return isBidderOrPartner && !match.won;
-      }).length;
-
-      const totalPoints = matches.reduce((total, match) => {
-        const playerScore = match.scores.find(score => score.playerId === playerId);
-        return total + (playerScore ? playerScore.score : 0);
-      }, 0);
+      const {
+        totalMatches = 0,
+        matchesAsBidder = 0,
+        matchesAsPartner = 0,
+        wonMatches = 0,
+        lostMatches = 0,
+        totalPoints = 0,
+        highestBid = 0,
+        bids250 = 0,
+        bids250Won = 0
+      } = summary || {};
 
       const averagePoints = totalMatches > 0 ? Math.round(totalPoints / totalMatches) : 0;
 
       // Calculate win rate
       const winRate = totalMatches > 0 ? Math.round((wonMatches / totalMatches) * 100) : 0;
 
-      // Get highest bid
-      const highestBid = Math.max(...matches
-        .filter(match => match.bidderId === playerId)
-        .map(match => match.bidAmount), 0);
-
-      // Get most played location
-      const locationCounts = {};
-      matches.forEach(match => {
-        const location = match.game.location;
-        locationCounts[location] = (locationCounts[location] || 0) + 1;
-      });
-      const mostPlayedLocation = Object.keys(locationCounts).reduce((a, b) => 
-        locationCounts[a] > locationCounts[b] ? a : b, 'N/A'
-      );
-
-      // Get recent performance (last 5 matches where player was bidder/partner)
-      const recentMatches = matches.filter(match => {
-        const isBidderOrPartner = match.bidderId === playerId || 
-          match.partners.some(p => p.playerId === playerId);
-        return isBidderOrPartner;
-      }).slice(0, 5);
-      
-      const recentWins = recentMatches.filter(match => match.won).length;
-
-      // 250 bid attempts and wins (as bidder only)
-      const bids250 = matches.filter(m => m.bidderId === playerId && m.bidAmount === 250).length;
-      const bids250Won = matches.filter(m => m.bidderId === playerId && m.bidAmount === 250 && m.won).length;
+      const recentWins = recentRoleMatches.filter(match => match.won).length;
 
       const stats = {
         player,
@@ -516,15 +988,15 @@ const playerRoutes = {
         averagePoints,
         winRate,
         highestBid,
-        mostPlayedLocation,
+        mostPlayedLocation: topLocation?.location || 'N/A',
         bids250,
         bids250Won,
         recentPerformance: {
-          matches: recentMatches.length,
+          matches: recentRoleMatches.length,
           wins: recentWins,
-          winRate: recentMatches.length > 0 ? Math.round((recentWins / recentMatches.length) * 100) : 0
+          winRate: recentRoleMatches.length > 0 ? Math.round((recentWins / recentRoleMatches.length) * 100) : 0
         },
-        matches: matches.slice(0, 10).map(match => {
+        matches: matches.map(match => {
           const isBidder = match.bidderId === playerId;
           const isPartner = match.partners.some(p => p.playerId === playerId);
           const role = isBidder ? 'BIDDER' : (isPartner ? 'PARTNER' : 'NON_PARTNER');
@@ -536,7 +1008,7 @@ const playerRoutes = {
             bidAmount: match.bidAmount,
             won: match.won,
             role,
-            playerScore: match.scores.find(s => s.playerId === playerId)?.score || 0,
+            playerScore: match.scores[0]?.score || 0,
             location: match.game.location,
             date: match.timestamp
           });
@@ -554,19 +1026,28 @@ const playerRoutes = {
 // Location management endpoints
 const locationRoutes = {
   // Get all locations
-  'GET /api/locations': async () => {
-    const locations = await prisma.location.findMany({
-      orderBy: { name: 'asc' }
+  'GET /api/locations': async (request) => {
+    // Locations are only ever added, so count and newest timestamp identify the list
+    const { _count, _max } = await prisma.location.aggregate({
+      _count: true,
+      _max: { dateAdded: true }
     });
+    const etag = `"locations-${_count}-${_max.dateAdded?.getTime() || 0}"`;
     
-    // Default locations
-    const defaultLocations = ['Farmhouse', 'Rahul\'s Home', 'Tisha\'s Home'];
-    const customLocations = locations.map(loc => loc.name);
-    
-    // Combine and remove duplicates
-    const allLocations = [...new Set([...defaultLocations, ...customLocations])];
-    
-    return NextResponse.json({ locations: allLocations });
+    return cachedJson(request, 'locations', etag, async () => {
+      const locations = await prisma.location.findMany({
+        orderBy: { name: 'asc' }
+      });
+      
+      // Default locations
+      const defaultLocations = ['Farmhouse', 'Rahul\'s Home', 'Tisha\'s Home'];
+      const customLocations = locations.map(loc => loc.name);
+      
+      // Combine and remove duplicates
+      const allLocations = [...new Set([...defaultLocations, ...customLocations])];
+      
+      return { locations: allLocations };
+    });
   },
 
   // Add new location
@@ -577,33 +1058,216 @@ const locationRoutes = {
       return NextResponse.json({ error: 'Location name must be at least 2 characters' }, { status: 400 });
     }
     
-    // Check if location already exists
-    const existingLocation = await prisma.location.findFirst({
-      where: { 
-        name: {
-          equals: name.trim(),
-          mode: 'insensitive'
-        }
-      }
+    // Check if location already exists (unique index on the normalized name)
+    const existingLocation = await prisma.location.findUnique({
+      where: { normalizedName: normalizeName(name) }
     });
     
     if (existingLocation) {
       return NextResponse.json({ error: 'Location already exists' }, { status: 409 });
     }
     
-    const newLocation = await prisma.location.create({
-      data: {
-        name: name.trim()
+    try {
+      const newLocation = await prisma.location.create({
+        data: {
+          name: name.trim()
+        }
+      });
+      responseCache.delete('locations');
+      return NextResponse.json({ location: newLocation });
+    } catch (error) {
+      if (isUniqueViolation(error)) {
+        return NextResponse.json({ error: 'Location already exists' }, { status: 409 });
       }
-    });
+      throw error;
+    }
+  },
+
+  // Typeahead search by name (?q=&limit=)
+  'GET /api/locations/search': async (request) => {
+    const { searchParams } = new URL(request.url);
+    const page = pageParams(searchParams, 10, 50);
+    if (!page) {
+      return NextResponse.json({ error: 'limit must be between 1 and 50' }, { status: 400 });
+    }
     
-    return NextResponse.json({ location: newLocation });
+    const query = normalizeName(searchParams.get('q') || '');
+    const rows = query ? await searchByName('locations', '"name"', query, page.limit) : [];
+    return NextResponse.json({ locations: rows.map(row => row.name) });
   }
 };
 
-export async function GET(request, { params }) {
+// Matches read per page while exporting; memory stays bounded by one page
+const EXPORT_PAGE_MATCHES = 500;
+
+// Matches stored in the last minute are left for the next export. A write transaction
+// can run for up to 30s, so a hand stored earlier than this has committed by now
+// and can't appear behind a cursor already handed out.
+const EXPORT_SETTLE_SECONDS = 60;
+
+// One row per player per hand, the same layout analytics.py reads. recorded_at is
+// when the server stored the hand; with match_id it forms the incremental cursor.
+const EXPORT_COLUMNS = [
+  'game_id', 'location', 'match_id', 'match_number', 'timestamp',
+  'bidder_id', 'bid_amount', 'won', 'player_id', 'is_partner', 'score', 'recorded_at'
+];
+
+// Export cursor: "<recorded_at ISO>,<match_id>" of the last match sent
+const exportCursor = (row) => `${row.recorded_at.toISOString()},${row.match_id}`;
+
+const parseExportCursor = (value) => {
+  const comma = value.indexOf(',');
+  const recordedAt = new Date(value.slice(0, comma));
+  if (comma < 0 || isNaN(recordedAt.getTime()) || comma === value.length - 1) return null;
+  return { recordedAt: recordedAt.toISOString(), id: value.slice(comma + 1) };
+};
+
+// Next page of export rows, in the order the server stored the matches, strictly after
+// the cursor. since optionally limits the export to hands played at or after it.
+const exportPage = (since, after) => prisma.$queryRaw`
+  SELECT m."gameId" AS game_id, g.location, m.id AS match_id, m."matchNumber" AS match_number,
+         m.timestamp, m."bidderId" AS bidder_id, m."bidAmount" AS bid_amount, m.won,
+         s."playerId" AS player_id, (mp."playerId" IS NOT NULL) AS is_partner, s.score,
+         m."recordedAt" AS recorded_at
+  FROM (
+    SELECT id, "gameId", "matchNumber", timestamp, "bidderId", "bidAmount", won, "recordedAt"
+    FROM matches
+    WHERE "recordedAt" < LOCALTIMESTAMP - make_interval(secs => ${EXPORT_SETTLE_SECONDS})
+      ${since ? Prisma.sql`AND timestamp >= ${since}::timestamp` : Prisma.empty}
+      ${after ? Prisma.sql`AND ("recordedAt", id) > (${after.recordedAt}::timestamp, ${after.id})` : Prisma.empty}
+    ORDER BY "recordedAt", id
+    LIMIT ${EXPORT_PAGE_MATCHES}
+  ) m
+  JOIN games g ON g.id = m."gameId"
+  JOIN match_scores s ON s."matchId" = m.id
+  LEFT JOIN match_partners mp ON mp."matchId" = m.id AND mp."playerId" = s."playerId"
+  ORDER BY m."recordedAt", m.id, s."playerId"
+`;
+
+const csvField = (value) => {
+  const text = value instanceof Date ? value.toISOString() : String(value);
+  return /[",\n\r]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const exportFormats = {
+  ndjson: {
+    contentType: 'application/x-ndjson',
+    header: '',
+    line: (row) => JSON.stringify(row) + '\n'
+  },
+  csv: {
+    contentType: 'text/csv; charset=utf-8',
+    header: EXPORT_COLUMNS.join(',') + '\n',
+    line: (row) => EXPORT_COLUMNS.map(column => csvField(row[column])).join(',') + '\n'
+  }
+};
+
+// Bulk data export
+const exportRoutes = {
+  // Stream every hand stored after an optional cursor, or played since an optional timestamp
+  'GET /api/export': async (request) => {
+    const { searchParams } = new URL(request.url);
+    const formatName = searchParams.get('format') || 'ndjson';
+    const format = exportFormats[formatName];
+
+    if (!format) {
+      return NextResponse.json({ error: 'format must be ndjson or csv' }, { status: 400 });
+    }
+
+    const since = searchParams.get('since') ? new Date(searchParams.get('since')) : null;
+    if (since && isNaN(since.getTime())) {
+      return NextResponse.json({ error: 'since must be an ISO timestamp' }, { status: 400 });
+    }
+
+    let after = null;
+    if (searchParams.get('after')) {
+      after = parseExportCursor(searchParams.get('after'));
+      if (!after) {
+        return NextResponse.json({ error: 'after must be a cursor from an earlier export' }, { status: 400 });
+      }
+    }
+
+    const encoder = new TextEncoder();
+
+    // Pages are only read when the client is ready for more, so a slow reader
+    // holds back the queries instead of making the server buffer rows
+    const stream = new ReadableStream({
+      start(controller) {
+        if (format.header) controller.enqueue(encoder.encode(format.header));
+      },
+      async pull(controller) {
+        const rows = await exportPage(since && since.toISOString(), after);
+        if (rows.length === 0) {
+          controller.close();
+          return;
+        }
+        after = parseExportCursor(exportCursor(rows[rows.length - 1]));
+        controller.enqueue(encoder.encode(rows.map(format.line).join('')));
+      }
+    });
+
+    return new Response(stream, {
+      headers: {
+        'Content-Type': format.contentType,
+        'Content-Disposition': `attachment; filename="history.${formatName}"`,
+        'Cache-Control': 'no-store',
+        'X-Accel-Buffering': 'no'
+      }
+    });
+  }
+};
+
+// Operational endpoints
+const systemRoutes = {
+  // Request metrics in Prometheus text format
+  'GET /api/metrics': async () => {
+    return new Response(renderMetrics(), {
+      headers: { 'Content-Type': 'text/plain; version=0.0.4' }
+    });
+  },
+
+  // Readiness: 503 until the database pool is warm, then 200 while the database answers
+  'GET /api/health': async () => {
+    warmDatabase();
+    const status = warmupStatus();
+    const headers = { 'Cache-Control': 'no-store' };
+    if (!status.ready) {
+      return NextResponse.json({ status: 'starting', ...status }, { status: 503, headers });
+    }
+    try {
+      await prisma.$queryRaw`SELECT 1`;
+    } catch (error) {
+      return NextResponse.json({ status: 'unavailable', ...status, error: error.message }, { status: 503, headers });
+    }
+    return NextResponse.json({ status: 'ok', ...status }, { headers });
+  }
+};
+
+// Every route the tables serve, split into segments. Literal templates sort before
+// parameterized ones, so /games/active is not taken for /games/:gameId.
+const ROUTE_TEMPLATES = [gameRoutes, playerRoutes, locationRoutes, exportRoutes, systemRoutes]
+  .flatMap(routes => Object.keys(routes))
+  .map(key => {
+    const [method, path] = key.split(' ');
+    return { key, method, segments: path.split('/').slice(2) };
+  })
+  .sort((a, b) => a.segments.filter(s => s.startsWith(':')).length - b.segments.filter(s => s.startsWith(':')).length);
+
+// Route key used as the metrics label: the route table key the path matches, so every
+// game or player shares one series. Anything else shares a single bucket, which keeps
+// client-chosen paths from adding series.
+const metricsRouteKey = (method, path) => {
+  const segments = path.split('/');
+  const template = ROUTE_TEMPLATES.find(t =>
+    t.method === method &&
+    t.segments.length === segments.length &&
+    t.segments.every((part, i) => part.startsWith(':') ? segments[i] !== '' : part === segments[i])
+  );
+  return template ? template.key : `${method} /api/*`;
+};
+
+const handleGet = async (request, path) => {
   try {
-    const path = params?.path ? params.path.join('/') : '';
     const routeKey = `GET /api/${path}`;
     
     if (gameRoutes[routeKey]) {
@@ -618,14 +1282,25 @@ export async function GET(request, { params }) {
       return await locationRoutes[routeKey](request);
     }
     
+    if (exportRoutes[routeKey]) {
+      return await exportRoutes[routeKey](request);
+    }
+    
+    if (systemRoutes[routeKey]) {
+      return await systemRoutes[routeKey](request);
+    }
+    
     // Handle parameterized routes
     if (path.includes('/')) {
       const segments = path.split('/');
       if (segments[0] === 'games' && segments[1] && segments[2] === 'totals') {
         return await gameRoutes['GET /api/games/:gameId/totals'](request, segments[1]);
       }
-      if (segments[0] === 'games' && segments[1] && segments[2] === 'matches') {
-        return await gameRoutes['POST /api/games/:gameId/matches'](request, segments[1]);
+      if (segments[0] === 'games' && segments[1] && segments[2] === 'stream') {
+        return await gameRoutes['GET /api/games/:gameId/stream'](request, segments[1]);
+      }
+      if (segments[0] === 'games' && segments[1] && segments[2] === 'matches' && !segments[3]) {
+        return await gameRoutes['GET /api/games/:gameId/matches'](request, segments[1]);
       }
       if (segments[0] === 'games' && segments[1] && segments[2] === 'end') {
         return await gameRoutes['PUT /api/games/:gameId/end'](request, segments[1]);
@@ -643,11 +1318,10 @@ export async function GET(request, { params }) {
     console.error('GET Error:', error);
     return NextResponse.json({ error: 'Internal server error' }, { status: 500 });
   }
-}
+};
 
-export async function POST(request, { params }) {
+const handlePost = async (request, path) => {
   try {
-    const path = params?.path ? params.path.join('/') : '';
     const routeKey = `POST /api/${path}`;
     
     if (gameRoutes[routeKey]) {
@@ -665,6 +1339,9 @@ export async function POST(request, { params }) {
     // Handle parameterized routes
     if (path.includes('/')) {
       const segments = path.split('/');
+      if (segments[0] === 'games' && segments[1] && segments[2] === 'matches' && segments[3] === 'batch') {
+        return await gameRoutes['POST /api/games/:gameId/matches/batch'](request, segments[1]);
+      }
       if (segments[0] === 'games' && segments[1] && segments[2] === 'matches') {
         return await gameRoutes['POST /api/games/:gameId/matches'](request, segments[1]);
       }
@@ -675,11 +1352,10 @@ export async function POST(request, { params }) {
     console.error('POST Error:', error);
     return NextResponse.json({ error: 'Internal server error' }, { status: 500 });
   }
-}
+};
 
-export async function PUT(request, { params }) {
+const handlePut = async (request, path) => {
   try {
-    const path = params?.path ? params.path.join('/') : '';
     
     // Handle parameterized routes
     if (path.includes('/')) {
@@ -694,4 +1370,22 @@ export async function PUT(request, { params }) {
     console.error('PUT Error:', error);
     return NextResponse.json({ error: 'Internal server error' }, { status: 500 });
   }
+};
+
+export async function GET(request, { params }) {
+  const path = params?.path ? params.path.join('/') : '';
+  return instrument(metricsRouteKey('GET', path), () => handleGet(request, path));
+}
+
+export async function POST(request, { params }) {
+  const path = params?.path ? params.path.join('/') : '';
+  // Retries carrying the same Idempotency-Key get the first attempt's response
+  return instrument(metricsRouteKey('POST', path), () =>
+    withIdempotency(request, `POST /api/${path}`, () => handlePost(request, path))
+  );
+}
+
+export async function PUT(request, { params }) {
+  const path = params?.path ? params.path.join('/') : '';
+  return instrument(metricsRouteKey('PUT', path), () => handlePut(request, path));
 }
\ No newline at end of file
@@ -4,11 +4,22 @@ Backend API Testing for 250 Card Game
 Tests all API endpoints for Player, Location, Game, and Match management
 """
 
+import argparse
+import asyncio
+import csv
+import random
 import requests
 import json
+import math
+import os
+import statistics
+import subprocess
 import time
 import sys
-from datetime import datetime
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
 # Get base URL from environment - using local URL since external routing has issues
 BASE_URL = "http://localhost:3000/api"
@@ -63,6 +74,51 @@ class CardGameAPITester:
             self.log(f"Request failed: {str(e)}", "ERROR")
             return False, None
     
+    def test_health(self):
+        """The readiness endpoint reports a warm database pool"""
+        self.log("=== TESTING HEALTH ===", "INFO")
+        
+        success, data = self.test_endpoint("GET", "/health")
+        if not success:
+            return False
+        if data.get('status') != 'ok' or not data.get('poolSize'):
+            self.log(f"Unexpected health report: {data}", "ERROR")
+            return False
+        
+        self.log(f"✅ Ready: {data['poolSize']} pooled connections, warmed in {data['warmupMs']}ms")
+        return True
+    
+    def test_database_metrics(self):
+        """A game read shows up in /api/metrics with the database work it did"""
+        self.log("=== TESTING DATABASE METRICS ===", "INFO")
+        
+        if not self.test_game_id:
+            self.log("Need the game management game for metrics testing", "ERROR")
+            return False
+        
+        route = "GET /api/games/:gameId"
+        scraper = MetricsScraper(self.base_url)
+        before = scraper.scrape().get(route, {})
+        success, _ = self.test_endpoint("GET", f"/games/{self.test_game_id}")
+        if not success:
+            return False
+        after = scraper.scrape().get(route, {})
+        
+        operations = after.get("dbOperations", 0) - before.get("dbOperations", 0)
+        if after.get("requests", 0) <= before.get("requests", 0) or operations <= 0:
+            self.log(f"Game read recorded {operations} database operations under {route}", "ERROR")
+            return False
+        
+        text = self.session.get(f"{self.base_url}/metrics").text
+        statements = next((float(line.split()[-1]) for line in text.splitlines()
+                           if line.startswith("prisma_sql_statements_total ")), 0)
+        if statements <= 0:
+            self.log("prisma_sql_statements_total is still 0", "ERROR")
+            return False
+        
+        self.log(f"✅ Game read counted {operations:.0f} database operations, {statements:.0f} SQL statements so far")
+        return True
+    
     def test_player_management(self):
         """Test Player Management endpoints"""
         self.log("=== TESTING PLAYER MANAGEMENT ===", "INFO")
@@ -481,17 +537,346 @@ class CardGameAPITester:
         self.log("✅ Bid validation test completed")
         return True
     
+    def test_concurrent_match_numbering(self):
+        """Fire simultaneous match posts at one game and check numbering is dense and unique"""
+        self.log("=== TESTING CONCURRENT MATCH NUMBERING ===", "INFO")
+        
+        if len(self.test_players) < 4:
+            self.log("Need at least 4 players for concurrency testing", "ERROR")
+            return False
+        
+        table = self.test_players[:4]
+        success, data = self.test_endpoint("POST", "/games", {"location": "Farmhouse", "players": table})
+        if not success:
+            return False
+        game_id = data['game']['id']
+        
+        concurrent_posts = 20
+        match_data = {
+            "bidder": table[0],
+            "partners": table[1:2],
+            "bidAmount": 150,
+            "won": True,
+            "currentPlayers": table
+        }
+        
+        def post_match(_):
+            # requests.Session is not thread-safe, so each post uses its own connection
+            response = requests.post(f"{self.base_url}/games/{game_id}/matches", json=match_data)
+            return response.status_code
+        
+        with ThreadPoolExecutor(max_workers=concurrent_posts) as pool:
+            statuses = list(pool.map(post_match, range(concurrent_posts)))
+        
+        failures = [status for status in statuses if status != 200]
+        if failures:
+            self.log(f"{len(failures)} of {concurrent_posts} concurrent posts failed: {failures}", "ERROR")
+            return False
+        
+        success, data = self.test_endpoint("GET", f"/games/{game_id}")
+        if not success:
+            return False
+        
+        numbers = sorted(match['matchNumber'] for match in data['game']['matches'])
+        if numbers != list(range(1, concurrent_posts + 1)):
+            self.log(f"Match numbers are not dense and unique: {numbers}", "ERROR")
+            return False
+        
+        self.log(f"✅ {concurrent_posts} concurrent posts numbered 1..{concurrent_posts} without gaps or duplicates")
+        return True
+    
+    def test_search(self):
+        """Typeahead search and duplicate detection on normalized names"""
+        self.log("=== TESTING NAME SEARCH ===", "INFO")
+        
+        if not self.test_players:
+            self.log("No test players available", "ERROR")
+            return False
+        target = self.test_players[0]
+        
+        # Differently cased and spaced spellings are still duplicates
+        mangled = "  " + "   ".join(target['name'].upper().split()) + " "
+        success, _ = self.test_endpoint("POST", "/players", {"name": mangled}, expected_status=409)
+        if not success:
+            return False
+        
+        for query in (target['name'][:2].lower(), target['name'].split()[-1].upper()):
+            success, data = self.test_endpoint("GET", f"/players/search?q={requests.utils.quote(query)}")
+            if not success:
+                return False
+            if target['id'] not in [player['id'] for player in data['players']]:
+                self.log(f"Search for '{query}' did not find {target['name']}", "ERROR")
+                return False
+        
+        success, data = self.test_endpoint("GET", "/locations/search?q=farm")
+        if not success:
+            return False
+        if "Farmhouse" not in data['locations']:
+            self.log("Location search did not find Farmhouse", "ERROR")
+            return False
+        
+        self.log("✅ Name search and normalized duplicate checks passed")
+        return True
+    
+    def test_pagination(self):
+        """Walk the player list and a game's matches page by page, and check the summary view"""
+        self.log("=== TESTING PAGINATION ===", "INFO")
+        
+        seen = []
+        after = None
+        while True:
+            success, data = self.test_endpoint("GET", f"/players?limit=2{f'&after={after}' if after else ''}")
+            if not success:
+                return False
+            seen.extend(player['id'] for player in data['players'])
+            after = data.get('nextCursor')
+            if not after:
+                break
+        if len(seen) != len(set(seen)) or not {p['id'] for p in self.test_players} <= set(seen):
+            self.log("Player pages overlap or miss players", "ERROR")
+            return False
+        
+        success, _ = self.test_endpoint("GET", "/players?limit=0", expected_status=400)
+        if not success:
+            return False
+        
+        success, data = self.test_endpoint("GET", "/games?limit=1&fields=summary")
+        if not success or not data['games']:
+            return False
+        game_id = data['games'][0]['id']
+        
+        numbers = []
+        after = None
+        while True:
+            success, data = self.test_endpoint(
+                "GET", f"/games/{game_id}/matches?limit=7&fields=summary{f'&after={after}' if after else ''}")
+            if not success:
+                return False
+            for match in data['matches']:
+                if 'bidder' in match or not isinstance(match.get('partnerIds'), list):
+                    self.log("Summary matches should reference players by id", "ERROR")
+                    return False
+                numbers.append(match['matchNumber'])
+            after = data.get('nextCursor')
+            if not after:
+                break
+        if numbers != list(range(1, len(numbers) + 1)):
+            self.log(f"Match pages are not contiguous: {numbers}", "ERROR")
+            return False
+        
+        success, full = self.test_endpoint("GET", f"/games/{game_id}")
+        success_summary, summary = self.test_endpoint("GET", f"/games/{game_id}?fields=summary")
+        if not (success and success_summary):
+            return False
+        full_size, summary_size = len(json.dumps(full)), len(json.dumps(summary))
+        self.log(f"✅ Paged {len(seen)} players and {len(numbers)} matches; "
+                 f"summary game payload {summary_size} bytes vs {full_size} full")
+        return True
+    
+    def test_ended_game_snapshot(self):
+        """End a game and check later reads are served from its frozen snapshot"""
+        self.log("=== TESTING ENDED GAME SNAPSHOT ===", "INFO")
+        
+        if len(self.test_players) < 4:
+            self.log("Need at least 4 players for snapshot testing", "ERROR")
+            return False
+        
+        table = self.test_players[:4]
+        success, data = self.test_endpoint("POST", "/games", {"location": "Farmhouse", "players": table})
+        if not success:
+            return False
+        game_id = data['game']['id']
+        
+        for bid_amount, won in [(250, True), (180, False), (250, False)]:
+            match_data = {
+                "bidder": table[0],
+                "partners": table[1:2],
+                "bidAmount": bid_amount,
+                "won": won,
+                "currentPlayers": table
+            }
+            success, _ = self.test_endpoint("POST", f"/games/{game_id}/matches", match_data)
+            if not success:
+                return False
+        
+        success, ended = self.test_endpoint("PUT", f"/games/{game_id}/end")
+        if not success:
+            return False
+        stats = ended['final']['stats']
+        if (ended['final']['totalMatches'], stats['bids250'], stats['bids250Won'], stats['highestBid']) != (3, 2, 1, 250):
+            self.log(f"Unexpected final stats: {ended['final']}", "ERROR")
+            return False
+        
+        response = self.session.get(f"{self.base_url}/games/{game_id}")
+        if response.status_code != 200 or response.headers.get('Content-Encoding') != 'gzip':
+            self.log(f"Ended game not served from its gzipped snapshot: {response.status_code} "
+                     f"{response.headers.get('Content-Encoding')}", "ERROR")
+            return False
+        frozen = response.json()
+        if frozen['final'] != ended['final'] or [m['matchNumber'] for m in frozen['game']['matches']] != [1, 2, 3]:
+            self.log("Snapshot does not match the game as it ended", "ERROR")
+            return False
+        
+        plain = self.session.get(f"{self.base_url}/games/{game_id}?fields=summary",
+                                 headers={"Accept-Encoding": "identity"})
+        if plain.status_code != 200 or plain.json()['final'] != ended['final']:
+            self.log("Summary snapshot without gzip did not match", "ERROR")
+            return False
+        
+        revalidated = self.session.get(f"{self.base_url}/games/{game_id}",
+                                       headers={"If-None-Match": response.headers['ETag']})
+        if revalidated.status_code != 304:
+            self.log(f"Expected 304 for an unchanged ended game, got {revalidated.status_code}", "ERROR")
+            return False
+        
+        self.log(f"✅ Ended game frozen: {len(response.content)} gzipped bytes, "
+                 f"least scorer {stats['leastScorer']['name']}")
+        return True
+    
+    def test_idempotent_retry(self):
+        """A retried match post with the same Idempotency-Key is answered from the first attempt"""
+        self.log("=== TESTING IDEMPOTENT RETRY ===", "INFO")
+        
+        if not self.test_game_id or len(self.test_players) < 4:
+            self.log("Need the match management game for idempotency testing", "ERROR")
+            return False
+        
+        table = self.test_players[:4]
+        match_data = {
+            "bidder": table[1],
+            "partners": table[2:3],
+            "bidAmount": 175,
+            "won": True,
+            "currentPlayers": table
+        }
+        url = f"{self.base_url}/games/{self.test_game_id}/matches"
+        headers = {"Idempotency-Key": str(uuid.uuid4())}
+        first = self.session.post(url, json=match_data, headers=headers)
+        retry = self.session.post(url, json=match_data, headers=headers)
+        if first.status_code != 200 or retry.status_code != 200:
+            self.log(f"Unexpected statuses {first.status_code}, {retry.status_code}", "ERROR")
+            return False
+        if retry.json() != first.json() or retry.headers.get("Idempotent-Replayed") != "true":
+            self.log("Retry was not answered with the original match", "ERROR")
+            return False
+        
+        changed = self.session.post(url, json={**match_data, "bidAmount": 180}, headers=headers)
+        if changed.status_code != 422:
+            self.log(f"Reusing a key for a different hand should fail with 422, got {changed.status_code}", "ERROR")
+            return False
+        
+        self.log(f"✅ Retry returned match #{first.json()['match']['matchNumber']} without recording it again")
+        return True
+    
+    def test_offline_batch_sync(self):
+        """An offline client's queued hands sync as one batch and come back with their client ids"""
+        self.log("=== TESTING OFFLINE BATCH SYNC ===", "INFO")
+        
+        if not self.test_game_id or len(self.test_players) < 4:
+            self.log("Need the match management game for batch sync testing", "ERROR")
+            return False
+        
+        table = self.test_players[:4]
+        hands = [{
+            "clientId": str(uuid.uuid4()),
+            "bidder": table[i % 4],
+            "partners": [table[(i + 1) % 4]],
+            "bidAmount": 140 + 10 * i,
+            "won": i % 2 == 0,
+            "currentPlayers": table,
+            "timestamp": (datetime.now(timezone.utc) - timedelta(minutes=5 - i)).isoformat()
+        } for i in range(3)]
+        url = f"{self.base_url}/games/{self.test_game_id}/matches/batch"
+        headers = {"Idempotency-Key": str(uuid.uuid4())}
+        response = self.session.post(url, json={"hands": hands}, headers=headers)
+        if response.status_code != 200:
+            self.log(f"Batch sync failed with {response.status_code}", "ERROR")
+            return False
+        data = response.json()
+        
+        if [m.get('clientId') for m in data['matches']] != [h['clientId'] for h in hands]:
+            self.log("Synced matches don't echo the hands' client ids in order", "ERROR")
+            return False
+        numbers = [m['matchNumber'] for m in data['matches']]
+        if numbers != list(range(data['totalMatches'] - 2, data['totalMatches'] + 1)):
+            self.log(f"Server match numbers {numbers} don't end at totalMatches {data['totalMatches']}", "ERROR")
+            return False
+        if {t['playerId'] for t in data['totals']} != {p['id'] for p in table}:
+            self.log("Batch response is missing the table's running totals", "ERROR")
+            return False
+        
+        retry = self.session.post(url, json={"hands": hands}, headers=headers)
+        if retry.json() != data or retry.headers.get("Idempotent-Replayed") != "true":
+            self.log("Retried batch was recorded again instead of replayed", "ERROR")
+            return False
+        
+        # A bad hand rejects the whole batch up front, naming the hand, and records nothing
+        bad_hands = [
+            {"timestamp": "yesterday"},
+            {"partners": [table[0]]},
+            {"currentPlayers": table + [table[1]]},
+        ]
+        for bad in bad_hands:
+            batch = [{k: v for k, v in hands[0].items() if k != "clientId"}, {**hands[1], **bad}]
+            response = self.session.post(url, json={"hands": batch})
+            if response.status_code != 400 or not response.json().get('error', '').startswith("Hand 2:"):
+                self.log(f"Batch with a bad hand ({bad}) returned {response.status_code}, not a 400 naming hand 2", "ERROR")
+                return False
+        success, totals = self.test_endpoint("GET", f"/games/{self.test_game_id}/totals")
+        if not success or totals['totalMatches'] != data['totalMatches']:
+            self.log("A rejected batch still recorded hands", "ERROR")
+            return False
+        
+        self.log(f"✅ Three queued hands saved as matches #{numbers[0]}-#{numbers[-1]}")
+        return True
+    
+    def test_leaderboard(self):
+        """Check the leaderboard is sorted and moved by the hands played in these tests"""
+        self.log("=== TESTING LEADERBOARD ===", "INFO")
+        
+        success, data = self.test_endpoint("GET", "/leaderboard?limit=100")
+        if not success:
+            return False
+        board = data['leaderboard']
+        ratings = [entry['rating'] for entry in board]
+        if ratings != sorted(ratings, reverse=True) or [e['rank'] for e in board] != list(range(1, len(board) + 1)):
+            self.log("Leaderboard is not in rating order", "ERROR")
+            return False
+        
+        rated = {entry['player']['id']: entry for entry in board}
+        if not any(player['id'] in rated and rated[player['id']]['rating'] != 1500 for player in self.test_players):
+            self.log("No test player's rating moved after the test hands", "ERROR")
+            return False
+        
+        success, _ = self.test_endpoint("GET", "/leaderboard?limit=101", expected_status=400)
+        if not success:
+            return False
+        
+        top = board[0] if board else None
+        self.log(f"✅ Leaderboard of {len(board)} players"
+                 + (f", led by {top['player']['name']} at {top['rating']}" if top else ""))
+        return True
+    
     def run_all_tests(self):
         """Run all API tests"""
         self.log("🚀 Starting 250 Card Game Backend API Tests", "INFO")
         self.log(f"Base URL: {self.base_url}", "INFO")
         
         tests = [
+            ("Health", self.test_health),
             ("Player Management", self.test_player_management),
             ("Location Management", self.test_location_management),
             ("Game Management", self.test_game_management),
             ("Match Management", self.test_match_management),
-            ("Bid Validation", self.test_bid_validation)
+            ("Database Metrics", self.test_database_metrics),
+            ("Bid Validation", self.test_bid_validation),
+            ("Concurrent Match Numbering", self.test_concurrent_match_numbering),
+            ("Name Search", self.test_search),
+            ("Pagination", self.test_pagination),
+            ("Ended Game Snapshot", self.test_ended_game_snapshot),
+            ("Leaderboard", self.test_leaderboard),
+            ("Idempotent Retry", self.test_idempotent_retry),
+            ("Offline Batch Sync", self.test_offline_batch_sync)
         ]
         
         passed = 0
@@ -523,7 +908,890 @@ class CardGameAPITester:
             self.log(f"💥 {failed} TEST(S) FAILED!", "ERROR")
             return False
 
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LoadTester:
+    """Simulates many live tables hitting the API concurrently on asyncio"""
+
+    def __init__(self, base_url=BASE_URL, tables=10, players_per_table=6, rate=20.0,
+                 duration=60.0, output="load_report.json"):
+        self.base_url = base_url
+        self.tables = tables
+        self.players_per_table = players_per_table
+        self.rate = rate  # hands per second across all tables
+        self.duration = duration
+        self.output = output
+        self.run_id = uuid.uuid4().hex[:6]
+        self.samples = {}  # route key -> list of (latency_ms, ok)
+
+    def log(self, message, level="INFO"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {level}: {message}")
+
+    async def request(self, session, method, route_key, endpoint, data=None):
+        """Issue one request and record its latency under the route key"""
+        started = time.perf_counter()
+        ok = False
+        body = None
+        try:
+            async with session.request(method, f"{self.base_url}{endpoint}", json=data) as response:
+                body = await response.json(content_type=None)
+                ok = response.status < 400
+        except Exception as e:
+            self.log(f"{route_key} failed: {e}", "ERROR")
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.samples.setdefault(route_key, []).append((latency_ms, ok))
+        return ok, body
+
+    async def setup_table(self, session, table):
+        """Create this table's players and game, returns (game_id, players)"""
+        players = []
+        for seat in range(self.players_per_table):
+            name = f"Load {self.run_id} T{table} P{seat}"
+            ok, data = await self.request(session, "POST", "POST /api/players", "/players", {"name": name})
+            if not ok:
+                return None, []
+            players.append(data['player'])
+
+        ok, data = await self.request(session, "POST", "POST /api/games", "/games",
+                                      {"location": "Farmhouse", "players": players})
+        if not ok:
+            return None, []
+        return data['game']['id'], players
+
+    def random_hand(self, players):
+        """Random hand following the partner count rules of POST /api/games"""
+        partner_count = 2 if len(players) <= 5 else 3
+        bidder = random.choice(players)
+        others = [p for p in players if p['id'] != bidder['id']]
+        partners = random.sample(others, partner_count - 1)
+        return {
+            "bidder": bidder,
+            "partners": partners,
+            "bidAmount": random.randrange(130, 255, 5),
+            "won": random.random() < 0.5,
+        }
+
+    async def run_table(self, session, table, deadline):
+        game_id, players = await self.setup_table(session, table)
+        if not game_id:
+            self.log(f"Table {table} setup failed, skipping", "ERROR")
+            return
+
+        # Each table gets an equal share of the target rate; schedule against the
+        # clock so slow responses show up as latency rather than a lower rate
+        interval = self.tables / self.rate
+        next_at = time.perf_counter() + random.uniform(0, interval)
+        while True:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if time.perf_counter() >= deadline:
+                break
+            await self.request(session, "POST", "POST /api/games/:gameId/matches",
+                               f"/games/{game_id}/matches", self.random_hand(players))
+            await self.request(session, "GET", "GET /api/games/:gameId/totals",
+                               f"/games/{game_id}/totals")
+            next_at += interval
+
+    def report(self, elapsed):
+        routes = {}
+        for route_key, samples in sorted(self.samples.items()):
+            latencies = sorted(latency for latency, _ in samples)
+            errors = sum(1 for _, ok in samples if not ok)
+            routes[route_key] = {
+                "requests": len(samples),
+                "throughputPerSec": round(len(samples) / elapsed, 2) if elapsed else 0,
+                "errorRate": round(errors / len(samples), 4),
+                "latencyMs": {
+                    "p50": round(percentile(latencies, 50), 2),
+                    "p95": round(percentile(latencies, 95), 2),
+                    "p99": round(percentile(latencies, 99), 2),
+                    "max": round(latencies[-1], 2),
+                },
+            }
+        return {
+            "baseUrl": self.base_url,
+            "tables": self.tables,
+            "playersPerTable": self.players_per_table,
+            "targetHandsPerSec": self.rate,
+            "durationSec": round(elapsed, 2),
+            "routes": routes,
+        }
+
+    async def run_async(self):
+        import aiohttp  # only needed for load mode
+
+        self.log(f"🔥 Starting load run {self.run_id}: {self.tables} tables, "
+                 f"{self.rate} hands/s for {self.duration}s")
+        connector = aiohttp.TCPConnector(limit=self.tables * 2)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            started = time.perf_counter()
+            deadline = started + self.duration
+            await asyncio.gather(*(self.run_table(session, t, deadline) for t in range(self.tables)))
+            elapsed = time.perf_counter() - started
+        return self.report(elapsed)
+
+    def run(self):
+        report = asyncio.run(self.run_async())
+        with open(self.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+        for route_key, stats in report["routes"].items():
+            latency = stats["latencyMs"]
+            self.log(f"{route_key}: {stats['requests']} req, {stats['throughputPerSec']}/s, "
+                     f"p50={latency['p50']}ms p95={latency['p95']}ms p99={latency['p99']}ms, "
+                     f"errors={stats['errorRate'] * 100:.2f}%")
+        self.log(f"📄 Load report written to {self.output}")
+        return all(stats["errorRate"] == 0 for stats in report["routes"].values())
+
+
+class HandReplayer:
+    """Replays recorded hands through POST /api/games/:gameId/matches/batch
+
+    The input is JSON Lines, one hand per line, with players referenced by name:
+        {"bidder": "Alice", "partners": ["Bob"], "bidAmount": 150, "won": true}
+    An optional "timestamp" is kept as the match time. A line of the form
+    {"players": [...], "location": "..."} sets the table roster and venue;
+    otherwise the roster is every name that appears in the hands.
+    """
+
+    def __init__(self, base_url=BASE_URL, batch_size=50, location="Farmhouse"):
+        self.base_url = base_url
+        self.batch_size = batch_size
+        self.location = location
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        })
+
+    def log(self, message, level="INFO"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {level}: {message}")
+
+    def load(self, path):
+        roster = []
+        hands = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if "players" in record:
+                    roster = record["players"]
+                    self.location = record.get("location", self.location)
+                elif "bidder" in record:
+                    hands.append(record)
+        if not roster:
+            for hand in hands:
+                for name in [hand["bidder"], *hand.get("partners", [])]:
+                    if name not in roster:
+                        roster.append(name)
+        return roster, hands
+
+    @staticmethod
+    def normalized(name):
+        """The server's duplicate check: trimmed, single-spaced, case-insensitive"""
+        return " ".join(name.split()).lower()
+
+    def known_players(self):
+        """Every player, keyed by normalized name, walking all pages of GET /players"""
+        known = {}
+        after = None
+        while True:
+            params = {"limit": 500, **({"after": after} if after else {})}
+            response = self.session.get(f"{self.base_url}/players", params=params)
+            response.raise_for_status()
+            data = response.json()
+            known.update((self.normalized(p['name']), p) for p in data['players'])
+            after = data.get('nextCursor')
+            if not after:
+                return known
+
+    def find_player(self, name):
+        response = self.session.get(f"{self.base_url}/players/search", params={"q": name, "limit": 50})
+        response.raise_for_status()
+        return next((p for p in response.json()['players']
+                     if self.normalized(p['name']) == self.normalized(name)), None)
+
+    def resolve_players(self, names):
+        """Map each name to a player record, creating players that don't exist yet"""
+        known = self.known_players()
+
+        players = {}
+        for name in names:
+            player = known.get(self.normalized(name))
+            if not player:
+                response = self.session.post(f"{self.base_url}/players", json={"name": name})
+                # 409: created since the list was read (or by another client); use that player
+                player = self.find_player(name) if response.status_code == 409 else None
+                if not player:
+                    response.raise_for_status()
+                    player = response.json()['player']
+            players[name] = player
+        return players
+
+    def run(self, path):
+        roster, hands = self.load(path)
+        if not hands:
+            self.log(f"No hands found in {path}", "ERROR")
+            return False
+
+        players = self.resolve_players(roster)
+        table = [players[name] for name in roster]
+        response = self.session.post(f"{self.base_url}/games", json={"location": self.location, "players": table})
+        response.raise_for_status()
+        game_id = response.json()['game']['id']
+        self.log(f"🎬 Replaying {len(hands)} hands for {len(table)} players into game {game_id}")
+
+        payload = [{
+            "bidder": players[hand["bidder"]],
+            "partners": [players[name] for name in hand.get("partners", [])],
+            "bidAmount": hand["bidAmount"],
+            "won": hand["won"],
+            "currentPlayers": table,
+            **({"timestamp": hand["timestamp"]} if "timestamp" in hand else {}),
+        } for hand in hands]
+
+        started = time.perf_counter()
+        for offset in range(0, len(payload), self.batch_size):
+            batch = payload[offset:offset + self.batch_size]
+            response = self.session.post(f"{self.base_url}/games/{game_id}/matches/batch", json={"hands": batch})
+            if response.status_code != 200:
+                self.log(f"Batch at hand {offset} failed: {response.status_code} {response.text}", "ERROR")
+                return False
+        elapsed = time.perf_counter() - started
+
+        self.log(f"✅ Replayed {len(payload)} hands in {elapsed:.2f}s "
+                 f"({len(payload) / elapsed:.1f} hands/s, batch size {self.batch_size})")
+        return True
+
+
+class StreamLatencyProbe:
+    """Subscribes to GET /api/games/:gameId/stream and measures write-to-event delay
+
+    Hands are posted one at a time; each is matched to its 'matches' event by
+    match number, and the delay is taken from the moment the POST was sent.
+    """
+
+    def __init__(self, base_url=BASE_URL, hands=50, players_per_table=4):
+        self.base_url = base_url
+        self.hands = hands
+        self.players_per_table = players_per_table
+        self.run_id = uuid.uuid4().hex[:6]
+        self.session = requests.Session()
+        self.received = {}  # matchNumber -> perf_counter() when the event arrived
+        self.ready = threading.Event()
+
+    def log(self, message, level="INFO"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {level}: {message}")
+
+    def subscribe(self, game_id, stop):
+        """Read the SSE stream on a background thread until stop is set"""
+        with requests.get(f"{self.base_url}/games/{game_id}/stream", stream=True, timeout=(5, 60)) as response:
+            event_type = None
+            for line in response.iter_lines(decode_unicode=True):
+                arrived = time.perf_counter()
+                if stop.is_set():
+                    break
+                if line.startswith("event:"):
+                    event_type = line[len("event:"):].strip()
+                elif line.startswith("data:") and event_type == "ready":
+                    self.ready.set()
+                elif line.startswith("data:") and event_type == "matches":
+                    payload = json.loads(line[len("data:"):])
+                    for match in payload["matches"]:
+                        self.received[match["matchNumber"]] = arrived
+                elif not line:
+                    event_type = None
+
+    def run(self):
+        players = []
+        for seat in range(self.players_per_table):
+            response = self.session.post(f"{self.base_url}/players", json={"name": f"Stream {self.run_id} P{seat}"})
+            response.raise_for_status()
+            players.append(response.json()['player'])
+        response = self.session.post(f"{self.base_url}/games", json={"location": "Farmhouse", "players": players})
+        response.raise_for_status()
+        game_id = response.json()['game']['id']
+
+        stop = threading.Event()
+        subscriber = threading.Thread(target=self.subscribe, args=(game_id, stop), daemon=True)
+        subscriber.start()
+        if not self.ready.wait(timeout=10):
+            self.log("Stream did not become ready", "ERROR")
+            return False
+
+        sent = {}
+        for match_number in range(1, self.hands + 1):
+            hand = {
+                "bidder": players[0],
+                "partners": players[1:2],
+                "bidAmount": 150,
+                "won": match_number % 2 == 0,
+                "currentPlayers": players,
+            }
+            sent[match_number] = time.perf_counter()
+            response = self.session.post(f"{self.base_url}/games/{game_id}/matches", json=hand)
+            response.raise_for_status()
+
+        # Give the last events a moment to arrive
+        deadline = time.perf_counter() + 5
+        while len(self.received) < self.hands and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        stop.set()
+
+        delays = sorted((self.received[n] - sent[n]) * 1000 for n in sent if n in self.received)
+        missing = self.hands - len(delays)
+        if not delays:
+            self.log("No events received", "ERROR")
+            return False
+
+        self.log(f"📡 Write-to-event delay over {len(delays)} hands: p50={percentile(delays, 50):.1f}ms "
+                 f"p95={percentile(delays, 95):.1f}ms p99={percentile(delays, 99):.1f}ms max={delays[-1]:.1f}ms")
+        if missing:
+            self.log(f"{missing} hands never produced an event", "ERROR")
+            return False
+        return True
+
+
+class FaultInjector:
+    """Posts hands through a deliberately flaky client and checks none are recorded twice
+
+    Every hand gets one Idempotency-Key and is sent with one injected fault: a
+    timeout far shorter than the write (so the response is lost after the hand
+    may have been stored), a lost response followed by a resend, or a burst of
+    concurrent duplicates. Each is retried until it succeeds. The game must then
+    hold exactly one match per hand. A control game sends the lost-response
+    fault without keys, to show the duplicates the keys prevent.
+    """
+
+    FAULTS = ["timeout", "lost", "burst"]
+    MAX_ATTEMPTS = 8
+
+    def __init__(self, base_url=BASE_URL, hands=30, players_per_table=4, seed=None):
+        self.base_url = base_url
+        self.hands = hands
+        self.players_per_table = players_per_table
+        self.random = random.Random(seed)
+        self.run_id = uuid.uuid4().hex[:6]
+        self.sent = 0
+        self.replayed = 0
+
+    def log(self, message, level="INFO"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {level}: {message}")
+
+    def setup_game(self, label):
+        players = []
+        for seat in range(self.players_per_table):
+            response = requests.post(f"{self.base_url}/players", json={"name": f"Faults {self.run_id} {label}{seat}"})
+            response.raise_for_status()
+            players.append(response.json()['player'])
+        response = requests.post(f"{self.base_url}/games", json={"location": "Farmhouse", "players": players})
+        response.raise_for_status()
+        return response.json()['game']['id'], players
+
+    def post(self, url, hand, key, timeout=10):
+        """One attempt; returns the response, or None when it timed out or failed"""
+        self.sent += 1
+        headers = {"Idempotency-Key": key} if key else {}
+        try:
+            response = requests.post(url, json=hand, headers=headers, timeout=timeout)
+        except requests.exceptions.RequestException:
+            return None
+        if response.headers.get("Idempotent-Replayed") == "true":
+            self.replayed += 1
+        return response
+
+    def deliver(self, url, hand, key, fault):
+        """Send one hand with its fault injected, then retry until it is acknowledged"""
+        if fault == "timeout":
+            self.post(url, hand, key, timeout=self.random.uniform(0.001, 0.02))
+        elif fault == "lost":
+            self.post(url, hand, key)
+        elif fault == "burst":
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                list(pool.map(lambda _: self.post(url, hand, key), range(3)))
+
+        for attempt in range(self.MAX_ATTEMPTS):
+            response = self.post(url, hand, key)
+            if response is not None and response.status_code == 200:
+                return response.json()['match']
+            time.sleep(0.1 * 2 ** attempt)
+        raise RuntimeError(f"hand was never acknowledged after {self.MAX_ATTEMPTS} retries")
+
+    def recorded(self, game_id):
+        response = requests.get(f"{self.base_url}/games/{game_id}?fields=summary")
+        response.raise_for_status()
+        return sorted(match['matchNumber'] for match in response.json()['game']['matches'])
+
+    def random_hand(self, players):
+        return {
+            "bidder": players[0],
+            "partners": players[1:2],
+            "bidAmount": self.random.randrange(130, 255, 5),
+            "won": self.random.random() < 0.5,
+            "currentPlayers": players,
+        }
+
+    def run(self):
+        game_id, players = self.setup_game("K")
+        url = f"{self.base_url}/games/{game_id}/matches"
+        faults = {fault: 0 for fault in self.FAULTS}
+        acknowledged = []
+        for _ in range(self.hands):
+            fault = self.random.choice(self.FAULTS)
+            faults[fault] += 1
+            acknowledged.append(self.deliver(url, self.random_hand(players), str(uuid.uuid4()), fault)['matchNumber'])
+
+        numbers = self.recorded(game_id)
+        self.log(f"💥 {self.hands} hands, {self.sent} requests ({', '.join(f'{n} {f}' for f, n in faults.items())}), "
+                 f"{self.replayed} answered from the idempotency store")
+        ok = numbers == list(range(1, self.hands + 1)) and sorted(acknowledged) == numbers
+        if ok:
+            self.log(f"✅ Every hand recorded exactly once: {len(numbers)} matches")
+        else:
+            self.log(f"❌ Expected matches 1..{self.hands}, found {len(numbers)}: {numbers}", "ERROR")
+
+        control_hands = min(10, self.hands)
+        control_id, control_players = self.setup_game("C")
+        control_url = f"{self.base_url}/games/{control_id}/matches"
+        for _ in range(control_hands):
+            self.deliver(control_url, self.random_hand(control_players), None, "lost")
+        self.log(f"Control without keys: {control_hands} hands recorded as {len(self.recorded(control_id))} matches")
+        return ok
+
+
+class ColdStartProbe:
+    """Restarts the app container and times how long it takes to serve again
+
+    Each run stops the container, then starts it and polls until three points:
+    the first HTTP response of any status (the server is listening), the first
+    200 from /api/health (the database pool is warm), and the first 200 from a
+    real read. All are measured from the moment `docker start` is issued, so they
+    include migrations and engine startup. The latency of that first read shows
+    whether the warm-up left anything for real traffic to pay for.
+    """
+
+    POLL_INTERVAL = 0.05
+    TIMEOUT = 180
+
+    def __init__(self, base_url=BASE_URL, container="cardgame-app", runs=3):
+        self.base_url = base_url
+        self.container = container
+        self.runs = runs
+
+    def log(self, message, level="INFO"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {level}: {message}")
+
+    def docker(self, *command):
+        subprocess.run(["docker", *command, self.container], check=True, capture_output=True)
+
+    def get(self, path):
+        """(status, seconds), with status None while nothing answers"""
+        started = time.perf_counter()
+        try:
+            response = requests.get(f"{self.base_url}{path}", timeout=5)
+        except requests.exceptions.RequestException:
+            return None, time.perf_counter() - started
+        return response.status_code, time.perf_counter() - started
+
+    def measure(self):
+        self.docker("stop")
+        started = time.perf_counter()
+        self.docker("start")
+        marks = {}
+        while "firstRequest" not in marks or "ready" not in marks:
+            elapsed = time.perf_counter() - started
+            if elapsed > self.TIMEOUT:
+                raise RuntimeError(f"{self.container} did not serve within {self.TIMEOUT}s ({marks})")
+            if "ready" not in marks:
+                status, _ = self.get("/health")
+                if status is not None:
+                    marks.setdefault("listening", time.perf_counter() - started)
+                if status == 200:
+                    marks["ready"] = time.perf_counter() - started
+            if "firstRequest" not in marks:
+                status, latency = self.get("/games?fields=summary&limit=1")
+                if status is not None:
+                    marks.setdefault("listening", time.perf_counter() - started)
+                if status == 200:
+                    marks["firstRequest"] = time.perf_counter() - started
+                    marks["firstRequestLatency"] = latency
+            time.sleep(self.POLL_INTERVAL)
+        return marks
+
+    def run(self):
+        samples = []
+        for run in range(self.runs):
+            marks = self.measure()
+            samples.append(marks)
+            self.log(f"Run {run + 1}: listening {marks['listening']:.2f}s, ready {marks['ready']:.2f}s, "
+                     f"first request {marks['firstRequest']:.2f}s ({marks['firstRequestLatency'] * 1000:.0f}ms)")
+
+        median = {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+        self.log(f"🧊 Cold start of {self.container}, median of {self.runs}: listening {median['listening']:.2f}s, "
+                 f"ready {median['ready']:.2f}s, first successful request {median['firstRequest']:.2f}s "
+                 f"taking {median['firstRequestLatency'] * 1000:.0f}ms")
+        return True
+
+
+class ExportDownloader:
+    """Streams GET /api/export to a file chunk by chunk, never holding the whole export
+
+    Reports rows, size and throughput, plus the cursor of the last hand stored so
+    the next run can pass it as --after for an incremental export.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, base_url=BASE_URL, fmt="ndjson", since=None, after=None):
+        self.base_url = base_url
+        self.fmt = fmt
+        self.since = since
+        self.after = after
+
+    def log(self, message, level="INFO"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {level}: {message}")
+
+    def cursor(self, line):
+        """"<recorded_at>,<match_id>" of an export row, the server's incremental cursor"""
+        if self.fmt == "ndjson":
+            row = json.loads(line)
+            return f"{row['recorded_at']},{row['match_id']}"
+        row = next(csv.reader([line.decode()]))
+        return f"{row[-1]},{row[2]}"
+
+    def run(self, path):
+        params = {"format": self.fmt}
+        if self.since:
+            params["since"] = self.since
+        if self.after:
+            params["after"] = self.after
+
+        started = time.perf_counter()
+        size = rows = 0
+        pending = last_line = b""
+        with requests.get(f"{self.base_url}/export", params=params, stream=True, timeout=(5, 300)) as response:
+            if response.status_code != 200:
+                self.log(f"Export failed: {response.status_code} {response.text[:200]}", "ERROR")
+                return False
+            with open(path, "wb") as out:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    out.write(chunk)
+                    size += len(chunk)
+                    lines = (pending + chunk).split(b"\n")
+                    pending = lines.pop()
+                    rows += len(lines)
+                    if lines:
+                        last_line = lines[-1]
+        elapsed = time.perf_counter() - started
+
+        if self.fmt == "csv":
+            rows -= 1  # header
+        self.log(f"📦 Exported {rows} rows ({size / 1e6:.1f} MB) to {path} in {elapsed:.1f}s "
+                 f"({rows / elapsed:.0f} rows/s)")
+        if rows > 0:
+            self.log(f"Next incremental export: --after {self.cursor(last_line)}")
+        return True
+
+
+class ScalingBenchmark:
+    """Times the read endpoints against seeded histories of growing size
+
+    Each size is seeded with query_plan_benchmark.seed_dataset straight into the
+    database the API server uses, so --database-url must point at that (local)
+    database. Start the server with RESPONSE_CACHE_SIZE=0 so repeated reads reach
+    the database instead of the response cache.
+
+    For every route the median latency at each size is fitted to latency ~ size^k
+    on a log-log scale; k near 0 means the route does not slow down as history
+    grows, k near 1 means it is linear in the number of matches. Results are
+    compared with a stored baseline: a route regresses when its median at any size
+    grows by more than the threshold (plus NOISE_MS), or its exponent by more than
+    EXPONENT_SLACK.
+    """
+
+    NOISE_MS = 2.0
+    EXPONENT_SLACK = 0.25
+    SAMPLE_IDS = 10  # distinct games/players each route is timed against
+
+    # route key -> path, given one seeded game id and player id
+    ROUTES = [
+        ("GET /api/games", lambda game, player: "/games?fields=summary"),
+        ("GET /api/games/active", lambda game, player: "/games/active?fields=summary"),
+        ("GET /api/games/:gameId", lambda game, player: f"/games/{game}"),
+        ("GET /api/games/:gameId/totals", lambda game, player: f"/games/{game}/totals"),
+        ("GET /api/games/:gameId/matches", lambda game, player: f"/games/{game}/matches?limit=100"),
+        ("GET /api/players", lambda game, player: "/players?limit=50"),
+        ("GET /api/players/:playerId/stats", lambda game, player: f"/players/{player}/stats"),
+        ("GET /api/leaderboard", lambda game, player: "/leaderboard"),
+    ]
+
+    def __init__(self, base_url=BASE_URL, database_url=None, sizes=(10, 1000, 100000, 1000000),
+                 rounds=5, threshold=0.25, baseline="bench_baseline.json", update_baseline=False):
+        self.base_url = base_url
+        self.database_url = database_url
+        self.sizes = sorted(sizes)
+        self.rounds = rounds
+        self.threshold = threshold
+        self.baseline = baseline
+        self.update_baseline = update_baseline
+        self.session = requests.Session()
+
+    def log(self, message, level="INFO"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {level}: {message}")
+
+    def sample_ids(self, conn):
+        """The busiest seeded games and players, so every size times comparable rows"""
+        games = [row[0] for row in conn.execute(
+            """SELECT id FROM games WHERE id LIKE 'bench-g%%' ORDER BY "matchCount" DESC, id LIMIT %s""",
+            (self.SAMPLE_IDS,))]
+        players = [row[0] for row in conn.execute(
+            """SELECT "playerId" FROM player_stats WHERE "playerId" LIKE 'bench-p%%'
+               ORDER BY "totalMatches" DESC, "playerId" LIMIT %s""", (self.SAMPLE_IDS,))]
+        return games, players
+
+    def time_route(self, paths):
+        """Median and p95 latency in ms over `rounds` passes through the paths, after one
+        untimed pass (which also writes the snapshots of ended games)"""
+        latencies = []
+        for timed in [False] + [True] * self.rounds:
+            for path in paths:
+                started = time.perf_counter()
+                response = self.session.get(f"{self.base_url}{path}")
+                elapsed = (time.perf_counter() - started) * 1000
+                if response.status_code != 200:
+                    raise RuntimeError(f"GET {path} returned {response.status_code}: {response.text[:200]}")
+                if timed:
+                    latencies.append(elapsed)
+        latencies.sort()
+        return {"medianMs": round(percentile(latencies, 50), 3), "p95Ms": round(percentile(latencies, 95), 3)}
+
+    @staticmethod
+    def growth_exponent(points):
+        """Least-squares slope of log(latency) against log(size)"""
+        if len(points) < 2:
+            return 0.0
+        xs = [math.log(size) for size, _ in points]
+        ys = [math.log(max(latency, 1e-3)) for _, latency in points]
+        mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+        spread = sum((x - mean_x) ** 2 for x in xs)
+        return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread if spread else 0.0
+
+    @staticmethod
+    def growth_label(exponent):
+        if exponent < 0.15:
+            return "flat"
+        if exponent < 0.75:
+            return "sublinear"
+        return "linear" if exponent < 1.25 else "superlinear"
+
+    def measure(self):
+        from query_plan_benchmark import connect, seed_dataset  # only needed in benchmark mode
+
+        routes = {route: {"sizes": {}} for route, _ in self.ROUTES}
+        with connect(self.database_url) as conn:
+            for size in self.sizes:
+                seeded = seed_dataset(conn, size, hands_per_game=min(40, size))
+                games, players = self.sample_ids(conn)
+                for route, path_for in self.ROUTES:
+                    pairs = [(games[i % len(games)], players[i % len(players)])
+                             for i in range(max(len(games), len(players)))]
+                    paths = list(dict.fromkeys(path_for(game, player) for game, player in pairs))
+                    stats = self.time_route(paths)
+                    routes[route]["sizes"][str(seeded)] = stats
+                    self.log(f"{route} @ {seeded} matches: median {stats['medianMs']}ms, p95 {stats['p95Ms']}ms")
+
+        for route, result in routes.items():
+            points = [(int(size), stats["medianMs"]) for size, stats in result["sizes"].items()]
+            result["exponent"] = round(self.growth_exponent(points), 3)
+            result["growth"] = self.growth_label(result["exponent"])
+        return {"baseUrl": self.base_url, "rounds": self.rounds, "routes": routes}
+
+    def regressions(self, results, baseline):
+        found = []
+        for route, current in results["routes"].items():
+            before = baseline["routes"].get(route)
+            if not before:
+                continue
+            for size, stats in current["sizes"].items():
+                old = before["sizes"].get(size)
+                if old and stats["medianMs"] > old["medianMs"] * (1 + self.threshold) + self.NOISE_MS:
+                    found.append(f"{route} @ {size} matches: median {old['medianMs']}ms -> {stats['medianMs']}ms")
+            if current["exponent"] > before["exponent"] + self.EXPONENT_SLACK:
+                found.append(f"{route}: growth {before['growth']} (k={before['exponent']}) -> "
+                             f"{current['growth']} (k={current['exponent']})")
+        return found
+
+    def run(self):
+        if not self.database_url:
+            self.log("The benchmark seeds the API's database: pass --database-url or set DATABASE_URL", "ERROR")
+            return False
+        self.log(f"⏱️  Benchmarking {len(self.ROUTES)} routes at {', '.join(map(str, self.sizes))} matches "
+                 f"(server should run with RESPONSE_CACHE_SIZE=0)")
+        results = self.measure()
+
+        for route, result in results["routes"].items():
+            self.log(f"{route:<36} k={result['exponent']:>6} ({result['growth']})")
+
+        if self.update_baseline or not os.path.exists(self.baseline):
+            with open(self.baseline, "w") as f:
+                json.dump(results, f, indent=2)
+            self.log(f"📄 Baseline written to {self.baseline}")
+            return True
+
+        with open(self.baseline) as f:
+            baseline = json.load(f)
+        found = self.regressions(results, baseline)
+        for regression in found:
+            self.log(f"❌ Regression: {regression}", "ERROR")
+        if not found:
+            self.log(f"✅ No route regressed beyond {self.threshold:.0%} of {self.baseline}")
+        return not found
+
+
+class MetricsScraper:
+    """Scrapes GET /api/metrics (Prometheus text) and reports per-route deltas between two scrapes"""
+
+    def __init__(self, base_url=BASE_URL):
+        self.base_url = base_url
+
+    def log(self, message, level="INFO"):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(f"[{timestamp}] {level}: {message}")
+
+    def scrape(self):
+        """route -> {requests, errors, seconds, dbOperations, dbSeconds}"""
+        response = requests.get(f"{self.base_url}/metrics")
+        response.raise_for_status()
+
+        routes = {}
+        for line in response.text.splitlines():
+            if not line or line.startswith("#"):
+                continue
+            series, value = line.rsplit(" ", 1)
+            if "{" not in series:
+                continue
+            name, raw_labels = series.split("{", 1)
+            labels = dict(part.split("=", 1) for part in raw_labels.rstrip("}").split('",') if "=" in part)
+            labels = {k: v.strip('"') for k, v in labels.items()}
+            route = labels.get("route")
+            if route is None:
+                continue
+            entry = routes.setdefault(route, {"requests": 0, "errors": 0, "seconds": 0.0,
+                                              "dbOperations": 0, "dbSeconds": 0.0})
+            value = float(value)
+            if name == "http_request_duration_seconds_count":
+                entry["requests"] = value
+            elif name == "http_request_duration_seconds_sum":
+                entry["seconds"] = value
+            elif name == "http_requests_total" and int(labels.get("status", "0")) >= 400:
+                entry["errors"] += value
+            elif name == "prisma_operations_total":
+                entry["dbOperations"] = value
+            elif name == "prisma_operation_seconds_total":
+                entry["dbSeconds"] = value
+        return routes
+
+    def report(self, before, after):
+        self.log("📈 Per-route breakdown for this run:")
+        self.log(f"{'route':<45} {'reqs':>6} {'errs':>5} {'avg ms':>8} {'db ops/req':>10} {'db ms/req':>9}")
+        for route, end in sorted(after.items()):
+            start = before.get(route, {})
+            requests_made = end["requests"] - start.get("requests", 0)
+            if requests_made <= 0:
+                continue
+            errors = end["errors"] - start.get("errors", 0)
+            avg_ms = (end["seconds"] - start.get("seconds", 0)) / requests_made * 1000
+            ops = (end["dbOperations"] - start.get("dbOperations", 0)) / requests_made
+            db_ms = (end["dbSeconds"] - start.get("dbSeconds", 0)) / requests_made * 1000
+            self.log(f"{route:<45} {int(requests_made):>6} {int(errors):>5} {avg_ms:>8.1f} {ops:>10.1f} {db_ms:>9.1f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Backend API tests for the 250 Card Game")
+    parser.add_argument("--base-url", default=BASE_URL, help="API base URL")
+    parser.add_argument("--load", action="store_true", help="run the concurrent load generator instead of the tests")
+    parser.add_argument("--tables", type=int, default=10, help="simulated tables in load mode")
+    parser.add_argument("--players", type=int, default=6, help="players per simulated table")
+    parser.add_argument("--rate", type=float, default=20.0, help="target hands per second across all tables")
+    parser.add_argument("--duration", type=float, default=60.0, help="load run length in seconds")
+    parser.add_argument("--output", default="load_report.json", help="where to write the load report")
+    parser.add_argument("--replay", metavar="FILE", help="replay recorded hands (JSON Lines) through the batch endpoint")
+    parser.add_argument("--batch-size", type=int, default=50, help="hands per batch request when replaying")
+    parser.add_argument("--location", default="Farmhouse", help="location for the replayed game")
+    parser.add_argument("--metrics", action="store_true",
+                        help="scrape /api/metrics before and after the run and print a per-route breakdown")
+    parser.add_argument("--stream-latency", type=int, metavar="HANDS",
+                        help="post this many hands while subscribed to the live stream and report write-to-event delay")
+    parser.add_argument("--faults", type=int, metavar="HANDS",
+                        help="post this many hands through a client with injected timeouts, lost responses and "
+                             "duplicate sends, and check each is recorded once")
+    parser.add_argument("--seed", type=int, help="random seed for --faults")
+    parser.add_argument("--cold-start", metavar="CONTAINER",
+                        help="restart this Docker container and time how long until it serves requests again")
+    parser.add_argument("--cold-runs", type=int, default=3, help="restarts to take the --cold-start median over")
+    parser.add_argument("--export", metavar="FILE", help="stream GET /api/export to FILE")
+    parser.add_argument("--export-format", choices=["ndjson", "csv"],
+                        help="export format (defaults to the FILE extension, else ndjson)")
+    parser.add_argument("--since", help="only export hands played at or after this ISO timestamp")
+    parser.add_argument("--after", metavar="CURSOR",
+                        help="only export hands stored after this cursor, as printed by the previous --export")
+    parser.add_argument("--bench", action="store_true",
+                        help="time the read endpoints at growing history sizes and compare with a stored baseline")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"),
+                        help="database the API server uses, seeded by --bench (defaults to DATABASE_URL)")
+    parser.add_argument("--sizes", default="10,1000,100000,1000000", help="comma-separated history sizes for --bench")
+    parser.add_argument("--rounds", type=int, default=5, help="timed passes per route and size")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown against the baseline before a route counts as regressed")
+    parser.add_argument("--baseline", default="bench_baseline.json", help="stored benchmark baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with this run")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    tester = CardGameAPITester()
-    success = tester.run_all_tests()
+    args = parse_args()
+    if args.metrics:
+        scraper = MetricsScraper(args.base_url)
+        metrics_before = scraper.scrape()
+    if args.bench:
+        success = ScalingBenchmark(args.base_url, args.database_url, [int(n) for n in args.sizes.split(",")],
+                                   args.rounds, args.threshold, args.baseline, args.update_baseline).run()
+    elif args.export:
+        fmt = args.export_format or ("csv" if args.export.endswith(".csv") else "ndjson")
+        success = ExportDownloader(args.base_url, fmt, args.since, args.after).run(args.export)
+    elif args.cold_start:
+        success = ColdStartProbe(args.base_url, args.cold_start, args.cold_runs).run()
+    elif args.faults:
+        success = FaultInjector(args.base_url, args.faults, seed=args.seed).run()
+    elif args.stream_latency:
+        success = StreamLatencyProbe(args.base_url, args.stream_latency).run()
+    elif args.replay:
+        success = HandReplayer(args.base_url, args.batch_size, args.location).run(args.replay)
+    elif args.load:
+        success = LoadTester(args.base_url, args.tables, args.players, args.rate,
+                             args.duration, args.output).run()
+    else:
+        tester = CardGameAPITester()
+        tester.base_url = args.base_url
+        success = tester.run_all_tests()
+    if args.metrics:
+        scraper.report(metrics_before, scraper.scrape())
     sys.exit(0 if success else 1)
\ No newline at end of file
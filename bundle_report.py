@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Bundle size and time-to-interactive report for the 250 Card Game app
+Reads the manifests of a production build (`npm run build`) and reports each page's
+first-load JavaScript and the lazily loaded chunks (screens, confetti, report export),
+raw and gzipped, against a first-load budget. With --url it also loads the app in
+headless Chromium with a throttled CPU and estimates time to interactive.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+from datetime import datetime
+
+# Collects long tasks from the very start of the page load
+LONG_TASK_OBSERVER = """
+window.__longTasks = [];
+new PerformanceObserver((list) => {
+  list.getEntries().forEach((entry) => window.__longTasks.push([entry.startTime, entry.duration]));
+}).observe({ type: 'longtask', buffered: true });
+"""
+
+# Time to interactive as Lighthouse approximates it: first contentful paint, or the
+# end of the last long task before the page went quiet, whichever is later
+COLLECT_TIMINGS = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const paint = performance.getEntriesByName('first-contentful-paint')[0];
+  const fcp = paint ? paint.startTime : nav.domContentLoadedEventEnd;
+  const lastLongTask = Math.max(0, ...window.__longTasks.map(([start, duration]) => start + duration));
+  const scripts = performance.getEntriesByType('resource').filter(r => r.name.split('?')[0].endsWith('.js'));
+  return {
+    fcp,
+    domContentLoaded: nav.domContentLoadedEventEnd,
+    tti: Math.max(fcp, nav.domContentLoadedEventEnd, lastLongTask),
+    longTasks: window.__longTasks.length,
+    jsRequests: scripts.length,
+    jsTransferred: scripts.reduce((sum, r) => sum + r.transferSize, 0)
+  };
+}
+"""
+
+
+def log(message, level="INFO"):
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {level}: {message}")
+
+
+def kb(size):
+    return round(size / 1024, 1)
+
+
+class BundleReport:
+    """Sizes the JavaScript a production build sends for each page"""
+
+    def __init__(self, build_dir):
+        self.build_dir = build_dir
+        self.sizes = {}
+
+    def manifest(self, name, required=True):
+        path = os.path.join(self.build_dir, name)
+        if not os.path.exists(path):
+            if required:
+                raise SystemExit(f"{path} not found; run `npm run build` first")
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def size(self, file):
+        """(raw, gzipped) bytes of a built file, relative to the build directory"""
+        if file not in self.sizes:
+            with open(os.path.join(self.build_dir, file), "rb") as f:
+                data = f.read()
+            self.sizes[file] = (len(data), len(gzip.compress(data, 9)))
+        return self.sizes[file]
+
+    def total(self, files):
+        sizes = [self.size(file) for file in files]
+        return {
+            "files": len(sizes),
+            "rawKb": kb(sum(raw for raw, _ in sizes)),
+            "gzipKb": kb(sum(packed for _, packed in sizes)),
+        }
+
+    def first_load(self):
+        """Each app page's first-load JS: the runtime and framework, the root layout and the page"""
+        build = self.manifest("build-manifest.json")
+        app = self.manifest("app-build-manifest.json")["pages"]
+        shared = list(build.get("rootMainFiles", [])) + app.get("/layout", [])
+        pages = {}
+        for page, files in sorted(app.items()):
+            if not page.endswith("/page"):
+                continue  # layouts, route handlers
+            chunks = list(dict.fromkeys(f for f in shared + files if f.endswith(".js")))
+            pages[page] = chunks
+        return pages
+
+    def lazy_chunks(self, first_load):
+        """Chunks behind next/dynamic and import(), minus anything the page already loaded"""
+        loaded = set().union(*first_load.values()) if first_load else set()
+        chunks = {}
+        for key, entry in self.manifest("react-loadable-manifest.json", required=False).items():
+            label = key.split(" -> ")[-1]
+            files = [f if f.startswith("static/") else f"static/{f.split('static/', 1)[-1]}"
+                     for f in entry.get("files", []) if f.endswith(".js")]
+            files = [f for f in files if f not in loaded]
+            if files:
+                chunks[label] = files
+        return chunks
+
+    def run(self):
+        first_load = self.first_load()
+        lazy = self.lazy_chunks(first_load)
+        return {
+            "pages": {page: self.total(files) for page, files in first_load.items()},
+            "lazy": {label: self.total(files) for label, files in sorted(lazy.items())},
+        }
+
+
+def measure_tti(url, runs, cpu_slowdown, quiet_ms):
+    """Median load timings over cold-cache runs in headless Chromium"""
+    from playwright.sync_api import sync_playwright  # only needed with --url
+
+    samples = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        for run in range(runs):
+            context = browser.new_context(viewport={"width": 390, "height": 844})
+            page = context.new_page()
+            if cpu_slowdown > 1:
+                cdp = context.new_cdp_session(page)
+                cdp.send("Emulation.setCPUThrottlingRate", {"rate": cpu_slowdown})
+            page.add_init_script(LONG_TASK_OBSERVER)
+            page.goto(url, wait_until="networkidle")
+            page.wait_for_timeout(quiet_ms)
+            sample = page.evaluate(COLLECT_TIMINGS)
+            samples.append(sample)
+            log(f"Run {run + 1}: TTI {sample['tti']:.0f}ms, FCP {sample['fcp']:.0f}ms, "
+                f"{sample['longTasks']} long tasks, {kb(sample['jsTransferred'])} KB JS")
+            context.close()
+        browser.close()
+
+    return {
+        "url": url,
+        "runs": runs,
+        "cpuSlowdown": cpu_slowdown,
+        **{key: round(statistics.median(s[key] for s in samples), 1)
+           for key in ("tti", "fcp", "domContentLoaded", "longTasks", "jsRequests")},
+        "jsTransferredKb": kb(statistics.median(s["jsTransferred"] for s in samples)),
+    }
+
+
+def print_report(report, budget_kb, previous):
+    def delta(section, name, value):
+        before = previous.get(section, {}).get(name, {}).get("gzipKb")
+        return "" if before is None else f" ({value - before:+.1f})"
+
+    print(f"\n{'First load':<40} {'files':>5} {'raw KB':>9} {'gzip KB':>9}")
+    for page, size in report["pages"].items():
+        flag = "  OVER BUDGET" if size["gzipKb"] > budget_kb else ""
+        print(f"{page:<40} {size['files']:>5} {size['rawKb']:>9} {size['gzipKb']:>9}"
+              f"{delta('pages', page, size['gzipKb'])}{flag}")
+    print(f"{'budget':<40} {'':>5} {'':>9} {budget_kb:>9}")
+
+    if report["lazy"]:
+        print(f"\n{'Loaded on demand':<60} {'raw KB':>9} {'gzip KB':>9}")
+        for label, size in report["lazy"].items():
+            print(f"{label[-60:]:<60} {size['rawKb']:>9} {size['gzipKb']:>9}{delta('lazy', label, size['gzipKb'])}")
+
+    tti = report.get("tti")
+    if tti:
+        print(f"\nTime to interactive ({tti['cpuSlowdown']}x CPU slowdown, median of {tti['runs']}): "
+              f"{tti['tti']:.0f}ms (FCP {tti['fcp']:.0f}ms, {tti['jsTransferredKb']} KB JS "
+              f"in {tti['jsRequests']:.0f} requests)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bundle size and time-to-interactive report")
+    parser.add_argument("--build-dir", default=".next", help="Next.js build output (default .next)")
+    parser.add_argument("--budget-kb", type=float, default=130,
+                        help="largest allowed first-load JS per page, gzipped KB (default 130)")
+    parser.add_argument("--url", help="also measure time to interactive at this URL (requires playwright)")
+    parser.add_argument("--runs", type=int, default=5, help="page loads for the TTI median (default 5)")
+    parser.add_argument("--cpu-slowdown", type=float, default=4, help="CPU throttling for TTI runs (default 4x, a mid-range phone)")
+    parser.add_argument("--quiet-ms", type=int, default=5000, help="how long the page must stay quiet before TTI is read")
+    parser.add_argument("--tti-budget-ms", type=float, help="fail when the median TTI is above this")
+    parser.add_argument("--compare", metavar="REPORT", help="earlier JSON report to show size changes against")
+    parser.add_argument("--output", default="bundle_report.json", help="where to write the JSON report")
+    args = parser.parse_args()
+
+    report = BundleReport(args.build_dir).run()
+    report = {"generatedAt": datetime.now().isoformat(), "budgetKb": args.budget_kb, **report}
+    if args.url:
+        report["tti"] = measure_tti(args.url, args.runs, args.cpu_slowdown, args.quiet_ms)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+    print_report(report, args.budget_kb, previous)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    log(f"Report written to {args.output}")
+
+    over = [page for page, size in report["pages"].items() if size["gzipKb"] > args.budget_kb]
+    if over:
+        log(f"First-load JS over the {args.budget_kb} KB budget: {', '.join(over)}", "ERROR")
+    slow = args.tti_budget_ms is not None and report.get("tti", {}).get("tti", 0) > args.tti_budget_ms
+    if slow:
+        log(f"Time to interactive {report['tti']['tti']:.0f}ms is over the {args.tti_budget_ms:.0f}ms budget", "ERROR")
+    return 1 if over or slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+'use client';
+
+import { useState, useEffect, useRef, useMemo, createContext, useContext } from 'react';
+import { Card, CardContent } from '@/components/ui/card';
+import { isLocalId, queuedHands, syncOutbox } from '@/lib/outbox';
+import { calculateScores, tallyTotals } from '@/lib/scoring';
+
+// Game Context for state management
+const GameContext = createContext();
+
+// Subscribe to a game's live update stream (Server-Sent Events)
+const useGameStream = (gameId, onEvent) => {
+  const handlerRef = useRef(onEvent);
+  handlerRef.current = onEvent;
+
+  useEffect(() => {
+    if (!gameId || typeof EventSource === 'undefined') return;
+
+    const source = new EventSource(`/api/games/${gameId}/stream`);
+    ['matches', 'ended'].forEach(type => {
+      source.addEventListener(type, (event) => handlerRef.current(type, JSON.parse(event.data)));
+    });
+
+    // EventSource reconnects on its own; events sent while it was down are lost, so resync
+    let connectedBefore = false;
+    source.addEventListener('ready', () => {
+      if (connectedBefore) handlerRef.current('reconnect', null);
+      connectedBefore = true;
+    });
+    return () => source.close();
+  }, [gameId]);
+};
+
+// Rebuild a full match (bidder/partners/scores with players) from a stream delta
+const hydrateMatch = (delta, playersById) => {
+  const playerFor = (id) => playersById.get(id) || { id, name: 'Unknown' };
+  return {
+    ...delta,
+    bidder: playerFor(delta.bidderId),
+    partners: delta.partnerIds.map(playerId => ({ playerId, player: playerFor(playerId) })),
+    scores: delta.scores.map(score => ({ ...score, player: playerFor(score.playerId) }))
+  };
+};
+
+// A hand waiting in the outbox, shown as a match until the server saves it. Scores
+// follow the server's rules; the match number is provisional until the server assigns one.
+export const pendingMatch = ({ key, payload }, matchNumber) => {
+  const { bidder, partners, bidAmount, won, currentPlayers, timestamp } = payload;
+  const playersById = new Map([bidder, ...partners, ...currentPlayers].map(p => [p.id, p]));
+  const scores = calculateScores({ bidder, partners, bidAmount, won, players: currentPlayers });
+  return {
+    id: `pending-${key}`,
+    clientId: key,
+    pending: true,
+    matchNumber,
+    bidderId: bidder.id,
+    bidder,
+    bidAmount,
+    won,
+    timestamp,
+    partners: partners.map(player => ({ playerId: player.id, player })),
+    scores: scores.map(score => ({ ...score, player: playersById.get(score.playerId) }))
+  };
+};
+
+export const nextMatchNumber = (matches = []) =>
+  matches.reduce((last, match) => Math.max(last, match.matchNumber), 0) + 1;
+
+// Server standings plus the hands still waiting to sync
+const withPendingHands = (standings, matches = []) => {
+  const pending = matches.filter(match => match.pending);
+  if (pending.length === 0) return standings;
+
+  const tally = new Map();
+  const players = new Map();
+  pending.forEach(match => {
+    tallyTotals({
+      bidderId: match.bidderId,
+      partnerIds: match.partners.map(p => p.playerId),
+      won: match.won,
+      scores: match.scores
+    }, tally);
+    match.scores.forEach(score => players.set(score.playerId, score.player));
+  });
+
+  const byPlayer = new Map(standings.rankings.map(entry => [entry.player.id, entry]));
+  tally.forEach((added, playerId) => {
+    const entry = byPlayer.get(playerId) || { player: players.get(playerId), totalPoints: 0, matchesWon: 0, matchesLost: 0 };
+    byPlayer.set(playerId, {
+      ...entry,
+      totalPoints: entry.totalPoints + added.totalPoints,
+      matchesWon: entry.matchesWon + added.matchesWon,
+      matchesLost: entry.matchesLost + added.matchesLost
+    });
+  });
+  const rankings = Array.from(byPlayer.values()).sort((a, b) => b.totalPoints - a.totalPoints);
+  return { ...standings, rankings, totalMatches: standings.totalMatches + pending.length };
+};
+
+// Appends matches not already present, keeping match number order. A saved match
+// that echoes a pending match's clientId replaces it.
+export const mergeMatches = (existing = [], incoming) => {
+  const known = new Set(existing.map(m => m.id));
+  const added = incoming.filter(m => !known.has(m.id));
+  const saved = new Set(incoming.map(m => m.clientId).filter(Boolean));
+  const kept = existing.filter(m => !(m.pending && saved.has(m.clientId)));
+  if (added.length === 0 && kept.length === existing.length) return existing;
+  return [...kept, ...added].sort((a, b) => a.matchNumber - b.matchNumber);
+};
+
+export const GameProvider = ({ children }) => {
+  const [currentScreen, setCurrentScreen] = useState('setup');
+  const [gameData, setGameData] = useState(null);
+  const [locations, setLocations] = useState([]);
+  const [selectedPlayers, setSelectedPlayers] = useState([]);
+  const [selectedLocation, setSelectedLocation] = useState('');
+  const [loading, setLoading] = useState(false);
+  const [standings, setStandings] = useState({ rankings: [], totalMatches: 0, loaded: false });
+  // Set when a game created offline is saved; its standings are already current
+  const savedGameId = useRef(null);
+
+  // Load standings once per game; after that they are kept current from the live stream.
+  // A game that only exists locally so far starts everyone at zero.
+  useEffect(() => {
+    if (!gameData?.id || gameData.id === savedGameId.current) return;
+    if (isLocalId(gameData.id)) {
+      const rankings = selectedPlayers.map(player => ({ player, totalPoints: 0, matchesWon: 0, matchesLost: 0 }));
+      setStandings({ rankings, totalMatches: 0, loaded: true });
+    } else {
+      fetchStandings(gameData.id);
+    }
+  }, [gameData?.id]);
+
+  const fetchStandings = async (gameId) => {
+    try {
+      const response = await fetch(`/api/games/${gameId}/totals`);
+      if (response.ok) {
+        const data = await response.json();
+        setStandings({ rankings: data.rankings || [], totalMatches: data.totalMatches || 0, loaded: true });
+      } else {
+        console.error('Failed to fetch totals');
+        setStandings(prev => ({ ...prev, loaded: true }));
+      }
+    } catch (error) {
+      console.error('Error fetching totals:', error);
+      setStandings(prev => ({ ...prev, loaded: true }));
+    }
+  };
+
+  // Keeps hands that are still waiting to sync when the game is replaced by a fresh copy
+  const keepPending = (game) => setGameData(prev => ({
+    ...game,
+    matches: mergeMatches(game.matches, (prev?.matches || []).filter(m => m.pending))
+  }));
+
+  // Applies a matches payload (live stream event or batch sync response)
+  const applyMatches = (data) => {
+    const playersById = new Map(selectedPlayers.map(p => [p.id, p]));
+    standings.rankings.forEach(entry => playersById.set(entry.player.id, entry.player));
+
+    // A player we have never seen means the roster changed elsewhere; reload instead of guessing
+    if (data.totals.some(t => !playersById.has(t.playerId))) {
+      fetchStandings(gameData.id);
+    } else {
+      setStandings(prev => {
+        const byPlayer = new Map(prev.rankings.map(entry => [entry.player.id, entry]));
+        data.totals.forEach(({ playerId, totalPoints, matchesWon, matchesLost }) => {
+          byPlayer.set(playerId, { player: playersById.get(playerId), totalPoints, matchesWon, matchesLost });
+        });
+        const rankings = Array.from(byPlayer.values()).sort((a, b) => b.totalPoints - a.totalPoints);
+        return { rankings, totalMatches: Math.max(prev.totalMatches, data.totalMatches), loaded: true };
+      });
+    }
+
+    const matches = data.matches.map(delta => hydrateMatch(delta, playersById));
+    setGameData(prev => prev && { ...prev, matches: mergeMatches(prev.matches, matches) });
+  };
+
+  useGameStream(isLocalId(gameData?.id) ? null : gameData?.id, (type, data) => {
+    if (type === 'reconnect') {
+      fetchStandings(gameData.id);
+      fetch(`/api/games/${gameData.id}`)
+        .then(response => response.ok ? response.json() : null)
+        .then(data => data?.game && keepPending(data.game))
+        .catch(error => console.error('Error resyncing game:', error));
+      return;
+    }
+
+    if (type === 'ended') {
+      setGameData(prev => prev && { ...prev, isActive: false, endedAt: data.endedAt });
+      return;
+    }
+
+    applyMatches(data);
+  });
+
+  // Background sync of the outbox. Handlers are read through a ref so a sync that
+  // started several renders ago still applies results to the current game.
+  const currentGameId = useRef(null);
+  currentGameId.current = gameData?.id;
+  const syncHandlers = useRef();
+  syncHandlers.current = {
+    onGameCreated: (localId, game) => {
+      if (currentGameId.current !== localId) return;
+      currentGameId.current = game.id;
+      savedGameId.current = game.id;
+      setGameData(prev => prev && prev.id === localId ? { ...prev, ...game, matches: prev.matches } : prev);
+    },
+    onMatchesSynced: (gameId, data) => {
+      if (currentGameId.current === gameId) applyMatches(data);
+    },
+    onGameEnded: (gameId) => {
+      if (currentGameId.current !== gameId) return;
+      setGameData(prev => prev && { ...prev, isActive: false });
+    },
+    onRejected: (entry, message) => {
+      if (entry.kind === 'match') {
+        setGameData(prev => prev && { ...prev, matches: prev.matches.filter(m => m.clientId !== entry.key) });
+      }
+      const action = { createGame: 'create the game', match: 'save a hand', endGame: 'end the game' }[entry.kind];
+      alert(`The server could not ${action}: ${message}`);
+    }
+  };
+  const syncNow = () => syncOutbox({
+    onGameCreated: (...args) => syncHandlers.current.onGameCreated(...args),
+    onMatchesSynced: (...args) => syncHandlers.current.onMatchesSynced(...args),
+    onGameEnded: (...args) => syncHandlers.current.onGameEnded(...args),
+    onRejected: (...args) => syncHandlers.current.onRejected(...args)
+  });
+
+  // Retry whatever is queued on load, whenever the browser comes back online, and periodically
+  useEffect(() => {
+    syncNow();
+    window.addEventListener('online', syncNow);
+    const timer = setInterval(syncNow, 15000);
+    return () => {
+      window.removeEventListener('online', syncNow);
+      clearInterval(timer);
+    };
+  }, []);
+
+  const shownStandings = useMemo(
+    () => withPendingHands(standings, gameData?.matches),
+    [standings, gameData?.matches]
+  );
+
+  // Load existing game if gameId is in URL, or go to setup if newGame=true
+  useEffect(() => {
+    const urlParams = new URLSearchParams(window.location.search);
+    const gameId = urlParams.get('gameId');
+    const newGame = urlParams.get('newGame');
+    
+    if (gameId) {
+      loadExistingGame(gameId);
+    } else if (newGame === 'true') {
+      // Clear URL parameters and go to setup
+      window.history.replaceState({}, '', '/');
+      setCurrentScreen('setup');
+    }
+  }, []);
+
+  const loadExistingGame = async (gameId) => {
+    setLoading(true);
+    try {
+      const response = await fetch(`/api/games/${gameId}`);
+      if (response.ok) {
+        const data = await response.json();
+        const game = data.game;
+        
+        // Set game data, with any hands for it still waiting in the outbox
+        const queued = await queuedHands(game.id);
+        const firstPending = nextMatchNumber(game.matches);
+        setGameData({
+          ...game,
+          matches: mergeMatches(game.matches, queued.map((entry, i) => pendingMatch(entry, firstPending + i)))
+        });
+        
+        // Set selected players from game
+        const gamePlayers = game.players.map(gp => gp.player);
+        setSelectedPlayers(gamePlayers);
+        
+        // Set location
+        setSelectedLocation(game.location);
+        
+        // Go directly to main game
+        setCurrentScreen('mainGame');
+      } else {
+        console.error('Failed to load game');
+        // Fallback to setup if game not found
+        setCurrentScreen('setup');
+      }
+    } catch (error) {
+      console.error('Error loading game:', error);
+      setCurrentScreen('setup');
+    }
+    setLoading(false);
+  };
+
+  if (loading) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4 flex items-center justify-center">
+        <Card className="bg-white/95 shadow-xl max-w-md w-full">
+          <CardContent className="p-6 text-center">
+            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-green-600 mx-auto mb-4"></div>
+            <p className="text-gray-600">Loading game...</p>
+          </CardContent>
+        </Card>
+      </div>
+    );
+  }
+
+  return (
+    <GameContext.Provider value={{
+      currentScreen, setCurrentScreen,
+      gameData, setGameData,
+      locations, setLocations,
+      selectedPlayers, setSelectedPlayers,
+      selectedLocation, setSelectedLocation,
+      standings: shownStandings,
+      syncNow
+    }}>
+      {children}
+    </GameContext.Provider>
+  );
+};
+
+export const useGame = () => {
+  const context = useContext(GameContext);
+  if (!context) {
+    throw new Error('useGame must be used within GameProvider');
+  }
+  return context;
+};
@@ -0,0 +1,46 @@
+// Plain-text final results for the end-game download. Loaded only when a
+// download is asked for, so it stays out of the end-game screen's chunk.
+
+export const generateGameReport = (stats, rankings, matches) => {
+  let report = `250 CARD GAME - FINAL RESULTS\n`;
+  report += `=====================================\n\n`;
+  report += `Game Details:\n`;
+  report += `Location: ${stats.location}\n`;
+  report += `Date: ${stats.date}\n`;
+  report += `Players: ${stats.totalPlayers}\n`;
+  report += `Matches Played: ${stats.totalMatches}\n\n`;
+  
+  report += `FINAL STANDINGS:\n`;
+  report += `================\n`;
+  rankings.forEach((entry, index) => {
+    report += `${index + 1}. ${entry.player.name} - ${entry.totalPoints} points (${entry.matchesWon}W/${entry.matchesLost}L)\n`;
+  });
+  
+  report += `\nMATCH HISTORY:\n`;
+  report += `==============\n`;
+  if (matches.length === 0) {
+    report += `No matches played yet.\n`;
+  } else {
+    // Create a table-like format for match history
+    report += `Match | Bidder | Partners | Bid | Result | Scores\n`;
+    report += `------|--------|----------|-----|--------|--------\n`;
+    
+    matches.slice().reverse().forEach((match) => {
+      const partnerNames = match.partners.length > 0 ? 
+        match.partners.map(p => p.player?.name || p.name).join(', ') : 'Solo';
+      const result = match.won ? 'WON' : 'LOST';
+      
+      // Get scores for this match - only players who got points
+      const scores = match.scores ? 
+        match.scores
+          .filter(score => score.score > 0)
+          .map(score => `${score.player.name}: ${score.score}`)
+          .join(', ') : 'N/A';
+      
+      report += `#${match.matchNumber} | ${match.bidder.name} | ${partnerNames} | ${match.bidAmount} | ${result} | ${scores}\n`;
+    });
+  }
+  
+  report += `\n\nGenerated on ${new Date().toLocaleString()}\n`;
+  return report;
+};
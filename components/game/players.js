@@ -0,0 +1,53 @@
+import { useState, useEffect } from 'react';
+
+// Every player, following the list's pagination cursor
+export const fetchAllPlayers = async () => {
+  const players = [];
+  let after = null;
+  do {
+    const response = await fetch(`/api/players?limit=500${after ? `&after=${encodeURIComponent(after)}` : ''}`);
+    if (!response.ok) break;
+    const data = await response.json();
+    players.push(...data.players);
+    after = data.nextCursor;
+  } while (after);
+  return players;
+};
+
+// Typeahead over the server's player search; with an empty query, the first page
+// of players. refresh() re-runs the current query (e.g. after adding a player).
+export const usePlayerSearch = (query) => {
+  const [results, setResults] = useState([]);
+  const [version, setVersion] = useState(0);
+
+  useEffect(() => {
+    const q = query.trim();
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const url = q ? `/api/players/search?q=${encodeURIComponent(q)}&limit=20` : '/api/players';
+        const response = await fetch(url, { signal: controller.signal });
+        if (response.ok) {
+          const data = await response.json();
+          setResults(data.players);
+        }
+      } catch (error) {
+        if (error.name !== 'AbortError') console.error('Error searching players:', error);
+      }
+    }, q ? 150 : 0);
+
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [query, version]);
+
+  return { results, refresh: () => setVersion(v => v + 1) };
+};
+
+// Search results, with the already selected players listed first while not searching
+export const visiblePlayers = (searchTerm, results, selectedPlayers) => {
+  if (searchTerm.trim()) return results;
+  const shown = new Set(results.map(p => p.id));
+  return [...selectedPlayers.filter(p => !shown.has(p.id)), ...results];
+};
@@ -0,0 +1,320 @@
+'use client';
+
+import { useState, useEffect } from 'react';
+import dynamic from 'next/dynamic';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Avatar, AvatarImage, AvatarFallback } from '@/components/ui/avatar';
+import { Trophy, ArrowLeft } from 'lucide-react';
+import { useGame } from '@/components/game/GameProvider';
+import { enqueue } from '@/lib/outbox';
+
+// Only needed for a few seconds after the game ends, so it loads on its own
+const loadConfetti = () => import('react-confetti');
+const Confetti = dynamic(loadConfetti, { ssr: false });
+
+const EndGameScreen = () => {
+  const { setCurrentScreen, gameData, selectedPlayers, standings, syncNow } = useGame();
+  const [gameEnded, setGameEnded] = useState(false);
+  const [showConfetti, setShowConfetti] = useState(false);
+
+  // Standings and matches (for PDF export) come from the provider's live game state
+  const { rankings, totalMatches } = standings;
+  const matches = gameData?.matches || [];
+  const loading = !standings.loaded;
+
+  // Fetch the confetti while the players look at the standings, before they end the game
+  useEffect(() => {
+    loadConfetti();
+  }, []);
+
+  // Queued behind the game's hands, so the server ends it only after they are all saved
+  const handleEndGame = async () => {
+    try {
+      await enqueue({ kind: 'endGame', gameId: gameData.id });
+    } catch (error) {
+      console.error('Error ending game:', error);
+      alert('Failed to end game');
+      return;
+    }
+    setGameEnded(true);
+    setShowConfetti(true);
+    setTimeout(() => setShowConfetti(false), 3000);
+    syncNow();
+  };
+
+  const exportToPDF = async () => {
+    const { generateGameReport } = await import('@/components/game/gameReport');
+
+    // Generate PDF content
+    const gameStats = {
+      location: gameData?.location || 'Unknown',
+      date: new Date(gameData?.date).toLocaleDateString() || new Date().toLocaleDateString(),
+      totalPlayers: selectedPlayers.length,
+      totalMatches: totalMatches
+    };
+
+    // Create downloadable text file (PDF functionality would require a library like jsPDF)
+    const content = generateGameReport(gameStats, rankings, matches);
+    const blob = new Blob([content], { type: 'text/plain' });
+    const url = URL.createObjectURL(blob);
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = `250-card-game-results-${new Date().toISOString().split('T')[0]}.txt`;
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+    URL.revokeObjectURL(url);
+  };
+
+  const shareResults = () => {
+    if (navigator.share && rankings.length > 0) {
+      const winner = rankings[0];
+      const gameDate = gameData?.date ? new Date(gameData.date).toLocaleDateString() : new Date().toLocaleDateString();
+      const shareText = `🏆 Winner: ${winner.player.name} with ${winner.totalPoints} points!\n\n📊 Final Standings:\n${rankings.map((entry, index) => `${index + 1}. ${entry.player.name} - ${entry.totalPoints} pts`).join('\n')}\n\n🎮 ${totalMatches} matches played at ${gameData?.location || 'Game Night'}\n📅 ${gameDate}`;
+      
+      navigator.share({
+        title: '250 Card Game Results! 🎉',
+        text: shareText
+      }).catch(console.error);
+    } else {
+      // Fallback: copy to clipboard
+      const winner = rankings[0];
+      const gameDate = gameData?.date ? new Date(gameData.date).toLocaleDateString() : new Date().toLocaleDateString();
+      const shareText = `🎉 250 Card Game Results!\n\n🏆 Winner: ${winner.player.name} with ${winner.totalPoints} points!\n\n📊 Final Standings:\n${rankings.slice(0, 3).map((entry, index) => `${index + 1}. ${entry.player.name} - ${entry.totalPoints} pts`).join('\n')}\n\n🎮 ${totalMatches} matches played at ${gameData?.location || 'Game Night'}\n📅 ${gameDate}`;
+      
+      navigator.clipboard.writeText(shareText).then(() => {
+        alert('Results copied to clipboard!');
+      }).catch(() => {
+        alert('Unable to copy results');
+      });
+    }
+  };
+
+  if (loading) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4 flex items-center justify-center">
+        <Card className="bg-white/95 shadow-xl max-w-md w-full">
+          <CardContent className="p-6 text-center">
+            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-green-600 mx-auto mb-4"></div>
+            <p className="text-gray-600">Loading final results...</p>
+          </CardContent>
+        </Card>
+      </div>
+    );
+  }
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+      {showConfetti && (
+        <Confetti
+          width={window.innerWidth}
+          height={window.innerHeight}
+          recycle={false}
+          numberOfPieces={200}
+          gravity={0.3}
+          initialVelocityY={20}
+          colors={['#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#06B6D4']}
+        />
+      )}
+      
+      <div className="max-w-2xl mx-auto space-y-6">
+        <div className="flex items-center justify-between text-white">
+          {!gameEnded && (
+            <Button
+              variant="ghost"
+              className="text-white hover:bg-white/20"
+              onClick={() => setCurrentScreen('mainGame')}
+            >
+              <ArrowLeft className="w-4 h-4 mr-2" />
+              {/* Back */}
+            </Button>
+          )}
+          <div className="text-center w-full">
+            <h1 className="text-3xl font-bold text-center">
+              {gameEnded ? '🎉 Game Completed!' : 'End Game'}
+            </h1>
+            <p className="text-green-200">Final Results</p>
+          </div>
+          <div className="w-20"></div>
+        </div>
+
+        {/* Top 3 Players with Podium */}
+        {rankings.length >= 3 && (
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="text-center">🏆 Top 3 Players</CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="flex items-end justify-center gap-4">
+                {/* 2nd Place */}
+                <div className="text-center">
+                  <Avatar className="w-16 h-16 mx-auto mb-2">
+                    <AvatarImage src={rankings[1]?.player.avatar} alt={rankings[1]?.player.name} />
+                    <AvatarFallback>{rankings[1]?.player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                  </Avatar>
+                  <div className="bg-gray-300 h-16 w-20 rounded-t-lg flex items-center justify-center mb-2">
+                    <span className="text-2xl font-bold text-gray-700">2</span>
+                  </div>
+                  <p className="font-semibold text-sm">{rankings[1]?.player.name}</p>
+                  <p className="text-xs text-gray-600">{rankings[1]?.totalPoints} pts</p>
+                </div>
+
+                {/* 1st Place */}
+                <div className="text-center">
+                  <Avatar className="w-20 h-20 mx-auto mb-2 ring-4 ring-yellow-400">
+                    <AvatarImage src={rankings[0]?.player.avatar} alt={rankings[0]?.player.name} />
+                    <AvatarFallback>{rankings[0]?.player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                  </Avatar>
+                  <div className="bg-yellow-400 h-24 w-24 rounded-t-lg flex items-center justify-center mb-2">
+                    <span className="text-3xl font-bold text-yellow-800">👑</span>
+                  </div>
+                  <p className="font-bold">{rankings[0]?.player.name}</p>
+                  <p className="text-sm text-yellow-600 font-semibold">{rankings[0]?.totalPoints} pts</p>
+                </div>
+
+                {/* 3rd Place */}
+                <div className="text-center">
+                  <Avatar className="w-16 h-16 mx-auto mb-2">
+                    <AvatarImage src={rankings[2]?.player.avatar} alt={rankings[2]?.player.name} />
+                    <AvatarFallback>{rankings[2]?.player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                  </Avatar>
+                  <div className="bg-orange-400 h-12 w-20 rounded-t-lg flex items-center justify-center mb-2">
+                    <span className="text-xl font-bold text-orange-800">3</span>
+                  </div>
+                  <p className="font-semibold text-sm">{rankings[2]?.player.name}</p>
+                  <p className="text-xs text-gray-600">{rankings[2]?.totalPoints} pts</p>
+                </div>
+              </div>
+            </CardContent>
+          </Card>
+        )}
+
+        {/* Complete Rankings */}
+        <Card className="bg-white/95 shadow-xl">
+          <CardHeader>
+            <CardTitle className="flex items-center gap-2">
+              <Trophy className="w-5 h-5 text-yellow-600" />
+              Complete Rankings
+            </CardTitle>
+          </CardHeader>
+          <CardContent>
+            <div className="space-y-2">
+              {rankings.map((entry, index) => {
+                const isLast = index === rankings.length - 1;
+                return (
+                  <div
+                    key={entry.player.id}
+                    className={`flex items-center justify-between p-3 rounded-lg ${
+                      index === 0 ? 'bg-yellow-50 border border-yellow-200' :
+                      index === 1 ? 'bg-gray-50 border border-gray-200' :
+                      index === 2 ? 'bg-orange-50 border border-orange-200' : 
+                      isLast ? 'bg-red-50 border border-red-200' : 'bg-white border border-gray-100'
+                    }`}
+                  >
+                    <div className="flex items-center gap-3">
+                      <span className={`text-lg font-bold w-8 ${
+                        isLast ? 'text-red-600' : ''
+                      }`}>#{index + 1}</span>
+                      <Avatar className="w-10 h-10">
+                        <AvatarImage src={entry.player.avatar} alt={entry.player.name} />
+                        <AvatarFallback>{entry.player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                      </Avatar>
+                      <div>
+                        <p className="font-medium">{entry.player.name}</p>
+                        <p className="text-xs text-gray-600">{entry.matchesWon}W / {entry.matchesLost}L</p>
+                        {isLast && (
+                          <span className="text-xs bg-red-100 text-red-800 px-2 py-1 rounded">
+                            Least Scorer
+                          </span>
+                        )}
+                      </div>
+                    </div>
+                    <div className="text-right">
+                      <p className={`text-lg font-bold ${
+                        isLast ? 'text-red-600' : 'text-green-600'
+                      }`}>{entry.totalPoints}</p>
+                      <p className="text-xs text-gray-500">points</p>
+                    </div>
+                  </div>
+                );
+              })}
+            </div>
+          </CardContent>
+        </Card>
+
+        {/* Game Statistics */}
+        <Card className="bg-white/95 shadow-xl">
+          <CardHeader>
+            <CardTitle>Game Statistics</CardTitle>
+          </CardHeader>
+          <CardContent>
+            <div className="grid grid-cols-2 gap-4 text-center">
+              <div>
+                <p className="text-2xl font-bold text-blue-600">{totalMatches}</p>
+                <p className="text-sm text-gray-600">Total Matches</p>
+              </div>
+              <div>
+                <p className="text-2xl font-bold text-green-600">{selectedPlayers.length}</p>
+                <p className="text-sm text-gray-600">Players</p>
+              </div>
+              <div>
+                <p className="text-2xl font-bold text-purple-600">{gameData?.location || 'Unknown'}</p>
+                <p className="text-sm text-gray-600">Location</p>
+              </div>
+              <div>
+                <p className="text-2xl font-bold text-orange-600">
+                  {new Date(gameData?.date).toLocaleDateString() || 'Today'}
+                </p>
+                <p className="text-sm text-gray-600">Date</p>
+              </div>
+            </div>
+          </CardContent>
+        </Card>
+
+        {/* Action Buttons */}
+        <div className="space-y-3">
+          {!gameEnded && (
+            <Button 
+              className="w-full bg-red-600 hover:bg-red-700 h-12 text-lg"
+              onClick={handleEndGame}
+            >
+              🏁 End Game & Finalize Results
+            </Button>
+          )}
+
+          {gameEnded && (
+            <>
+              <div className="grid grid-cols-2 gap-3">
+                <Button 
+                  className="bg-blue-600 hover:bg-blue-700 h-12"
+                  onClick={exportToPDF}
+                >
+                  📄 Export Results
+                </Button>
+                <Button 
+                  className="bg-green-600 hover:bg-green-700 h-12"
+                  onClick={shareResults}
+                >
+                  📤 Share Results
+                </Button>
+              </div>
+              
+              <Button 
+                className="w-full bg-purple-600 hover:bg-purple-700 h-12 text-lg"
+                onClick={() => {
+                  setCurrentScreen('setup');
+                  window.location.reload(); // Reset the entire app state
+                }}
+              >
+                🎮 Start New Game
+              </Button>
+            </>
+          )}
+        </div>
+      </div>
+    </div>
+  );
+};
+
+export default EndGameScreen;
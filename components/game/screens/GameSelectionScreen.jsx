@@ -0,0 +1,135 @@
+'use client';
+
+import { useState, useEffect } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Badge } from '@/components/ui/badge';
+import { Plus, FileText, Gamepad2 } from 'lucide-react';
+
+// Game Selection Screen
+const GameSelectionScreen = () => {
+  const [games, setGames] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    fetchGames();
+  }, []);
+
+  // The list only shows counts, so the summary view is enough
+  const fetchGames = async (after) => {
+    try {
+      const response = await fetch(`/api/games?fields=summary${after ? `&after=${encodeURIComponent(after)}` : ''}`);
+      if (response.ok) {
+        const data = await response.json();
+        setGames(prev => after ? [...prev, ...data.games] : data.games);
+        setNextCursor(data.nextCursor);
+      }
+    } catch (error) {
+      console.error('Error fetching games:', error);
+    }
+    setLoading(false);
+  };
+
+  const handleNewGame = () => {
+    // Navigate to game setup directly
+    window.location.href = '/?newGame=true';
+  };
+
+  const handleContinueGame = (game) => {
+    // Set the game data and go to main game
+    // This will be handled by the GameProvider
+    window.location.href = `/?gameId=${game.id}`;
+  };
+
+  if (loading) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4 flex items-center justify-center">
+        <Card className="">
+          <CardContent className="p-6 text-center">
+            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-green-600 mx-auto mb-4"></div>
+            <p className="text-gray-600">Loading games...</p>
+          </CardContent>
+        </Card>
+      </div>
+    );
+  }
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+      <div className="max-w-2xl mx-auto space-y-6">
+        <div className="text-center text-white mb-8">
+          <h1 className="text-3xl font-bold mb-2">250 Card Game</h1>
+          <p className="text-green-200">Choose a game to continue or start new</p>
+        </div>
+
+        {/* New Game Button */}
+        <Card className="bg-white/95 shadow-xl">
+          <CardContent className="p-6">
+            <Button 
+              onClick={handleNewGame}
+              className="w-full bg-green-600 hover:bg-green-700 h-16 text-lg"
+            >
+              <Plus className="w-6 h-6 mr-3" />
+              Start New Game
+            </Button>
+          </CardContent>
+        </Card>
+
+        {/* Existing Games */}
+        {games.length > 0 && (
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="flex items-center gap-2">
+                <FileText className="w-5 h-5" />
+                Continue Existing Games
+              </CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="space-y-3">
+                {games.map((game) => (
+                  <div 
+                    key={game.id} 
+                    className="flex items-center justify-between p-4 bg-gray-50 rounded-lg hover:bg-gray-100 transition-colors cursor-pointer"
+                    onClick={() => handleContinueGame(game)}
+                  >
+                    <div className="flex items-center gap-3">
+                      <div className="w-12 h-12 bg-green-100 rounded-full flex items-center justify-center">
+                        <Gamepad2 className="w-6 h-6 text-green-600" />
+                      </div>
+                      <div>
+                        <p className="font-semibold">{game.location}</p>
+                        <p className="text-sm text-gray-600">
+                          {new Date(game.date).toLocaleDateString()} • {game.players?.length || 0} players
+                        </p>
+                        <p className="text-xs text-gray-500">
+                          {game.matchCount ?? game.matches?.length ?? 0} matches played
+                        </p>
+                      </div>
+                    </div>
+                    <div className="text-right">
+                      <Badge className={game.isActive ? 'bg-green-100 text-green-800' : 'bg-gray-100 text-gray-600'}>
+                        {game.isActive ? 'Active' : 'Ended'}
+                      </Badge>
+                    </div>
+                  </div>
+                ))}
+              </div>
+              {nextCursor && (
+                <Button
+                  variant="outline"
+                  onClick={() => fetchGames(nextCursor)}
+                  className="w-full mt-3"
+                >
+                  Load more games
+                </Button>
+              )}
+            </CardContent>
+          </Card>
+        )}
+      </div>
+    </div>
+  );
+};
+
+export default GameSelectionScreen;
@@ -0,0 +1,203 @@
+'use client';
+
+import React, { useState, useEffect } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Input } from '@/components/ui/input';
+import { Label } from '@/components/ui/label';
+import { Plus, Settings, ArrowLeft, User } from 'lucide-react';
+import { useGame } from '@/components/game/GameProvider';
+import GameSelectionScreen from '@/components/game/screens/GameSelectionScreen';
+
+// Game Setup Screen
+const GameSetupScreen = () => {
+  const { setCurrentScreen, locations, setLocations, selectedLocation, setSelectedLocation } = useGame();
+  const [newLocationName, setNewLocationName] = useState('');
+  const [showAddLocation, setShowAddLocation] = useState(false);
+  const [loading, setLoading] = useState(false);
+  const [showGameSelection, setShowGameSelection] = useState(false);
+
+  React.useEffect(() => {
+    // Check if there's a gameId in URL
+    const urlParams = new URLSearchParams(window.location.search);
+    const gameId = urlParams.get('gameId');
+    
+    if (gameId) {
+      setShowGameSelection(false);
+    } else {
+      // Check if user has visited before
+      const hasVisited = localStorage.getItem('hasVisited250Game');
+      if (hasVisited) {
+        setShowGameSelection(false);
+      } else {
+        setShowGameSelection(true);
+      }
+    }
+  }, []);
+
+  useEffect(() => {
+    fetchLocations();
+  }, []);
+
+  const fetchLocations = async () => {
+    try {
+      const response = await fetch('/api/locations');
+      const data = await response.json();
+      setLocations(data.locations || []);
+    } catch (error) {
+      console.error('Error fetching locations:', error);
+    }
+  };
+
+  const handleAddLocation = async () => {
+    if (!newLocationName.trim()) return;
+    
+    setLoading(true);
+    try {
+      const response = await fetch('/api/locations', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ name: newLocationName })
+      });
+      
+      if (response.ok) {
+        await fetchLocations();
+        setSelectedLocation(newLocationName);
+        setNewLocationName('');
+        setShowAddLocation(false);
+      } else {
+        const error = await response.json();
+        alert(error.error || 'Failed to add location');
+      }
+    } catch (error) {
+      console.error('Error adding location:', error);
+      alert('Failed to add location');
+    }
+    setLoading(false);
+  };
+
+  const handleLocationSelect = (location) => {
+    setSelectedLocation(location);
+  };
+
+  const handleContinue = () => {
+    if (selectedLocation) {
+      setCurrentScreen('playerSelection');
+    }
+  };
+
+  const handleBackToGameSelection = () => {
+    // Clear URL parameters and show game selection
+    window.history.pushState({}, "", "/");
+    setShowGameSelection(true);
+  };
+
+  if (showGameSelection) {
+    return <GameSelectionScreen />;
+  }
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+      <div className="max-w-md mx-auto space-y-6">
+        <div className="flex items-center justify-between text-white mb-8">
+          <Button
+            variant="ghost"
+            className="text-white hover:bg-white/20"
+            onClick={() => window.location.href = '/'}
+          >
+            <ArrowLeft className="w-5 h-5" />
+          </Button>
+          <div className="text-center">
+            <h1 className="text-2xl font-bold">250 Card Game</h1>
+            <p className="text-green-200">Setup New Game</p>
+          </div>
+          <div className="w-20"></div>
+        </div>
+
+        <Card className="bg-white/95 shadow-xl">
+          <CardHeader>
+            <CardTitle className="flex items-center gap-2">
+              <Settings className="w-5 h-5" />
+              Game Setup
+            </CardTitle>
+          </CardHeader>
+          <CardContent className="space-y-6">
+            <div>
+              <Label className="text-sm font-medium mb-3 block">Choose Location</Label>
+              <div className="grid grid-cols-1 gap-2">
+                {locations.map((location) => (
+                  <Button
+                    key={location}
+                    variant={selectedLocation === location ? "default" : "outline"}
+                    className={`w-full justify-start ${
+                      selectedLocation === location 
+                        ? 'bg-green-600 hover:bg-green-700 text-white' 
+                        : 'hover:bg-gray-50'
+                    }`}
+                    onClick={() => handleLocationSelect(location)}
+                  >
+                    {location}
+                  </Button>
+                ))}
+                
+                {!showAddLocation ? (
+                  <Button
+                    variant="ghost"
+                    className="w-full justify-start text-gray-500 hover:text-gray-700"
+                    onClick={() => setShowAddLocation(true)}
+                  >
+                    <Plus className="w-4 h-4 mr-2" />
+                    Add New Location
+                  </Button>
+                ) : (
+                  <div className="flex gap-2">
+                    <Input
+                      placeholder="Enter location name"
+                      value={newLocationName}
+                      onChange={(e) => setNewLocationName(e.target.value)}
+                      onKeyDown={(e) => e.key === 'Enter' && handleAddLocation()}
+                    />
+                    <Button 
+                      onClick={handleAddLocation} 
+                      disabled={loading || !newLocationName.trim()}
+                      size="sm"
+                    >
+                      Add
+                    </Button>
+                    <Button 
+                      variant="ghost" 
+                      onClick={() => setShowAddLocation(false)}
+                      size="sm"
+                    >
+                      Cancel
+                    </Button>
+                  </div>
+                )}
+              </div>
+            </div>
+
+            <div className="flex flex-col w-full gap-3">
+              <Button 
+                className="flex-1 bg-green-600 hover:bg-green-700"
+                onClick={handleContinue}
+                disabled={!selectedLocation}
+              >
+                Continue to Player Selection
+              </Button>
+              <Button 
+                variant="outline"
+                className="flex-1"
+                onClick={() => setCurrentScreen('playerProfiles')}
+              >
+                <User className="w-4 h-4 mr-2" />
+                Player Profiles
+              </Button>
+            </div>
+          </CardContent>
+        </Card>
+      </div>
+    </div>
+  );
+};
+
+export default GameSetupScreen;
@@ -0,0 +1,194 @@
+'use client';
+
+import { useState } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Input } from '@/components/ui/input';
+import { Badge } from '@/components/ui/badge';
+import { Plus, Users, Trophy, FileText, Crown, Target, Share2, Copy } from 'lucide-react';
+import { useGame } from '@/components/game/GameProvider';
+import { isLocalId } from '@/lib/outbox';
+
+// Main Game Screen
+const MainGameScreen = () => {
+  const { setCurrentScreen, gameData, selectedPlayers } = useGame();
+  const [showShareDialog, setShowShareDialog] = useState(false);
+  const [shareLink, setShareLink] = useState('');
+
+  const handleShareGame = () => {
+    if (isLocalId(gameData?.id)) {
+      alert('This game has not reached the server yet. Share it once you are back online.');
+    } else if (gameData?.id) {
+      const link = `${window.location.origin}/?gameId=${gameData.id}`;
+      setShareLink(link);
+      setShowShareDialog(true);
+    }
+  };
+
+  const copyToClipboard = async () => {
+    try {
+      await navigator.clipboard.writeText(shareLink);
+      alert('Game link copied to clipboard!');
+      setShowShareDialog(false);
+    } catch (err) {
+      console.error('Failed to copy: ', err);
+      // Fallback for older browsers
+      const textArea = document.createElement('textarea');
+      textArea.value = shareLink;
+      document.body.appendChild(textArea);
+      textArea.select();
+      document.execCommand('copy');
+      document.body.removeChild(textArea);
+      alert('Game link copied to clipboard!');
+      setShowShareDialog(false);
+    }
+  };
+
+  const menuItems = [
+    {
+      title: 'Modify Players',
+      description: 'Add/remove players',
+      icon: <Users className="w-5 h-5" />,
+      action: () => setCurrentScreen('modifyPlayers')
+    },
+    {
+      title: 'View Totals',
+      description: 'Current standings',
+      icon: <Trophy className="w-5 h-5" />,
+      action: () => setCurrentScreen('viewTotals')
+    },
+    {
+      title: 'End Game',
+      description: 'Finalize & export',
+      icon: <FileText className="w-5 h-5" />,
+      action: () => setCurrentScreen('endGame')
+    }
+  ];
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+      <div className="max-w-2xl mx-auto space-y-6 flex flex-col h-[90vh] justify-between">
+        <div className="text-center text-white">
+          <div className="flex items-center justify-between mb-4">
+            <div className="w-20"></div>
+            <div>
+              <h1 className="text-3xl font-bold mb-2">250 Card Game</h1>
+              <p className="text-green-200">
+                {gameData?.location} • {selectedPlayers.length} players
+              </p>
+            </div>
+            <Button
+              variant="ghost"
+              className="text-white hover:bg-white/20"
+              onClick={handleShareGame}
+              title="Share Game"
+            >
+              <Share2 className="w-6 h-6" />
+            </Button>
+          </div>
+        </div>
+
+        {/* Main New Match Button */}
+        <div className="flex justify-center mb-8">
+          <Button
+            onClick={() => setCurrentScreen('newMatch')}
+            className="w-64 h-64 rounded-2xl bg-gradient-to-r from-green-600 to-green-700 hover:from-green-700 hover:to-green-800 text-white shadow-2xl transform hover:scale-105 transition-all duration-200"
+          >
+            <div className="flex flex-col items-center space-y-2">
+              <Plus className="w-12 h-12" />
+              <span className="text-lg font-bold">New Match</span>
+            </div>
+          </Button>
+        </div>
+
+        {/* Other Menu Items */}
+        <div className="flex justify-between gap-4">
+          {menuItems.map((item, index) => (
+            <Button
+              key={index}
+              variant="ghost"
+              className="flex-1 h-16 bg-white/10 hover:bg-white/20 text-white border border-white/20"
+              onClick={item.action}
+            >
+              <div className="flex flex-col items-center space-y-2">
+                {item.icon}
+                <span className="text-xs font-medium">{item.title}</span>
+              </div>
+            </Button>
+          ))}
+        </div>
+
+        {gameData?.matches && gameData.matches.length > 0 && (
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle>Recent Matches</CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="space-y-2">
+                {gameData.matches.slice(-3).reverse().slice(0, 5).map((match, index) => (
+                  <div key={match.id} className="flex items-center justify-between p-3 bg-green-700 rounded-lg">
+                    <div className="flex items-center gap-3">
+                      <Badge variant="secondary">Match {match.matchNumber}</Badge>
+                      {match.pending && <Badge variant="outline" className="text-white">Saving…</Badge>}
+                      <div className="flex items-center gap-2">
+                        <Crown className="w-4 h-4 text-yellow-600" />
+                        <span className="font-medium">{match.bidder.name}</span>
+                      </div>
+                    </div>
+                    <div className="flex items-center gap-2">
+                      <Target className="w-4 h-4" />
+                      <span className="font-bold">{match.bidAmount}</span>
+                      <Badge className={match.won ? 'bg-green-100 text-green-800' : 'bg-red-100 text-red-800'}>
+                        {match.won ? 'WON' : 'LOST'}
+                      </Badge>
+                    </div>
+                  </div>
+                ))}
+              </div>
+            </CardContent>
+          </Card>
+        )}
+
+        {/* Share Dialog */}
+        {showShareDialog && (
+          <div className="fixed inset-0 bg-black/50 flex items-center justify-center z-50">
+            <Card className="bg-white shadow-xl max-w-md w-full mx-4">
+              <CardHeader>
+                <CardTitle className="flex items-center gap-2">
+                  <Share2 className="w-5 h-5" />
+                  Share Game
+                </CardTitle>
+              </CardHeader>
+              <CardContent className="space-y-4">
+                <p className="text-sm text-gray-600">
+                  Share this link with other players to let them join your game:
+                </p>
+                <div className="flex items-center gap-2">
+                  <Input
+                    value={shareLink}
+                    readOnly
+                    className="flex-1"
+                  />
+                  <Button onClick={copyToClipboard} size="sm">
+                    <Copy className="w-4 h-4" />
+                  </Button>
+                </div>
+                <div className="flex gap-2">
+                  <Button 
+                    onClick={() => setShowShareDialog(false)}
+                    variant="outline"
+                    className="flex-1"
+                  >
+                    Close
+                  </Button>
+                </div>
+              </CardContent>
+            </Card>
+          </div>
+        )}
+      </div>
+    </div>
+  );
+};
+
+export default MainGameScreen;
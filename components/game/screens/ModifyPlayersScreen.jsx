@@ -0,0 +1,175 @@
+'use client';
+
+import { useState } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Input } from '@/components/ui/input';
+import { Badge } from '@/components/ui/badge';
+import { Avatar, AvatarImage, AvatarFallback } from '@/components/ui/avatar';
+import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from '@/components/ui/dialog';
+import { Search, Plus, Users, ArrowLeft } from 'lucide-react';
+import { useGame } from '@/components/game/GameProvider';
+import { usePlayerSearch, visiblePlayers } from '@/components/game/players';
+
+// Modify Players Screen
+const ModifyPlayersScreen = () => {
+  const { setCurrentScreen, selectedPlayers, setSelectedPlayers } = useGame();
+  const [searchTerm, setSearchTerm] = useState('');
+  const [showAddPlayer, setShowAddPlayer] = useState(false);
+  const [newPlayerName, setNewPlayerName] = useState('');
+  const [loading, setLoading] = useState(false);
+  const { results, refresh } = usePlayerSearch(searchTerm);
+
+  const handleAddPlayer = async () => {
+    if (!newPlayerName.trim()) return;
+    
+    setLoading(true);
+    try {
+      const response = await fetch('/api/players', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ name: newPlayerName })
+      });
+      
+      if (response.ok) {
+        const result = await response.json();
+        refresh();
+        setNewPlayerName('');
+        setShowAddPlayer(false);
+      } else {
+        const error = await response.json();
+        alert(error.error || 'Failed to add player');
+      }
+    } catch (error) {
+      console.error('Error adding player:', error);
+      alert('Failed to add player');
+    }
+    setLoading(false);
+  };
+
+  const togglePlayerSelection = (player) => {
+    setSelectedPlayers(prev => {
+      const isSelected = prev.some(p => p.id === player.id);
+      if (isSelected) {
+        return prev.filter(p => p.id !== player.id);
+      } else {
+        return [...prev, player];
+      }
+    });
+  };
+
+  const filteredPlayers = visiblePlayers(searchTerm, results, selectedPlayers);
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+      <div className="max-w-2xl mx-auto space-y-6">
+        <div className="flex items-center justify-between text-white">
+          <Button
+            variant="ghost"
+            className="text-white hover:bg-white/20"
+            onClick={() => setCurrentScreen('mainGame')}
+          >
+            <ArrowLeft className="w-5 h-5" />
+          </Button>
+          <div className="text-center">
+            <h1 className="text-2xl font-bold">Modify Players</h1>
+            <p className="text-green-200">{selectedPlayers.length} players in game</p>
+          </div>
+          <div className="w-20"></div>
+        </div>
+
+        <Card className="bg-white/95 shadow-xl">
+          <CardHeader>
+            <div className="flex items-center justify-between">
+              <CardTitle className="flex items-center gap-2">
+                <Users className="w-5 h-5" />
+                Players
+              </CardTitle>
+              <Dialog open={showAddPlayer} onOpenChange={setShowAddPlayer}>
+                <DialogTrigger asChild>
+                  <Button size="sm" className="bg-green-600 hover:bg-green-700">
+                    <Plus className="w-4 h-4 mr-1" />
+                    Add Player
+                  </Button>
+                </DialogTrigger>
+                <DialogContent>
+                  <DialogHeader>
+                    <DialogTitle>Add New Player</DialogTitle>
+                  </DialogHeader>
+                  <div className="space-y-4">
+                    <Input
+                      placeholder="Enter player name"
+                      value={newPlayerName}
+                      onChange={(e) => setNewPlayerName(e.target.value)}
+                      onKeyDown={(e) => e.key === 'Enter' && handleAddPlayer()}
+                    />
+                    <div className="flex gap-2">
+                      <Button variant="outline" onClick={() => setShowAddPlayer(false)}>
+                        Cancel
+                      </Button>
+                      <Button onClick={handleAddPlayer} disabled={loading || !newPlayerName.trim()}>
+                        Add Player
+                      </Button>
+                    </div>
+                  </div>
+                </DialogContent>
+              </Dialog>
+            </div>
+            <div className="relative">
+              <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4" />
+              <Input
+                placeholder="Search players..."
+                value={searchTerm}
+                onChange={(e) => setSearchTerm(e.target.value)}
+                className="pl-10"
+              />
+            </div>
+          </CardHeader>
+          <CardContent className="max-h-96 overflow-y-auto">
+            <div className="grid grid-cols-2 gap-4">
+              {filteredPlayers.map((player) => {
+                const isSelected = selectedPlayers.some(p => p.id === player.id);
+                return (
+                  <div
+                    key={player.id}
+                    className={`cursor-pointer p-4 rounded-lg border-2 transition-all ${
+                      isSelected 
+                        ? 'border-green-500 bg-green-50' 
+                        : 'border-gray-200 hover:border-gray-300'
+                    }`}
+                    onClick={() => togglePlayerSelection(player)}
+                  >
+                    <div className="flex flex-col items-center space-y-2">
+                      <Avatar className="w-12 h-12">
+                        <AvatarImage src={player.avatar} alt={player.name} />
+                        <AvatarFallback>{player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                      </Avatar>
+                      <span className="text-sm font-medium text-center">{player.name}</span>
+                      {isSelected && (
+                        <Badge variant="secondary" className="bg-green-100 text-green-800">
+                          In Game
+                        </Badge>
+                      )}
+                    </div>
+                  </div>
+                );
+              })}
+            </div>
+          </CardContent>
+        </Card>
+
+        <div className="flex gap-4">
+          <Button 
+            className="flex-1 bg-green-600 hover:bg-green-700"
+            onClick={() => setCurrentScreen('mainGame')}
+            disabled={selectedPlayers.length < 4}
+          >
+            Save Changes ({selectedPlayers.length >= 4 ? 'Ready' : `Need ${4 - selectedPlayers.length} more players`})
+          </Button>
+        </div>
+      </div>
+    </div>
+  );
+};
+
+export default ModifyPlayersScreen;
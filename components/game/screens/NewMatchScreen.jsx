@@ -0,0 +1,529 @@
+'use client';
+
+import { useState } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Input } from '@/components/ui/input';
+import { Badge } from '@/components/ui/badge';
+import { Avatar, AvatarImage, AvatarFallback } from '@/components/ui/avatar';
+import { Label } from '@/components/ui/label';
+import { Users, ArrowLeft, Crown, Target } from 'lucide-react';
+import { useGame, mergeMatches, pendingMatch, nextMatchNumber } from '@/components/game/GameProvider';
+import { enqueue } from '@/lib/outbox';
+
+// New Match Screen - Simplified for now
+const NewMatchScreen = () => {
+  const { setCurrentScreen, gameData, setGameData, selectedPlayers, syncNow } = useGame();
+  const [step, setStep] = useState('bidder'); // bidder -> partners -> bid -> result
+  const [selectedBidder, setSelectedBidder] = useState(null);
+  const [selectedPartners, setSelectedPartners] = useState([]);
+  const [bidAmount, setBidAmount] = useState('');
+  const [loading, setLoading] = useState(false);
+
+  // Dynamic partner count based on current player count
+  const getPartnerCount = (playerCount) => {
+    if (playerCount < 4) return 1; // 1 partner for 4 players
+    if (playerCount < 6) return 2; // 2 partners for 5-6 players  
+    return 3; // 3 partners for 7+ players
+  };
+  
+  const partnerCount = getPartnerCount(selectedPlayers.length);
+  const requiredPartners = partnerCount - 1; // Excluding bidder
+
+  const availablePartners = selectedPlayers.filter(p => p.id !== selectedBidder?.id);
+
+  const handleBidderSelect = (player) => {
+    setSelectedBidder(player);
+    setSelectedPartners([]); // Reset partners when bidder changes
+    setStep('partners');
+  };
+
+  const togglePartnerSelection = (player) => {
+    setSelectedPartners(prev => {
+      const isSelected = prev.some(p => p.id === player.id);
+      if (isSelected) {
+        return prev.filter(p => p.id !== player.id);
+      } else if (prev.length < requiredPartners) {
+        const newPartners = [...prev, player];
+        // Auto-advance when required partners are selected
+        if (newPartners.length === requiredPartners) {
+          setTimeout(() => setStep('bid'), 300);
+        }
+        return newPartners;
+      }
+      return prev;
+    });
+  };
+
+  // Reset state when going back to bidder selection
+  const handleBackToBidder = () => {
+    setSelectedBidder(null);
+    setSelectedPartners([]);
+    setStep('bidder');
+  };
+
+  const handleResult = async (won) => {
+    if (!selectedBidder || !bidAmount) return;
+    // Allow solo player (0 partners) or exact required partners
+    if (selectedPartners.length !== 0 && selectedPartners.length !== requiredPartners) return;
+
+    // The hand is queued and scored locally; the outbox sends it in the background
+    // and the saved match (with its server match number) replaces the pending one
+    const key = crypto.randomUUID();
+    setLoading(true);
+    try {
+      const entry = await enqueue({
+        kind: 'match',
+        gameId: gameData.id,
+        key,
+        payload: {
+          clientId: key,
+          bidder: selectedBidder,
+          partners: selectedPartners,
+          bidAmount: parseInt(bidAmount),
+          won,
+          currentPlayers: selectedPlayers,
+          timestamp: new Date().toISOString()
+        }
+      });
+      setGameData(prev => prev && {
+        ...prev,
+        matches: mergeMatches(prev.matches, [pendingMatch(entry, nextMatchNumber(prev.matches))])
+      });
+      setCurrentScreen('mainGame');
+      syncNow();
+    } catch (error) {
+      console.error('Error recording match:', error);
+      alert('Failed to record match');
+    }
+    setLoading(false);
+  };
+
+  if (step === 'bidder') {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+        <div className="max-w-2xl mx-auto space-y-6">
+          <div className="flex items-center justify-between text-white">
+            <Button
+              variant="ghost"
+              className="text-white hover:bg-white/20"
+              onClick={() => setCurrentScreen('mainGame')}
+            >
+              <ArrowLeft className="w-4 h-4 mr-2" />
+              {/* Back */}
+            </Button>
+            <h1 className="text-2xl font-bold">Select Bidder</h1>
+            <div className="w-20"></div>
+          </div>
+
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="flex items-center gap-2">
+                <Crown className="w-5 h-5 text-yellow-600" />
+                Who is the bidder?
+              </CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="grid grid-cols-2 gap-4">
+                {selectedPlayers.map((player) => (
+                  <div
+                    key={player.id}
+                    className="cursor-pointer p-4 rounded-lg border-2 border-gray-200 hover:border-yellow-400 transition-all"
+                    onClick={() => handleBidderSelect(player)}
+                  >
+                    <div className="flex flex-col items-center space-y-2">
+                      <Avatar className="w-12 h-12">
+                        <AvatarImage src={player.avatar} alt={player.name} />
+                        <AvatarFallback>{player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                      </Avatar>
+                      <span className="text-sm font-medium text-center">{player.name}</span>
+                    </div>
+                  </div>
+                ))}
+              </div>
+            </CardContent>
+          </Card>
+        </div>
+      </div>
+    );
+  }
+
+  if (step === 'partners') {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+        <div className="max-w-2xl mx-auto space-y-6">
+          <div className="flex items-center justify-between text-white">
+            <Button
+              variant="ghost"
+              className="text-white hover:bg-white/20"
+              onClick={handleBackToBidder}
+            >
+              <ArrowLeft className="w-5 h-5" />
+            </Button>
+            <h1 className="text-2xl font-bold">Select Partners</h1>
+            <div className="w-20"></div>
+          </div>
+
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="flex items-center gap-2">
+                <Users className="w-5 h-5 text-blue-600" />
+                Select {requiredPartners} partner{requiredPartners > 1 ? 's' : ''} for {selectedBidder?.name}
+              </CardTitle>
+              <div className="flex items-center justify-between text-sm text-gray-600">
+                <span>{selectedPartners.length}/{requiredPartners} selected</span>
+                <div className="flex items-center gap-2">
+                  <span className="bg-blue-100 text-blue-800 px-2 py-1 rounded text-xs">
+                    {selectedPlayers.length} players
+                  </span>
+                  <span className="bg-green-100 text-green-800 px-2 py-1 rounded text-xs">
+                    {partnerCount} total partners
+                  </span>
+                </div>
+              </div>
+            </CardHeader>
+            <CardContent>
+              <div className="grid grid-cols-2 gap-4 mb-6">
+                {availablePartners.map((player) => {
+                  const isSelected = selectedPartners.some(p => p.id === player.id);
+                  return (
+                    <div
+                      key={player.id}
+                      className={`cursor-pointer p-4 rounded-lg border-2 transition-all ${
+                        isSelected 
+                          ? 'border-blue-500 bg-blue-50' 
+                          : selectedPartners.length >= requiredPartners
+                          ? 'border-gray-200 opacity-50 cursor-not-allowed'
+                          : 'border-gray-200 hover:border-blue-300'
+                      }`}
+                      onClick={() => togglePartnerSelection(player)}
+                    >
+                      <div className="flex flex-col items-center space-y-2">
+                        <Avatar className="w-12 h-12">
+                          <AvatarImage src={player.avatar} alt={player.name} />
+                          <AvatarFallback>{player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                        </Avatar>
+                        <span className="text-sm font-medium text-center">{player.name}</span>
+                        {isSelected && (
+                          <Badge variant="secondary" className="bg-blue-100 text-blue-800">
+                            Partner
+                          </Badge>
+                        )}
+                      </div>
+                    </div>
+                  );
+                })}
+              </div>
+
+              {/* Only One Partner Button */}
+              <div className="text-center">
+                <Button
+                  variant="ghost"
+                  size="sm"
+                  className="text-gray-600 hover:text-gray-800 hover:bg-gray-50"
+                  onClick={() => setStep('bid')}
+                >
+                  {requiredPartners === 1 ? 'Skip Partner' : 'Only One Partner'}
+                </Button>
+                <p className="text-xs text-gray-500 mt-1">
+                  {requiredPartners === 1 
+                    ? 'Proceed with just the bidder (no partners needed)'
+                    : 'Skip partner selection and proceed with just the bidder'
+                  }
+                </p>
+              </div>
+              </CardContent>
+          </Card>
+        </div>
+      </div>
+    );
+  }
+
+  if (step === 'bid') {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+        <div className="max-w-md mx-auto space-y-6">
+          <div className="flex items-center justify-between text-white">
+            <Button
+              variant="ghost"
+              className="text-white hover:bg-white/20"
+              onClick={() => setStep('partners')}
+            >
+              <ArrowLeft className="w-5 h-5" />
+            </Button>
+            <h1 className="text-2xl font-bold">Enter Bid</h1>
+            <div className="w-20"></div>
+          </div>
+
+          <Card className="bg-white/95 shadow-xl">
+  <CardHeader>
+    <CardTitle className="flex items-center gap-2">
+      <Target className="w-5 h-5 text-green-600" />
+      Team:
+    </CardTitle>
+  </CardHeader>
+  <CardContent className="space-y-6">
+    <div className="text-center p-4 bg-gray-50 rounded-lg">
+      {/* <p className="text-sm text-gray-600 mb-3">Team:</p> */}
+      
+      {/* Team Avatars */}
+      <div className="flex justify-center items-center mb-3">
+        <div className="relative">
+          {/* Bidder Avatar */}
+          <div className="relative z-10">
+            <Avatar className="w-16 h-16 border-4 border-yellow-400 shadow-lg">
+              <AvatarImage src={selectedBidder?.avatar} alt={selectedBidder?.name} />
+              <AvatarFallback className="bg-yellow-100 text-yellow-800 font-bold">
+                {selectedBidder?.name?.slice(0, 2).toUpperCase()}
+              </AvatarFallback>
+            </Avatar>
+            <div className="absolute -top-1 -right-1 bg-yellow-500 text-white text-xs px-1.5 py-0.5 rounded-full font-bold">
+              B
+            </div>
+          </div>
+          
+          {/* Partner Avatars */}
+          {selectedPartners.length > 0 ? (
+            selectedPartners.map((partner, index) => (
+              <div 
+                key={partner.id} 
+                className="absolute z-0"
+                style={{
+                  transform: `rotate(${index * 15 - 15}deg) translateX(${index * 20 + index * 20}px)`,
+                  transformOrigin: 'left center'
+                }}
+              >
+                <Avatar className="w-12 h-12 border-2 border-blue-400 shadow-md">
+                  <AvatarImage src={partner.avatar} alt={partner.name} />
+                  <AvatarFallback className="bg-blue-100 text-blue-800 font-bold text-xs">
+                    {partner.name?.slice(0, 2).toUpperCase()}
+                  </AvatarFallback>
+                </Avatar>
+              </div>
+            ))
+          ) : (
+            <div className="absolute z-0 transform rotate-12 translate-x-6">
+              <div className="w-12 h-12 border-2 border-gray-400 rounded-full bg-gray-100 flex items-center justify-center shadow-md">
+                <span className="text-gray-500 text-xs font-bold">SOLO</span>
+              </div>
+            </div>
+          )}
+        </div>
+      </div>
+      
+      {/* Team Names */}
+      <div className="flex flex-wrap justify-center gap-2 mt-16">
+        <Badge className="bg-yellow-100 text-yellow-800">
+          {selectedBidder?.name} (Bidder)
+        </Badge>
+        {selectedPartners.length > 0 ? (
+          selectedPartners.map(partner => (
+            <Badge key={partner.id} className="bg-blue-100 text-blue-800">
+              {partner.name}
+            </Badge>
+          ))
+        ) : (
+          <Badge className="bg-gray-100 text-gray-600">
+            Solo Player
+          </Badge>
+        )}
+      </div>
+    </div>
+
+    <div>
+      <Label htmlFor="bid">Bid Amount (130-250, multiples of 5)</Label>
+      <Input
+        id="bid"
+        type="number"
+        min="130"
+        max="250"
+        step="5"
+        value={bidAmount}
+        onChange={(e) => {
+          const value = e.target.value;
+          
+          // Allow empty string for clearing
+          if (value === '') {
+            setBidAmount('');
+            return;
+          }
+          
+          // Allow partial input while typing (don't constrain until blur or complete)
+          const num = parseInt(value);
+          if (isNaN(num)) return;
+          
+          // Only apply constraints if the number is complete (3 digits for this range)
+          // or if user is trying to go beyond reasonable bounds
+          if (num > 999) return; // Prevent unreasonably large numbers
+          if (num < 0) return;   // Prevent negative numbers
+          
+          setBidAmount(value);
+        }}
+        onBlur={(e) => {
+          // Apply rounding and constraints only when user finishes editing
+          const value = e.target.value;
+          if (value === '') return;
+          
+          let num = parseInt(value);
+          if (isNaN(num)) return;
+          
+          // Round to nearest 5
+          num = Math.round(num / 5) * 5;
+          // Apply min/max constraints
+          num = Math.max(130, Math.min(250, num));
+          
+          setBidAmount(num.toString());
+        }}
+        placeholder="Enter bid amount"
+        className="mt-1 text-lg text-center"
+      />
+      {bidAmount && !isNaN(parseInt(bidAmount)) && (
+        <p className="text-sm text-gray-500 mt-1 text-center">
+          {(() => {
+            const num = parseInt(bidAmount);
+            const rounded = Math.round(num / 5) * 5;
+            const constrained = Math.max(130, Math.min(250, rounded));
+            
+            if (num !== constrained) {
+              return `Will be adjusted to: ${constrained} points`;
+            } else if (num !== rounded) {
+              return `Will be rounded to: ${rounded} points`;
+            } else if (num >= 130 && num <= 250) {
+              return `Valid bid: ${num} points ✓`;
+            }
+            return '';
+          })()}
+        </p>
+      )}
+    </div>
+
+    {/* Default Bid Buttons */}
+    <div>
+      <Label className="text-sm font-medium mb-3 block">Quick Select</Label>
+      <div className="grid grid-cols-4 gap-2">
+        {(() => {
+          const playerCount = selectedPlayers.length;
+          const bids = [];
+          
+          if (playerCount === 4) {
+            for (let i = 130; i <= 180; i += 5) bids.push(i);
+          } else if (playerCount === 5) {
+            for (let i = 140; i <= 190; i += 5) bids.push(i);
+          } else if (playerCount === 6) {
+            for (let i = 150; i <= 220; i += 5) bids.push(i);
+          } else {
+            for (let i = 160; i <= 220; i += 5) bids.push(i);
+            bids.push(250);
+          }
+          return bids;
+        })().map((amount) => (
+          <Button
+            key={amount}
+            variant={bidAmount === amount.toString() ? "default" : "outline"}
+            size="sm"
+            className={`text-xs ${
+              bidAmount === amount.toString() 
+                ? 'bg-green-600 hover:bg-green-700 text-white' 
+                : 'hover:bg-gray-50'
+            }`}
+            onClick={() => setBidAmount(amount.toString())}
+          >
+            {amount}
+          </Button>
+        ))}
+      </div>
+    </div>
+
+    <Button 
+      className="w-full bg-green-600 hover:bg-green-700"
+      onClick={() => setStep('result')}
+      disabled={(() => {
+        if (!bidAmount) return true;
+        const num = parseInt(bidAmount);
+        if (isNaN(num)) return true;
+        const rounded = Math.round(num / 5) * 5;
+        const constrained = Math.max(130, Math.min(250, rounded));
+        return constrained < 130 || constrained > 250;
+      })()}
+    >
+      Continue to Result
+    </Button>
+  </CardContent>
+</Card>
+        </div>
+      </div>
+    );
+  }
+
+  if (step === 'result') {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+        <div className="max-w-md mx-auto space-y-6">
+          <div className="flex items-center justify-between text-white">
+            <Button
+              variant="ghost"
+              className="text-white hover:bg-white/20"
+              onClick={() => setStep('bid')}
+            >
+              <ArrowLeft className="w-4 h-4 mr-2" />
+              {/* Back */}
+            </Button>
+            <h1 className="text-2xl font-bold">Match Result</h1>
+            <div className="w-20"></div>
+          </div>
+
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="text-center">Did the team achieve their bid?</CardTitle>
+            </CardHeader>
+            <CardContent className="space-y-6">
+              <div className="text-center p-4 bg-gray-50 rounded-lg space-y-2 flex flex-col w-full items-center justify-center">
+                <div className=" flex-col items-center justify-center gap-2 flex w-full">
+                  <Target className="w-12 h-12 opacity-50" />
+                  <span className="font-bold text-2xl">{bidAmount} points</span>
+                </div>
+                <div className="text-sm text-gray-600">
+                  Team: {selectedBidder?.name}{selectedPartners.length > 0 ? ' + ' + selectedPartners.map(p => p.name).join(', ') : ' (Solo)'}
+                </div>
+              </div>
+
+              <div className="grid grid-cols-2 gap-4">
+                <Button 
+                  className="bg-green-600 hover:bg-green-700 h-16 text-lg"
+                  onClick={() => handleResult(true)}
+                  disabled={loading}
+                >
+                  <div className="text-center">
+                    <div className="font-bold">WON</div>
+                    <div className="text-xs opacity-90">Team gets points</div>
+                  </div>
+                </Button>
+                
+                <Button 
+                  className="bg-red-600 hover:bg-red-700 h-16 text-lg"
+                  onClick={() => handleResult(false)}
+                  disabled={loading}
+                >
+                  <div className="text-center">
+                    <div className="font-bold">LOST</div>
+                    <div className="text-xs opacity-90">Others get points</div>
+                  </div>
+                </Button>
+              </div>
+
+              {loading && (
+                <div className="text-center text-gray-500">
+                  Recording match result...
+                </div>
+              )}
+            </CardContent>
+          </Card>
+        </div>
+      </div>
+    );
+  }
+
+  return null;
+};
+
+export default NewMatchScreen;
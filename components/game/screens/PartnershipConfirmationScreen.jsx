@@ -0,0 +1,173 @@
+'use client';
+
+import { useState } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Input } from '@/components/ui/input';
+import { Label } from '@/components/ui/label';
+import { Users, ArrowLeft } from 'lucide-react';
+import { useGame } from '@/components/game/GameProvider';
+import { enqueue, newLocalId } from '@/lib/outbox';
+
+// Partnership Confirmation Screen
+const PartnershipConfirmationScreen = () => {
+  const { setCurrentScreen, selectedPlayers, setGameData, selectedLocation, syncNow } = useGame();
+  const [customPartnerCount, setCustomPartnerCount] = useState('');
+  const [showCustom, setShowCustom] = useState(false);
+
+  const defaultPartnerCount = selectedPlayers.length <= 5 ? 2 : 3;
+  const nonPartnerCount = selectedPlayers.length - defaultPartnerCount;
+  const maxPartners = Math.floor(selectedPlayers.length / 2);
+
+  // The game starts under a local id straight away; the outbox creates it on the server
+  const handleConfirm = async (partnerCount = defaultPartnerCount) => {
+    const localId = newLocalId();
+    try {
+      await enqueue({
+        kind: 'createGame',
+        gameId: localId,
+        payload: { location: selectedLocation, players: selectedPlayers }
+      });
+    } catch (error) {
+      console.error('Error creating game:', error);
+      alert('Failed to create game');
+      return;
+    }
+
+    setGameData({
+      id: localId,
+      location: selectedLocation,
+      date: new Date().toISOString(),
+      isActive: true,
+      partnerCount: selectedPlayers.length <= 5 ? 2 : 3,
+      players: selectedPlayers.map(player => ({ playerId: player.id, player })),
+      matches: []
+    });
+    setCurrentScreen('mainGame');
+    syncNow();
+  };
+
+  const isValidCustomCount = () => {
+    const count = parseInt(customPartnerCount);
+    return count >= 2 && count <= maxPartners;
+  };
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+      <div className="max-w-lg mx-auto space-y-6">
+        <div className="flex items-center justify-between text-white">
+          <Button
+            variant="ghost"
+            className="text-white hover:bg-white/20"
+            onClick={() => setCurrentScreen('playerSelection')}
+          >
+            <ArrowLeft className="w-5 h-5" />
+          </Button>
+          <h1 className="text-2xl font-bold">Partnership Setup</h1>
+          <div className="w-20"></div>
+        </div>
+
+        <Card className="bg-white/95 shadow-xl">
+          <CardHeader>
+            <CardTitle className="text-center text-xl">Team Structure</CardTitle>
+          </CardHeader>
+          <CardContent className="space-y-6">
+            {/* Player Count Display */}
+            <div className="text-center p-6 bg-gradient-to-r from-blue-50 to-green-50 rounded-xl border-2 border-blue-200">
+              <div className="text-4xl font-bold text-blue-600 mb-2">{selectedPlayers.length}</div>
+              <p className="text-lg font-medium text-gray-700">Total Players</p>
+            </div>
+
+            {/* Default Partnership Structure */}
+            <div className="space-y-4">
+              <div className="text-center">
+                <h3 className="text-lg font-semibold text-gray-800 mb-4">Recommended Structure</h3>
+                <div className="grid grid-cols-2 gap-4">
+                  <div className="p-4 bg-green-100 rounded-lg border-2 border-green-300">
+                    <div className="flex items-center justify-center gap-2 mb-2">
+                      <Users className="w-6 h-6 text-green-600" />
+                      <span className="text-2xl font-bold text-green-600">{defaultPartnerCount}</span>
+                    </div>
+                    <p className="text-sm font-medium text-green-800">Partners</p>
+                    <p className="text-xs text-green-600">1 bidder + {defaultPartnerCount - 1} partner{defaultPartnerCount > 2 ? 's' : ''}</p>
+                  </div>
+                  <div className="p-4 bg-gray-100 rounded-lg border-2 border-gray-300">
+                    <div className="flex items-center justify-center gap-2 mb-2">
+                      <Users className="w-6 h-6 text-gray-600" />
+                      <span className="text-2xl font-bold text-gray-600">{nonPartnerCount}</span>
+                    </div>
+                    <p className="text-sm font-medium text-gray-800">Non-partners</p>
+                    <p className="text-xs text-gray-600">Challengers</p>
+                  </div>
+                </div>
+              </div>
+
+              <Button 
+                className="w-full bg-green-600 hover:bg-green-700 h-12 text-lg"
+                onClick={() => handleConfirm()}
+              >
+                ✓ Let's Go!
+              </Button>
+            </div>
+
+            {/* Custom Partnership Option */}
+            <div className="border-t pt-4">
+              <Button 
+                variant="ghost"
+                className="w-full text-gray-600 hover:text-gray-800 hover:bg-gray-50"
+                onClick={() => setShowCustom(!showCustom)}
+              >
+                {showCustom ? 'Hide Custom Options' : 'Customize Partnership Count'}
+              </Button>
+
+              {showCustom && (
+                <div className="mt-4 p-4 bg-gray-50 rounded-lg space-y-4">
+                  <div>
+                    <Label className="text-sm font-medium text-gray-700">
+                      Number of partners (including bidder)
+                    </Label>
+                    <p className="text-xs text-gray-500 mb-2">
+                      Must be between 2 and {maxPartners} (max half of total players)
+                    </p>
+                    <Input
+                      type="number"
+                      min="2"
+                      max={maxPartners}
+                      value={customPartnerCount}
+                      onChange={(e) => setCustomPartnerCount(e.target.value)}
+                      placeholder="Enter number"
+                      className="text-center text-lg"
+                    />
+                    {customPartnerCount && !isValidCustomCount() && (
+                      <p className="text-xs text-red-500 mt-1">
+                        Must be between 2 and {maxPartners}
+                      </p>
+                    )}
+                  </div>
+                  
+                  {customPartnerCount && isValidCustomCount() && (
+                    <div className="p-3 bg-blue-50 rounded-lg">
+                      <p className="text-sm text-blue-800">
+                        <strong>{customPartnerCount} partners</strong> vs <strong>{selectedPlayers.length - parseInt(customPartnerCount)} non-partners</strong>
+                      </p>
+                    </div>
+                  )}
+                  
+                  <Button 
+                    className="w-full bg-blue-600 hover:bg-blue-700"
+                    onClick={() => handleConfirm(parseInt(customPartnerCount))}
+                    disabled={!isValidCustomCount()}
+                  >
+                    ✓ Use Custom Structure
+                  </Button>
+                </div>
+              )}
+            </div>
+          </CardContent>
+        </Card>
+      </div>
+    </div>
+  );
+};
+
+export default PartnershipConfirmationScreen;
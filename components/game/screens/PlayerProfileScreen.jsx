@@ -0,0 +1,393 @@
+'use client';
+
+import { useState, useEffect } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Badge } from '@/components/ui/badge';
+import { Avatar, AvatarImage, AvatarFallback } from '@/components/ui/avatar';
+import { Users, Trophy, FileText, ArrowLeft, Crown, Target, User, TrendingUp, Award, Calendar, MapPin, BarChart3 } from 'lucide-react';
+import { useGame } from '@/components/game/GameProvider';
+import { fetchAllPlayers } from '@/components/game/players';
+
+// Player Profile Screen
+const PlayerProfileScreen = () => {
+  const { setCurrentScreen } = useGame();
+  const [allPlayers, setAllPlayers] = useState([]);
+  const [selectedPlayer, setSelectedPlayer] = useState(null);
+  const [playerStats, setPlayerStats] = useState(null);
+  const [loading, setLoading] = useState(false);
+  const [showPlayerSelector, setShowPlayerSelector] = useState(true);
+
+  useEffect(() => {
+    loadAllPlayers();
+  }, []);
+
+  const loadAllPlayers = async () => {
+    try {
+      setAllPlayers(await fetchAllPlayers());
+    } catch (error) {
+      console.error('Error fetching players:', error);
+    }
+  };
+
+  const fetchPlayerStats = async (playerId) => {
+    setLoading(true);
+    try {
+      const response = await fetch(`/api/players/${playerId}/stats`);
+      if (response.ok) {
+        const data = await response.json();
+        setPlayerStats(data.stats);
+        setShowPlayerSelector(false);
+      } else {
+        console.error('Failed to fetch player stats');
+        alert('Failed to fetch player statistics');
+      }
+    } catch (error) {
+      console.error('Error fetching player stats:', error);
+      alert('Failed to fetch player statistics');
+    }
+    setLoading(false);
+  };
+
+  const handlePlayerSelect = (player) => {
+    setSelectedPlayer(player);
+    fetchPlayerStats(player.id);
+  };
+
+  const handleBack = () => {
+    if (showPlayerSelector) {
+      setCurrentScreen('setup');
+    } else {
+      setShowPlayerSelector(true);
+      setPlayerStats(null);
+      setSelectedPlayer(null);
+    }
+  };
+
+  if (showPlayerSelector) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+        <div className="max-w-2xl mx-auto space-y-6">
+          <div className="flex items-center justify-between text-white">
+            <Button
+              variant="ghost"
+              className="text-white hover:bg-white/20"
+              onClick={() => setCurrentScreen('mainGame')}
+            >
+              <ArrowLeft className="w-5 h-5" />
+            </Button>
+            <div className="text-center">
+              <h1 className="text-2xl font-bold">Player Profiles</h1>
+              <p className="text-green-200">Select a player to view their statistics</p>
+            </div>
+            <div className="w-20"></div>
+          </div>
+
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="flex items-center gap-2">
+                <User className="w-5 h-5" />
+                Choose Player
+              </CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="grid grid-cols-2 gap-4">
+                {allPlayers.length > 0 ? (
+                  allPlayers.map((player) => (
+                    <div
+                      key={player.id}
+                      className="cursor-pointer p-4 rounded-lg border-2 border-gray-200 hover:border-green-400 transition-all"
+                      onClick={() => handlePlayerSelect(player)}
+                    >
+                      <div className="flex flex-col items-center space-y-2">
+                        <Avatar className="w-16 h-16">
+                          <AvatarImage src={player.avatar} alt={player.name} />
+                          <AvatarFallback>{player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                        </Avatar>
+                        <span className="text-sm font-medium text-center">{player.name}</span>
+                      </div>
+                    </div>
+                  ))
+                ) : (
+                  <div className="col-span-2 text-center py-8">
+                    <User className="w-12 h-12 text-gray-400 mx-auto mb-4" />
+                    <p className="text-gray-600">No players found</p>
+                    <p className="text-sm text-gray-500">Players will appear here once they are added to games</p>
+                  </div>
+                )}
+              </div>
+            </CardContent>
+          </Card>
+        </div>
+      </div>
+    );
+  }
+
+  if (loading) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4 flex items-center justify-center">
+        <Card className="bg-white/95 shadow-xl max-w-md w-full">
+          <CardContent className="p-6 text-center">
+            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-green-600 mx-auto mb-4"></div>
+            <p className="text-gray-600">Loading player statistics...</p>
+          </CardContent>
+        </Card>
+      </div>
+    );
+  }
+
+  if (!playerStats) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4 flex items-center justify-center">
+        <Card className="bg-white/95 shadow-xl max-w-md w-full">
+          <CardContent className="p-6 text-center">
+            <p className="text-gray-600">No player statistics available</p>
+            <Button 
+              className="mt-4" 
+              onClick={() => setShowPlayerSelector(true)}
+            >
+              Back to Player Selection
+            </Button>
+          </CardContent>
+        </Card>
+      </div>
+    );
+  }
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+      <div className="max-w-4xl mx-auto space-y-6">
+        <div className="flex items-center justify-between text-white">
+          <Button
+            variant="ghost"
+            className="text-white hover:bg-white/20"
+            onClick={handleBack}
+          >
+            <ArrowLeft className="w-5 h-5" />
+          </Button>
+          <div className="text-center">
+            <h1 className="text-2xl font-bold">Player Profile</h1>
+            <p className="text-green-200">{playerStats.player.name}</p>
+          </div>
+          <div className="w-20"></div>
+        </div>
+
+        {/* Player Header */}
+        <Card className="bg-white/95 shadow-xl">
+          <CardContent className="p-6">
+              <Avatar className="w-24 h-24 border-4 border-green-400">
+                <AvatarImage src={playerStats.player.avatar} alt={playerStats.player.name} />
+                <AvatarFallback className="text-2xl font-bold">
+                  {playerStats.player.name.slice(0, 2).toUpperCase()}
+                </AvatarFallback>
+              </Avatar>
+            <div className="flex items-center gap-6">
+              <div className="flex-1">
+                <h2 className="text-3xl font-bold text-gray-800">{playerStats.player.name}</h2>
+                <div className="flex flex-col gap-2 mt-4">
+                  <div className="flex items-center gap-2">
+                    <Trophy className="w-5 h-5 text-yellow-500" />
+                    <span className="text-lg font-semibold text-gray-700">
+                      {playerStats.totalPoints} Total Points
+                    </span>
+                  </div>
+                  <div className="flex items-center gap-2">
+                    <TrendingUp className="w-5 h-5 text-green-500" />
+                    <span className="text-lg font-semibold text-gray-700">
+                      {playerStats.winRate}% Win Rate
+                    </span>
+                  </div>
+                </div>
+              </div>
+            </div>
+          </CardContent>
+        </Card>
+
+        {/* Statistics Grid */}
+        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+          {/* Total Matches */}
+          <Card className="bg-white/95 shadow-xl">
+            <CardContent className="p-6 flex items-center justify-between text-center">
+              <div className='w-full'>
+
+              <div className="flex items-center justify-center mb-4">
+                <BarChart3 className="w-8 h-8 text-blue-500" />
+              </div>
+              <div className="text-3xl font-bold text-blue-600 mb-2">{playerStats.totalMatches}</div>
+              <p className="text-sm text-gray-600">Total Matches</p>
+              </div>
+
+              <div className='w-full'>
+              <div className="flex items-center justify-center mb-4">
+                <Award className="w-8 h-8 text-green-500" />
+              </div>
+              <div className="text-3xl font-bold text-green-600 mb-2">
+                {playerStats.wonMatches}W / {playerStats.lostMatches}L
+              </div>
+              <p className="text-sm text-gray-600">Win/Loss Record</p>
+              </div>
+            </CardContent>
+          </Card>
+
+          {/* Matches as Bidder */}
+          <Card className="bg-white/95 shadow-xl">
+            <CardContent className="p-6 text-center flex items-center justify-between">
+  <div className='w-full'>
+
+              <div className="flex items-center justify-center mb-4">
+                <Crown className="w-8 h-8 text-yellow-500" />
+              </div>
+              <div className="text-3xl font-bold text-yellow-600 mb-2">{playerStats.matchesAsBidder}</div>
+              <p className="text-sm text-gray-600">As Bidder</p>
+  </div>
+
+<div className='w-full'>
+
+              <div className="flex items-center justify-center mb-4">
+                <Users className="w-8 h-8 text-blue-500" />
+              </div>
+              <div className="text-3xl font-bold text-blue-600 mb-2">{playerStats.matchesAsPartner}</div>
+              <p className="text-sm text-gray-600">As Partner</p>
+</div>
+
+            </CardContent>
+          </Card>
+
+          <Card className="bg-white/95 shadow-xl">
+            <CardContent className="p-6 flex justify-between items-center text-center">
+      <div className='w-full'>
+              <div className="flex items-center justify-center mb-4">
+                <TrendingUp className="w-8 h-8 text-purple-500" />
+              </div>
+              <div className="text-3xl font-bold text-purple-600 mb-2">{playerStats.averagePoints}</div>
+              <p className="text-sm text-gray-600">Avg Points/Match</p>
+</div>
+              <div className='w-full'>
+              <div className="flex items-center justify-center mb-4">
+                <Target className="w-8 h-8 text-red-500" />
+              </div>
+              <div className="text-3xl font-bold text-red-600 mb-2">{playerStats.highestBid}</div>
+              <p className="text-sm text-gray-600">Highest Bid</p>
+              </div>
+            </CardContent>
+          </Card>
+
+          {/* 250 Bid Attempts and Wins */}
+          <Card className="bg-white/95 shadow-xl">
+            <CardContent className="p-6 text-center flex items-center justify-between">
+              <div className='w-full'>
+                <div className="flex items-center justify-center mb-4">
+                  <Crown className="w-8 h-8 text-yellow-500" />
+                </div>
+                <div className="text-3xl font-bold text-yellow-600 mb-2">{playerStats.bids250}</div>
+                <p className="text-sm text-gray-600">250 Bids (as Bidder)</p>
+              </div>
+              <div className='w-full'>
+                <div className="flex items-center justify-center mb-4">
+                  <Trophy className="w-8 h-8 text-green-500" />
+                </div>
+                <div className="text-3xl font-bold text-green-600 mb-2">{playerStats.bids250Won}</div>
+                <p className="text-sm text-gray-600">250 Bids Won</p>
+              </div>
+            </CardContent>
+          </Card>
+
+        </div>
+
+        {/* Additional Info */}
+        <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+          {/* Most Played Location */}
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="flex items-center gap-2">
+                <MapPin className="w-5 h-5" />
+                Most Played Location
+              </CardTitle>
+            </CardHeader>
+            <CardContent>
+              <p className="text-2xl font-bold text-gray-800">{playerStats.mostPlayedLocation}</p>
+            </CardContent>
+          </Card>
+
+          {/* Recent Performance */}
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="flex items-center gap-2">
+                <Calendar className="w-5 h-5" />
+                Recent Performance
+              </CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="space-y-2">
+                <p className="text-lg font-semibold text-gray-800">
+                  {playerStats.recentPerformance.wins}W / {playerStats.recentPerformance.matches - playerStats.recentPerformance.wins}L
+                </p>
+                <p className="text-sm text-gray-600">
+                  Last {playerStats.recentPerformance.matches} matches
+                </p>
+                <p className="text-sm text-gray-600">
+                  {playerStats.recentPerformance.winRate}% win rate
+                </p>
+              </div>
+            </CardContent>
+          </Card>
+        </div>
+
+        {/* Recent Matches */}
+        <Card className="bg-white/95 shadow-xl">
+          <CardHeader>
+            <CardTitle className="flex items-center gap-2">
+              <FileText className="w-5 h-5" />
+              Recent Matches
+              {/* {playerStats.matches.length > 8 && (
+                <Badge variant="outline" className="ml-2 text-xs">
+                  Showing last 8 of {playerStats.matches.length}
+                </Badge>
+              )} */}
+            </CardTitle>
+          </CardHeader>
+          <CardContent>
+            {playerStats.matches.length === 0 ? (
+              <p className="text-center text-gray-500 py-8">No matches played yet</p>
+            ) : (
+              <div className="space-y-3">
+                {playerStats.matches.slice(0, 8).map((match) => (
+                  <div key={match.id} className="flex items-center justify-between p-3 bg-gray-50 rounded-lg">
+                    <div className="flex items-center gap-3">
+                      <Badge variant="secondary">#{match.matchNumber}</Badge>
+                      <div>
+                        <p className="font-medium">
+                          {match.role === 'BIDDER' ? 'Bidder' : match.role === 'PARTNER' ? 'Partner' : 'Other'}
+                        </p>
+                        <p className="text-sm text-gray-600">
+                          {match.partners.length > 0 ? match.partners.join(', ') : 'Solo'}
+                        </p>
+                      </div>
+                    </div>
+                    <div className="flex items-center gap-4">
+                      <div className="text-center">
+                        <p className="font-bold">{match.bidAmount}</p>
+                        <p className="text-xs text-gray-500">Bid</p>
+                      </div>
+                      <div className="text-center">
+                        <p className={`font-bold ${match.playerScore > 0 ? 'text-green-600' : 'text-gray-500'}`}>
+                          {match.playerScore}
+                        </p>
+                        <p className="text-xs text-gray-500">Points</p>
+                      </div>
+                      <Badge className={match.won ? 'bg-green-100 text-green-800' : 'bg-red-100 text-red-800'}>
+                        {match.won ? 'WON' : 'LOST'}
+                      </Badge>
+                    </div>
+                  </div>
+                ))}
+              </div>
+            )}
+          </CardContent>
+        </Card>
+      </div>
+    </div>
+  );
+};
+
+export default PlayerProfileScreen;
@@ -0,0 +1,243 @@
+'use client';
+
+import { useState } from 'react';
+import { Button } from '@/components/ui/button';
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
+import { Badge } from '@/components/ui/badge';
+import { Avatar, AvatarImage, AvatarFallback } from '@/components/ui/avatar';
+import { Trophy, FileText, ArrowLeft, Crown, Target } from 'lucide-react';
+import { useGame } from '@/components/game/GameProvider';
+
+const ViewTotalsScreen = () => {
+  const { setCurrentScreen, gameData, standings } = useGame();
+  const [showMatchHistory, setShowMatchHistory] = useState(false);
+
+  // Standings and matches are loaded once by the provider and kept live from the game stream
+  const { rankings, totalMatches } = standings;
+  const matches = gameData?.matches || [];
+  const loading = !standings.loaded;
+
+  if (loading) {
+    return (
+      <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4 flex items-center justify-center">
+        <Card className="bg-white/95 shadow-xl max-w-md w-full">
+          <CardContent className="p-6 text-center">
+            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-green-600 mx-auto mb-4"></div>
+            <p className="text-gray-600">Loading totals...</p>
+          </CardContent>
+        </Card>
+      </div>
+    );
+  }
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-green-800 to-green-900 p-4">
+      <div className="max-w-2xl mx-auto space-y-6">
+        <div className="flex items-center justify-between text-white">
+          <Button
+            variant="ghost"
+            className="text-white hover:bg-white/20"
+            onClick={() => setCurrentScreen('mainGame')}
+          >
+            <ArrowLeft className="w-5 h-5" />
+          </Button>
+          <div className="text-center">
+            <h1 className="text-2xl font-bold">Current Standings</h1>
+            <p className="text-green-200">{totalMatches} matches played</p>
+          </div>
+          <div className="w-20"></div>
+        </div>
+
+        <Card className="bg-white/95 shadow-xl">
+          <CardHeader>
+            <div className="flex items-center justify-between">
+              <CardTitle className="flex items-center gap-2">
+                <Trophy className="w-5 h-5 text-yellow-600" />
+                Player Rankings
+              </CardTitle>
+              <Button
+                variant="outline"
+                size="sm"
+                onClick={() => setShowMatchHistory(!showMatchHistory)}
+              >
+                {showMatchHistory ? 'Hide History' : 'Show History'}
+              </Button>
+            </div>
+          </CardHeader>
+          <CardContent>
+            {rankings.length === 0 ? (
+              <div className="text-center py-8 text-gray-500">
+                <Trophy className="w-12 h-12 mx-auto mb-4 opacity-50" />
+                <p>No matches played yet</p>
+                <p className="text-sm">Start a new match to see rankings</p>
+              </div>
+            ) : (
+              <div className="space-y-3">
+                {rankings.map((entry, index) => {
+                  const isLast = index === rankings.length - 1;
+                  return (
+                    <div
+                      key={entry.player.id}
+                      className={`flex items-center justify-between p-4 rounded-lg border-2 ${
+                        index === 0
+                          ? 'border-yellow-300 bg-yellow-50'
+                          : index === 1
+                          ? 'border-green-300 bg-green-50'
+                          : index === 2
+                          ? 'border-orange-300 bg-orange-50'
+                          : isLast
+                          ? 'border-red-200 bg-red-50'
+                          : 'border-gray-200 bg-white'
+                      }`}
+                    >
+                      <div className="flex items-center gap-4">
+                        <div className="flex items-center gap-2">
+                          <span className={`text-2xl font-bold ${
+                            index === 0 ? 'text-yellow-600' :
+                            index === 1 ? 'text-green-400' :
+                            index === 2 ? 'text-orange-600' : 
+                            isLast ? 'text-red-600' : 'text-gray-800'
+                          }`}>
+                            #{index + 1}
+                          </span>
+                          {index < 3 && (
+                            <Trophy className={`w-5 h-5 ${
+                              index === 0 ? 'text-yellow-500' :
+                              index === 1 ? 'text-gray-400' : 'text-orange-500'
+                            }`} />
+                          )}
+                          {/* {isLast && (
+                            <span className="text-xs bg-red-100 text-red-800 px-2 py-1 rounded">
+                              Least Scorer
+                            </span>
+                          )} */}
+                        </div>
+                        <Avatar className="w-12 h-12">
+                          <AvatarImage src={entry.player.avatar} alt={entry.player.name} />
+                          <AvatarFallback>{entry.player.name.slice(0, 2).toUpperCase()}</AvatarFallback>
+                        </Avatar>
+                        <div>
+                          <p className="font-semibold">{entry.player.name}</p>
+                          <p className="text-sm text-gray-600">
+                            {entry.matchesWon}W / {entry.matchesLost}L
+                          </p>
+                        </div>
+                      </div>
+                      <div className="text-right">
+                        <p className={`text-2xl font-bold ${
+                          isLast ? 'text-red-600' : 'text-green-600'
+                        }`}>
+                          {entry.totalPoints}
+                        </p>
+                        <p className="text-sm text-gray-500">points</p>
+                      </div>
+                    </div>
+                  );
+                })}
+              </div>
+            )}
+          </CardContent>
+        </Card>
+
+        {showMatchHistory && (
+          <Card className="bg-white/95 shadow-xl">
+            <CardHeader>
+              <CardTitle className="flex items-center gap-2">
+                <FileText className="w-5 h-5" />
+                Match History
+                {matches && matches.length > 10 && (
+                  <Badge variant="outline" className="ml-2 text-xs">
+                    Showing last 10 of {matches.length}
+                  </Badge>
+                )}
+              </CardTitle>
+            </CardHeader>
+            <CardContent>
+              {matches && matches.length > 0 ? (
+                <div className="overflow-x-auto">
+                  <table className="w-full text-sm">
+                    <thead>
+                      <tr className="border-b border-gray-200">
+                        <th className="text-left py-2 px-3 font-medium text-gray-600">Match</th>
+                        <th className="text-left py-2 px-3 font-medium text-gray-600">Bidder</th>
+                        <th className="text-left py-2 px-3 font-medium text-gray-600">Partners</th>
+                        <th className="text-center py-2 px-3 font-medium text-gray-600">Bid</th>
+                        <th className="text-center py-2 px-3 font-medium text-gray-600">Result</th>
+                        <th className="text-center py-2 px-3 font-medium text-gray-600">Scores</th>
+                      </tr>
+                    </thead>
+                    <tbody>
+                      {matches.slice().reverse().slice(0, 10).map((match) => (
+                        <tr key={match.id} className="border-b border-gray-100 hover:bg-gray-50">
+                          <td className="py-3 px-3">
+                            <Badge variant="secondary">#{match.matchNumber}</Badge>
+                          </td>
+                          <td className="py-3 px-3">
+                            <div className="flex items-center gap-2">
+                              <Crown className="w-4 h-4 text-yellow-600" />
+                              <span className="font-medium">{match.bidder.name}</span>
+                            </div>
+                          </td>
+                          <td className="py-3 px-3">
+                            <div className="flex flex-wrap gap-1">
+                              {match.partners.length > 0 ? (
+                                match.partners.map((partner, index) => (
+                                  <span key={partner.player?.id || partner.id} className="text-xs bg-blue-100 text-blue-800 px-2 py-1 rounded">
+                                    {partner.player?.name || partner.name}
+                                  </span>
+                                ))
+                              ) : (
+                                <span className="text-xs bg-gray-100 text-gray-600 px-2 py-1 rounded">
+                                  Solo
+                                </span>
+                              )}
+                            </div>
+                          </td>
+                          <td className="py-3 px-3 text-center">
+                            <div className="flex items-center justify-center gap-1">
+                              <Target className="w-4 h-4 text-gray-500" />
+                              <span className="font-bold">{match.bidAmount}</span>
+                            </div>
+                          </td>
+                          <td className="py-3 px-3 text-center">
+                            <Badge className={match.won ? 'bg-green-100 text-green-800' : 'bg-red-100 text-red-800'}>
+                              {match.won ? 'WON' : 'LOST'}
+                            </Badge>
+                          </td>
+                          <td className="py-3 px-3 text-center">
+                            <div className="text-xs space-y-1">
+                              {match.scores && match.scores
+                                .filter(score => score.score > 0)
+                                .slice(0, 3)
+                                .map((score) => (
+                                <div key={score.player.id} className="flex justify-between gap-2">
+                                  <span className="truncate max-w-16">{score.player.name}</span>
+                                  <span className="font-medium text-green-600">{score.score}</span>
+                                </div>
+                              ))}
+                              {match.scores && match.scores.filter(score => score.score > 0).length > 3 && (
+                                <div className="text-gray-500">+{match.scores.filter(score => score.score > 0).length - 3} more</div>
+                              )}
+                            </div>
+                          </td>
+                        </tr>
+                      ))}
+                    </tbody>
+                  </table>
+                </div>
+              ) : (
+                <div className="text-center py-8 text-gray-500">
+                  <FileText className="w-12 h-12 mx-auto mb-4 opacity-50" />
+                  <p>No matches played yet</p>
+                  <p className="text-sm">Start a new match to see history</p>
+                </div>
+              )}
+            </CardContent>
+          </Card>
+        )}
+      </div>
+    </div>
+  );
+};
+
+export default ViewTotalsScreen;
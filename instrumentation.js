@@ -0,0 +1,7 @@
+// Runs once when the Next.js server starts (experimental.instrumentationHook)
+export async function register() {
+  if (process.env.NEXT_RUNTIME === 'nodejs') {
+    const { warmDatabase } = await import('./lib/warmup');
+    warmDatabase();
+  }
+}
@@ -0,0 +1,43 @@
+// Bounded LRU cache for serialized API responses. A Map iterates in insertion
+// order, so re-inserting on every hit keeps the least recently used key first.
+
+export class LRUCache {
+  constructor(maxEntries) {
+    this.maxEntries = maxEntries;
+    this.entries = new Map();
+  }
+
+  get(key) {
+    if (!this.entries.has(key)) return undefined;
+    const value = this.entries.get(key);
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+
+  set(key, value) {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    if (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  delete(key) {
+    this.entries.delete(key);
+  }
+}
+
+const globalForCache = globalThis;
+
+export const responseCache = globalForCache.responseCache ||
+  new LRUCache(parseInt(process.env.RESPONSE_CACHE_SIZE || '500', 10));
+
+if (process.env.NODE_ENV !== 'production') globalForCache.responseCache = responseCache;
+
+// True when the request's If-None-Match header already names this ETag
+export const isNotModified = (request, etag) => {
+  const header = request.headers.get('if-none-match');
+  if (!header) return false;
+  return header.split(',').some(tag => tag.trim().replace(/^W\//, '') === etag);
+};
@@ -0,0 +1,26 @@
+import { EventEmitter } from 'events';
+
+// In-process fan-out of game updates to Server-Sent Events subscribers.
+// Each write is serialized once and the same frame is pushed to every viewer.
+
+const globalForEvents = globalThis;
+
+export const gameEvents = globalForEvents.gameEvents || new EventEmitter();
+
+// One listener per open stream, so there is no meaningful upper bound
+gameEvents.setMaxListeners(0);
+
+if (process.env.NODE_ENV !== 'production') globalForEvents.gameEvents = gameEvents;
+
+export const formatEvent = (type, data) => `event: ${type}\ndata: ${JSON.stringify(data)}\n\n`;
+
+export const publishGameEvent = (gameId, type, data) => {
+  if (gameEvents.listenerCount(gameId) === 0) return;
+  gameEvents.emit(gameId, formatEvent(type, data));
+};
+
+// Calls send(frame) for every event published for the game; returns an unsubscribe function
+export const subscribeToGame = (gameId, send) => {
+  gameEvents.on(gameId, send);
+  return () => gameEvents.off(gameId, send);
+};
@@ -0,0 +1,83 @@
+// Replays the response of a write when a client retries it with the same
+// Idempotency-Key header, so a retried hand is not recorded twice. Keys are scoped
+// to the route they were sent to, kept in a bounded LRU and expire after
+// IDEMPOTENCY_TTL_MS. A retry that arrives while the first attempt is still
+// running waits for that attempt instead of starting a second one.
+
+import { createHash } from 'crypto';
+import { LRUCache } from '@/lib/cache';
+
+const TTL_MS = parseInt(process.env.IDEMPOTENCY_TTL_MS || '86400000', 10);
+const MAX_KEY_LENGTH = 255;
+
+const globalForIdempotency = globalThis;
+
+const store = globalForIdempotency.idempotencyStore ||
+  new LRUCache(parseInt(process.env.IDEMPOTENCY_KEYS || '10000', 10));
+
+if (process.env.NODE_ENV !== 'production') globalForIdempotency.idempotencyStore = store;
+
+const jsonError = (error, status) => new Response(JSON.stringify({ error }), {
+  status,
+  headers: { 'Content-Type': 'application/json' }
+});
+
+const replay = ({ status, body, contentType }) => new Response(body, {
+  status,
+  headers: { 'Content-Type': contentType, 'Idempotent-Replayed': 'true' }
+});
+
+// Run handler() at most once per (scope, Idempotency-Key). Requests without the
+// header run as usual. Server errors (5xx or a throw) are not remembered, so the
+// client's next retry runs the write again.
+export const withIdempotency = async (request, scope, handler) => {
+  const key = request.headers.get('idempotency-key');
+  if (!key) return handler();
+  if (key.length > MAX_KEY_LENGTH) {
+    return jsonError(`Idempotency-Key must be at most ${MAX_KEY_LENGTH} characters`, 400);
+  }
+
+  const storeKey = `${scope} ${key}`;
+  const fingerprint = createHash('sha256').update(await request.clone().text()).digest('base64');
+
+  // Loops only when an earlier attempt failed and this request should take over
+  for (;;) {
+    const existing = store.get(storeKey);
+    if (!existing || existing.expiresAt <= Date.now()) break;
+    if (existing.fingerprint !== fingerprint) {
+      return jsonError('Idempotency-Key was already used for a different request', 422);
+    }
+    const saved = await existing.result;
+    if (saved) return replay(saved);
+  }
+
+  let settle;
+  const entry = {
+    fingerprint,
+    expiresAt: Date.now() + TTL_MS,
+    result: new Promise(resolve => { settle = resolve; })
+  };
+  store.set(storeKey, entry);
+
+  const forget = () => {
+    if (store.get(storeKey) === entry) store.delete(storeKey);
+    settle(null);
+  };
+
+  try {
+    const response = await handler();
+    if (response.status >= 500) {
+      forget();
+      return response;
+    }
+    settle({
+      status: response.status,
+      body: await response.clone().text(),
+      contentType: response.headers.get('content-type') || 'application/json'
+    });
+    return response;
+  } catch (error) {
+    forget();
+    throw error;
+  }
+};
@@ -0,0 +1,127 @@
+import { AsyncLocalStorage } from 'async_hooks';
+
+// Per-route request metrics, exposed in Prometheus text format at /api/metrics.
+// Database work is attributed to the request that caused it through AsyncLocalStorage.
+
+const LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5];
+
+const globalForMetrics = globalThis;
+
+// Both live on globalThis in production too: the Prisma client's hooks may come from
+// the instrumentation bundle's copy of this module, and must still see the request
+// context and counters of the route bundle's copy
+const state = globalForMetrics.apiMetrics || {
+  routes: new Map(),
+  statements: { count: 0, seconds: 0 }
+};
+
+globalForMetrics.apiMetrics = state;
+
+const requestContext = globalForMetrics.apiRequestContext || new AsyncLocalStorage();
+
+globalForMetrics.apiRequestContext = requestContext;
+
+const routeEntry = (route) => {
+  let entry = state.routes.get(route);
+  if (!entry) {
+    entry = {
+      buckets: LATENCY_BUCKETS.map(() => 0),
+      count: 0,
+      seconds: 0,
+      statuses: new Map(),
+      dbOperations: 0,
+      dbSeconds: 0
+    };
+    state.routes.set(route, entry);
+  }
+  return entry;
+};
+
+// Called for every Prisma operation; counts towards the current request, if any
+export const recordQuery = (durationMs) => {
+  const context = requestContext.getStore();
+  if (!context) return;
+  context.dbOperations++;
+  context.dbSeconds += durationMs / 1000;
+};
+
+// Called for every SQL statement the Prisma engine reports through its query events
+export const recordStatement = (durationMs) => {
+  state.statements.count++;
+  state.statements.seconds += durationMs / 1000;
+};
+
+const recordRequest = (route, status, seconds, context) => {
+  const entry = routeEntry(route);
+  entry.count++;
+  entry.seconds += seconds;
+  LATENCY_BUCKETS.forEach((le, i) => {
+    if (seconds <= le) entry.buckets[i]++;
+  });
+  entry.statuses.set(status, (entry.statuses.get(status) || 0) + 1);
+  entry.dbOperations += context.dbOperations;
+  entry.dbSeconds += context.dbSeconds;
+};
+
+// Wraps a route handler so its latency, status and database work are recorded under
+// `route`, a templated key such as "GET /api/games/:gameId/totals"
+export const instrument = async (route, handler) => {
+  const context = { dbOperations: 0, dbSeconds: 0 };
+  const started = performance.now();
+  let status = 500;
+  try {
+    const response = await requestContext.run(context, handler);
+    status = response.status;
+    return response;
+  } finally {
+    recordRequest(route, status, (performance.now() - started) / 1000, context);
+  }
+};
+
+const escapeLabel = (value) => String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"');
+
+export const renderMetrics = () => {
+  const lines = [];
+  const routes = Array.from(state.routes.entries()).sort(([a], [b]) => a.localeCompare(b));
+
+  lines.push('# HELP http_request_duration_seconds API request latency by route');
+  lines.push('# TYPE http_request_duration_seconds histogram');
+  routes.forEach(([route, entry]) => {
+    const label = `route="${escapeLabel(route)}"`;
+    LATENCY_BUCKETS.forEach((le, i) => {
+      lines.push(`http_request_duration_seconds_bucket{${label},le="${le}"} ${entry.buckets[i]}`);
+    });
+    lines.push(`http_request_duration_seconds_bucket{${label},le="+Inf"} ${entry.count}`);
+    lines.push(`http_request_duration_seconds_sum{${label}} ${entry.seconds}`);
+    lines.push(`http_request_duration_seconds_count{${label}} ${entry.count}`);
+  });
+
+  lines.push('# HELP http_requests_total API requests by route and status');
+  lines.push('# TYPE http_requests_total counter');
+  routes.forEach(([route, entry]) => {
+    entry.statuses.forEach((count, status) => {
+      lines.push(`http_requests_total{route="${escapeLabel(route)}",status="${status}"} ${count}`);
+    });
+  });
+
+  lines.push('# HELP prisma_operations_total Prisma client operations by route');
+  lines.push('# TYPE prisma_operations_total counter');
+  routes.forEach(([route, entry]) => {
+    lines.push(`prisma_operations_total{route="${escapeLabel(route)}"} ${entry.dbOperations}`);
+  });
+
+  lines.push('# HELP prisma_operation_seconds_total Time spent in Prisma client operations by route');
+  lines.push('# TYPE prisma_operation_seconds_total counter');
+  routes.forEach(([route, entry]) => {
+    lines.push(`prisma_operation_seconds_total{route="${escapeLabel(route)}"} ${entry.dbSeconds}`);
+  });
+
+  lines.push('# HELP prisma_sql_statements_total SQL statements run by the Prisma engine');
+  lines.push('# TYPE prisma_sql_statements_total counter');
+  lines.push(`prisma_sql_statements_total ${state.statements.count}`);
+  lines.push('# HELP prisma_sql_statement_seconds_total Time spent in SQL statements run by the Prisma engine');
+  lines.push('# TYPE prisma_sql_statement_seconds_total counter');
+  lines.push(`prisma_sql_statement_seconds_total ${state.statements.seconds}`);
+
+  return lines.join('\n') + '\n';
+};
@@ -0,0 +1,228 @@
+// Browser-side write queue for game actions. Creating a game, recording a hand and
+// ending a game are written to IndexedDB first, so the UI can move on at once,
+// and syncOutbox() sends them to the API in the order they were made. Consecutive
+// hands for a game go as one batch request. A game created offline gets a local id
+// ("local-..."), which is swapped for the server's id once the game is saved.
+//
+// Every request carries an Idempotency-Key. A batch's key and membership are
+// stored before it is sent, so retrying after a lost response replays the saved
+// result instead of recording the hands twice.
+
+const DB_NAME = 'cardgame-outbox';
+const STORE = 'entries';
+const MAX_SYNC_HANDS = 100;
+const REQUEST_TIMEOUT_MS = 10000;
+
+export const LOCAL_ID_PREFIX = 'local-';
+
+export const isLocalId = (id) => typeof id === 'string' && id.startsWith(LOCAL_ID_PREFIX);
+
+export const newLocalId = () => `${LOCAL_ID_PREFIX}${crypto.randomUUID()}`;
+
+// Without IndexedDB (private browsing, old browsers) the queue lives in memory for the page's lifetime
+let memoryEntries = [];
+let memorySeq = 0;
+let dbPromise = null;
+
+const openDb = () => {
+  if (typeof indexedDB === 'undefined') return Promise.resolve(null);
+  if (!dbPromise) {
+    dbPromise = new Promise((resolve) => {
+      const request = indexedDB.open(DB_NAME, 1);
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore(STORE, { keyPath: 'seq', autoIncrement: true });
+      };
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => {
+        console.error('Outbox storage unavailable, queueing in memory:', request.error);
+        resolve(null);
+      };
+    });
+  }
+  return dbPromise;
+};
+
+// Runs work(store) in one readwrite transaction and resolves once it commits
+const withStore = async (work) => {
+  const db = await openDb();
+  if (!db) return work(null);
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(STORE, 'readwrite');
+    let result;
+    Promise.resolve(work(tx.objectStore(STORE))).then(value => { result = value; }, reject);
+    tx.oncomplete = () => resolve(result);
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+};
+
+const requestResult = (request) => new Promise((resolve, reject) => {
+  request.onsuccess = () => resolve(request.result);
+  request.onerror = () => reject(request.error);
+});
+
+// Queues { kind: 'createGame' | 'match' | 'endGame', gameId, payload }. Resolves to the stored entry.
+export const enqueue = (entry) => withStore(async (store) => {
+  const record = { ...entry, key: entry.key || crypto.randomUUID(), createdAt: Date.now() };
+  if (!store) {
+    record.seq = ++memorySeq;
+    memoryEntries.push(record);
+    return record;
+  }
+  record.seq = await requestResult(store.add(record));
+  return record;
+});
+
+// Every queued entry, oldest first
+export const readOutbox = () => withStore((store) => {
+  if (!store) return [...memoryEntries];
+  return requestResult(store.getAll());
+});
+
+// Queued hands for one game, oldest first (to restore pending matches after a reload)
+export const queuedHands = async (gameId) =>
+  (await readOutbox()).filter(entry => entry.kind === 'match' && entry.gameId === gameId);
+
+const removeEntries = (entries) => withStore((store) => {
+  const seqs = new Set(entries.map(entry => entry.seq));
+  if (!store) {
+    memoryEntries = memoryEntries.filter(entry => !seqs.has(entry.seq));
+    return;
+  }
+  seqs.forEach(seq => store.delete(seq));
+});
+
+const putEntries = (entries) => withStore((store) => {
+  if (!store) {
+    const bySeq = new Map(entries.map(entry => [entry.seq, entry]));
+    memoryEntries = memoryEntries.map(entry => bySeq.get(entry.seq) || entry);
+    return;
+  }
+  entries.forEach(entry => store.put(entry));
+});
+
+// Resolves to the response, or null when the request should be retried later
+// (offline, timed out or a server error)
+const send = async (method, url, body, key) => {
+  const controller = new AbortController();
+  const timer = setTimeout(() => controller.abort(), REQUEST_TIMEOUT_MS);
+  try {
+    const response = await fetch(url, {
+      method,
+      headers: { 'Content-Type': 'application/json', 'Idempotency-Key': key },
+      body: body === undefined ? undefined : JSON.stringify(body),
+      signal: controller.signal
+    });
+    return response.status >= 500 ? null : response;
+  } catch (error) {
+    return null;
+  } finally {
+    clearTimeout(timer);
+  }
+};
+
+const errorMessage = async (response) => {
+  try {
+    return (await response.json()).error || `HTTP ${response.status}`;
+  } catch (error) {
+    return `HTTP ${response.status}`;
+  }
+};
+
+// The next batch of hands to send: the batch already sent for the first entry if
+// there is one, otherwise the run of hands for its game. The batch is stored before
+// it is sent, so a retry resends exactly the same hands under the same key.
+const nextBatch = async (entries) => {
+  const [first] = entries;
+  if (first.batchKey) return entries.filter(entry => entry.batchKey === first.batchKey);
+
+  const batch = [];
+  for (const entry of entries) {
+    if (entry.kind !== 'match' || entry.gameId !== first.gameId || batch.length === MAX_SYNC_HANDS) break;
+    batch.push({ ...entry, batchKey: first.key });
+  }
+  await putEntries(batch);
+  return batch;
+};
+
+// Sends one step of the queue. Resolves to false when the server can't be reached.
+const flushOne = async (entries, handlers) => {
+  const [first] = entries;
+
+  if (first.kind === 'createGame') {
+    const response = await send('POST', '/api/games', first.payload, first.key);
+    if (!response) return false;
+    if (!response.ok) {
+      // Later entries for the game can never be saved either
+      const orphaned = entries.filter(entry => entry.gameId === first.gameId);
+      await removeEntries(orphaned);
+      handlers.onRejected?.(first, await errorMessage(response));
+      return true;
+    }
+    const { game } = await response.json();
+    const renamed = entries
+      .filter(entry => entry !== first && entry.gameId === first.gameId)
+      .map(entry => ({ ...entry, gameId: game.id }));
+    await putEntries(renamed);
+    await removeEntries([first]);
+    handlers.onGameCreated?.(first.gameId, game);
+    return true;
+  }
+
+  if (first.kind === 'match') {
+    const batch = await nextBatch(entries);
+    const response = await send(
+      'POST',
+      `/api/games/${first.gameId}/matches/batch`,
+      { hands: batch.map(entry => entry.payload) },
+      first.batchKey || first.key
+    );
+    if (!response) return false;
+    if (!response.ok) {
+      await removeEntries(batch);
+      const message = await errorMessage(response);
+      batch.forEach(entry => handlers.onRejected?.(entry, message));
+      return true;
+    }
+    const data = await response.json();
+    await removeEntries(batch);
+    handlers.onMatchesSynced?.(first.gameId, data);
+    return true;
+  }
+
+  const response = await send('PUT', `/api/games/${first.gameId}/end`, undefined, first.key);
+  if (!response) return false;
+  await removeEntries([first]);
+  if (response.ok) {
+    handlers.onGameEnded?.(first.gameId, await response.json());
+  } else {
+    handlers.onRejected?.(first, await errorMessage(response));
+  }
+  return true;
+};
+
+const flush = async (handlers) => {
+  for (;;) {
+    const entries = await readOutbox();
+    if (entries.length === 0) return true;
+    if (!(await flushOne(entries, handlers))) return false;
+  }
+};
+
+let running = null;
+
+// Sends everything queued, in order. Concurrent calls share one run. Resolves to
+// true when the queue is empty, false when it stopped early to retry later.
+// handlers: onGameCreated(localId, game), onMatchesSynced(gameId, data),
+// onGameEnded(gameId, data) and onRejected(entry, message) for writes the server refused.
+export const syncOutbox = (handlers = {}) => {
+  if (!running) {
+    running = flush(handlers)
+      .catch(error => {
+        console.error('Error syncing outbox:', error);
+        return false;
+      })
+      .finally(() => { running = null; });
+  }
+  return running;
+};
@@ -1,7 +1,47 @@
+import { cpus } from 'os'
 import { PrismaClient } from '@prisma/client'
+import { recordQuery, recordStatement } from './metrics'
 
 const globalForPrisma = globalThis
 
-export const prisma = globalForPrisma.prisma || new PrismaClient()
+// Connections the query engine keeps open: connection_limit in DATABASE_URL if set,
+// else DATABASE_POOL_SIZE, else Prisma's default of 2 per CPU plus one
+const urlPoolSize = /[?&]connection_limit=(\d+)/.exec(process.env.DATABASE_URL || '')?.[1]
+export const POOL_SIZE = parseInt(urlPoolSize || process.env.DATABASE_POOL_SIZE || String(cpus().length * 2 + 1), 10)
 
-if (process.env.NODE_ENV !== 'production') globalForPrisma.prisma = prisma
+const datasourceUrl = () => {
+  const url = process.env.DATABASE_URL
+  if (!url || urlPoolSize || !process.env.DATABASE_POOL_SIZE) return undefined
+  return `${url}${url.includes('?') ? '&' : '?'}connection_limit=${POOL_SIZE}`
+}
+
+const createPrismaClient = () => {
+  const client = new PrismaClient({
+    log: [{ emit: 'event', level: 'query' }],
+    ...(datasourceUrl() && { datasourceUrl: datasourceUrl() })
+  })
+
+  // Every SQL statement the engine runs, process-wide
+  client.$on('query', (e) => recordStatement(e.duration))
+
+  // Query extensions run in the caller's async context, so operations can be
+  // attributed to the request that issued them
+  return client.$extends({
+    query: {
+      async $allOperations({ args, query }) {
+        const started = performance.now()
+        try {
+          return await query(args)
+        } finally {
+          recordQuery(performance.now() - started)
+        }
+      }
+    }
+  })
+}
+
+// Kept on globalThis in production too: instrumentation.js is bundled apart from
+// the routes, and the pool it warms at startup must be the one requests use
+export const prisma = globalForPrisma.prisma || createPrismaClient()
+
+globalForPrisma.prisma = prisma
@@ -0,0 +1,33 @@
+// Elo-style player ratings across games. Each hand is the bidder's team against
+// everyone else at the table: a side's strength is the mean rating of its players,
+// and the result moves ratings by K * (actual - expected). K grows with the bid,
+// and within the bidder's team the bidder carries BIDDER_SHARE times a partner's
+// share. The defenders lose exactly what the bidder's team gains, so the club
+// average stays at INITIAL_RATING. analytics.py mirrors these rules for rebuilds.
+
+export const INITIAL_RATING = 1500;
+export const RATING_K = 24; // K for a minimum bid
+export const MIN_BID = 130;
+export const BIDDER_SHARE = 2;
+
+// Applies one hand to a Map of playerId -> rating, in place. playerIds is
+// everyone at the table; missing players start at INITIAL_RATING.
+export const rateHand = ({ bidderId, partnerIds, bidAmount, won, playerIds }, ratings) => {
+  const team = [bidderId, ...partnerIds];
+  const defenders = playerIds.filter(id => !team.includes(id));
+  if (defenders.length === 0) return ratings;
+
+  const rating = (id) => ratings.get(id) ?? INITIAL_RATING;
+  const mean = (ids) => ids.reduce((sum, id) => sum + rating(id), 0) / ids.length;
+  const expected = 1 / (1 + 10 ** ((mean(defenders) - mean(team)) / 400));
+  const swing = RATING_K * (bidAmount / MIN_BID) * ((won ? 1 : 0) - expected) * team.length;
+
+  const shares = BIDDER_SHARE + partnerIds.length;
+  const updates = [
+    [bidderId, swing * BIDDER_SHARE / shares],
+    ...partnerIds.map(id => [id, swing / shares]),
+    ...defenders.map(id => [id, -swing / defenders.length])
+  ];
+  updates.forEach(([id, change]) => ratings.set(id, rating(id) + change));
+  return ratings;
+};
@@ -0,0 +1,100 @@
+// Scoring rules for a single hand. Shared by the API write path and anything
+// that needs to derive scores the same way the server does.
+
+export const isOnBidderTeam = (playerId, bidderId, partnerIds) =>
+  playerId === bidderId || partnerIds.includes(playerId);
+
+// Returns [{ playerId, score }] for the bidder, partners and every other player at the table
+export const calculateScores = ({ bidder, partners, bidAmount, won, players }) => {
+  const nonPartners = players.filter(p =>
+    p.id !== bidder.id && !partners.some(partner => partner.id === p.id)
+  );
+
+  const scores = [];
+  if (won) {
+    if (partners.length === 0) {
+      // Solo player case: bidder gets bid amount only (not bid + 100)
+      scores.push({ playerId: bidder.id, score: bidAmount });
+      nonPartners.forEach(player => {
+        scores.push({ playerId: player.id, score: 0 });
+      });
+    } else {
+      // Normal case: bidder gets bid + 100, partners get bid amount, non-partners get 0
+      scores.push({ playerId: bidder.id, score: bidAmount + 100 });
+      partners.forEach(partner => {
+        scores.push({ playerId: partner.id, score: bidAmount });
+      });
+      nonPartners.forEach(player => {
+        scores.push({ playerId: player.id, score: 0 });
+      });
+    }
+  } else {
+    // Bidder and partners get 0, each non-partner gets full bid amount
+    scores.push({ playerId: bidder.id, score: 0 });
+    partners.forEach(partner => {
+      scores.push({ playerId: partner.id, score: 0 });
+    });
+    nonPartners.forEach(player => {
+      scores.push({ playerId: player.id, score: bidAmount });
+    });
+  }
+  return scores;
+};
+
+// Adds one hand to a Map of playerId -> { totalPoints, matchesWon, matchesLost }.
+// A player wins the hand when their side (bidder team or challengers) wins.
+export const tallyTotals = ({ bidderId, partnerIds, won, scores }, tally = new Map()) => {
+  scores.forEach(({ playerId, score }) => {
+    const entry = tally.get(playerId) || { totalPoints: 0, matchesWon: 0, matchesLost: 0 };
+    const playerWon = won === isOnBidderTeam(playerId, bidderId, partnerIds);
+    entry.totalPoints += score;
+    if (playerWon) {
+      entry.matchesWon++;
+    } else {
+      entry.matchesLost++;
+    }
+    tally.set(playerId, entry);
+  });
+  return tally;
+};
+
+// Adds one hand to a Map of playerId -> career stat increments (see the player_stats table).
+// Wins and losses only count hands where the player was on the bidder team.
+export const tallyPlayerStats = ({ bidderId, partnerIds, bidAmount, won, scores }, tally = new Map()) => {
+  scores.forEach(({ playerId, score }) => {
+    const entry = tally.get(playerId) || {
+      totalMatches: 0,
+      matchesAsBidder: 0,
+      matchesAsPartner: 0,
+      wonMatches: 0,
+      lostMatches: 0,
+      totalPoints: 0,
+      highestBid: 0,
+      bids250: 0,
+      bids250Won: 0
+    };
+    const isBidder = playerId === bidderId;
+    const isPartner = partnerIds.includes(playerId);
+
+    entry.totalMatches++;
+    entry.totalPoints += score;
+    if (isBidder) {
+      entry.matchesAsBidder++;
+      entry.highestBid = Math.max(entry.highestBid, bidAmount);
+      if (bidAmount === 250) {
+        entry.bids250++;
+        if (won) entry.bids250Won++;
+      }
+    }
+    if (isPartner) entry.matchesAsPartner++;
+    if (isBidder || isPartner) {
+      if (won) {
+        entry.wonMatches++;
+      } else {
+        entry.lostMatches++;
+      }
+    }
+    tally.set(playerId, entry);
+  });
+  return tally;
+};
@@ -6,6 +6,8 @@ const nextConfig = {
   experimental: {
     // Remove if not using Server Components
     serverComponentsExternalPackages: ['mongodb'],
+    // instrumentation.js warms the database pool when the server starts
+    instrumentationHook: true,
   },
   webpack(config, { dev }) {
     if (dev) {
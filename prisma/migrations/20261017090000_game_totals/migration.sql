@@ -0,0 +1,37 @@
+-- CreateTable
+CREATE TABLE "game_totals" (
+    "gameId" TEXT NOT NULL,
+    "playerId" TEXT NOT NULL,
+    "totalPoints" INTEGER NOT NULL DEFAULT 0,
+    "matchesWon" INTEGER NOT NULL DEFAULT 0,
+    "matchesLost" INTEGER NOT NULL DEFAULT 0,
+
+    CONSTRAINT "game_totals_pkey" PRIMARY KEY ("gameId","playerId")
+);
+
+-- CreateIndex
+CREATE INDEX "game_totals_gameId_totalPoints_idx" ON "game_totals"("gameId", "totalPoints");
+
+-- AddForeignKey
+ALTER TABLE "game_totals" ADD CONSTRAINT "game_totals_gameId_fkey" FOREIGN KEY ("gameId") REFERENCES "games"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- AddForeignKey
+ALTER TABLE "game_totals" ADD CONSTRAINT "game_totals_playerId_fkey" FOREIGN KEY ("playerId") REFERENCES "players"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- Backfill from existing match history
+INSERT INTO "game_totals" ("gameId", "playerId", "totalPoints", "matchesWon", "matchesLost")
+SELECT
+    m."gameId",
+    s."playerId",
+    SUM(s."score"),
+    COUNT(*) FILTER (WHERE m."won" = (m."bidderId" = s."playerId" OR mp."playerId" IS NOT NULL)),
+    COUNT(*) FILTER (WHERE m."won" <> (m."bidderId" = s."playerId" OR mp."playerId" IS NOT NULL))
+FROM "match_scores" s
+JOIN "matches" m ON m."id" = s."matchId"
+LEFT JOIN "match_partners" mp ON mp."matchId" = s."matchId" AND mp."playerId" = s."playerId"
+GROUP BY m."gameId", s."playerId";
+
+-- Players seated at a game but without any hands yet
+INSERT INTO "game_totals" ("gameId", "playerId")
+SELECT "gameId", "playerId" FROM "game_players"
+ON CONFLICT DO NOTHING;
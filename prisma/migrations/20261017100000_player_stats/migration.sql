@@ -0,0 +1,61 @@
+-- CreateTable
+CREATE TABLE "player_stats" (
+    "playerId" TEXT NOT NULL,
+    "totalMatches" INTEGER NOT NULL DEFAULT 0,
+    "matchesAsBidder" INTEGER NOT NULL DEFAULT 0,
+    "matchesAsPartner" INTEGER NOT NULL DEFAULT 0,
+    "wonMatches" INTEGER NOT NULL DEFAULT 0,
+    "lostMatches" INTEGER NOT NULL DEFAULT 0,
+    "totalPoints" INTEGER NOT NULL DEFAULT 0,
+    "highestBid" INTEGER NOT NULL DEFAULT 0,
+    "bids250" INTEGER NOT NULL DEFAULT 0,
+    "bids250Won" INTEGER NOT NULL DEFAULT 0,
+
+    CONSTRAINT "player_stats_pkey" PRIMARY KEY ("playerId")
+);
+
+-- CreateTable
+CREATE TABLE "player_location_stats" (
+    "playerId" TEXT NOT NULL,
+    "location" TEXT NOT NULL,
+    "matches" INTEGER NOT NULL DEFAULT 0,
+
+    CONSTRAINT "player_location_stats_pkey" PRIMARY KEY ("playerId","location")
+);
+
+-- CreateIndex
+CREATE INDEX "player_location_stats_playerId_matches_idx" ON "player_location_stats"("playerId", "matches");
+
+-- AddForeignKey
+ALTER TABLE "player_stats" ADD CONSTRAINT "player_stats_playerId_fkey" FOREIGN KEY ("playerId") REFERENCES "players"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- AddForeignKey
+ALTER TABLE "player_location_stats" ADD CONSTRAINT "player_location_stats_playerId_fkey" FOREIGN KEY ("playerId") REFERENCES "players"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- Backfill from existing match history
+INSERT INTO "player_stats" (
+    "playerId", "totalMatches", "matchesAsBidder", "matchesAsPartner", "wonMatches", "lostMatches",
+    "totalPoints", "highestBid", "bids250", "bids250Won"
+)
+SELECT
+    s."playerId",
+    COUNT(*),
+    COUNT(*) FILTER (WHERE m."bidderId" = s."playerId"),
+    COUNT(*) FILTER (WHERE mp."playerId" IS NOT NULL),
+    COUNT(*) FILTER (WHERE (m."bidderId" = s."playerId" OR mp."playerId" IS NOT NULL) AND m."won"),
+    COUNT(*) FILTER (WHERE (m."bidderId" = s."playerId" OR mp."playerId" IS NOT NULL) AND NOT m."won"),
+    SUM(s."score"),
+    COALESCE(MAX(m."bidAmount") FILTER (WHERE m."bidderId" = s."playerId"), 0),
+    COUNT(*) FILTER (WHERE m."bidderId" = s."playerId" AND m."bidAmount" = 250),
+    COUNT(*) FILTER (WHERE m."bidderId" = s."playerId" AND m."bidAmount" = 250 AND m."won")
+FROM "match_scores" s
+JOIN "matches" m ON m."id" = s."matchId"
+LEFT JOIN "match_partners" mp ON mp."matchId" = s."matchId" AND mp."playerId" = s."playerId"
+GROUP BY s."playerId";
+
+INSERT INTO "player_location_stats" ("playerId", "location", "matches")
+SELECT s."playerId", g."location", COUNT(*)
+FROM "match_scores" s
+JOIN "matches" m ON m."id" = s."matchId"
+JOIN "games" g ON g."id" = m."gameId"
+GROUP BY s."playerId", g."location";
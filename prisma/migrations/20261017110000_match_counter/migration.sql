@@ -0,0 +1,20 @@
+-- AlterTable
+ALTER TABLE "games" ADD COLUMN "matchCount" INTEGER NOT NULL DEFAULT 0;
+
+-- Renumber any duplicate or sparse match numbers left by the old count() + 1 numbering
+UPDATE "matches" m
+SET "matchNumber" = r."rn"
+FROM (
+    SELECT "id", ROW_NUMBER() OVER (PARTITION BY "gameId" ORDER BY "matchNumber", "timestamp", "id") AS "rn"
+    FROM "matches"
+) r
+WHERE m."id" = r."id" AND m."matchNumber" <> r."rn";
+
+-- Backfill the per-game counter
+UPDATE "games" g
+SET "matchCount" = c."n"
+FROM (SELECT "gameId", COUNT(*) AS "n" FROM "matches" GROUP BY "gameId") c
+WHERE g."id" = c."gameId";
+
+-- CreateIndex
+CREATE UNIQUE INDEX "matches_gameId_matchNumber_key" ON "matches"("gameId", "matchNumber");
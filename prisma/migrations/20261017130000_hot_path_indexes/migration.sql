@@ -0,0 +1,21 @@
+-- Active game lookup (findFirst) and the deactivation updateMany in POST /api/games.
+-- Only a handful of games are ever active, so a partial index stays tiny.
+CREATE INDEX "games_active_idx" ON "games"("createdAt") WHERE "isActive";
+
+-- CreateIndex
+CREATE INDEX "games_createdAt_idx" ON "games"("createdAt");
+
+-- CreateIndex
+CREATE INDEX "game_players_playerId_idx" ON "game_players"("playerId");
+
+-- CreateIndex
+CREATE INDEX "matches_bidderId_timestamp_idx" ON "matches"("bidderId", "timestamp");
+
+-- CreateIndex
+CREATE INDEX "matches_timestamp_idx" ON "matches"("timestamp");
+
+-- CreateIndex
+CREATE INDEX "match_partners_playerId_matchId_idx" ON "match_partners"("playerId", "matchId");
+
+-- CreateIndex
+CREATE INDEX "match_scores_playerId_matchId_idx" ON "match_scores"("playerId", "matchId");
@@ -0,0 +1,6 @@
+-- GET /api/export pages through matches by (timestamp, id). The wider index serves
+-- every query the timestamp-only index did, so it replaces it.
+DROP INDEX "matches_timestamp_idx";
+
+-- CreateIndex
+CREATE INDEX "matches_timestamp_id_idx" ON "matches"("timestamp", "id");
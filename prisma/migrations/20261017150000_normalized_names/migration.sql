@@ -0,0 +1,51 @@
+-- Player and location names are unique ignoring case and extra whitespace. The
+-- normalized form is a generated column, so every writer gets it without app code.
+
+-- Names that would collide once normalized keep their row but get a numeric suffix
+UPDATE "players" p SET "name" = p."name" || ' (' || d.rn || ')'
+FROM (
+    SELECT "id", row_number() OVER (
+        PARTITION BY lower(btrim(regexp_replace("name", '\s+', ' ', 'g'))) ORDER BY "dateAdded", "id"
+    ) AS rn
+    FROM "players"
+) d
+WHERE d."id" = p."id" AND d.rn > 1;
+
+-- games.location follows a rename through its ON UPDATE CASCADE key; location stats do not
+WITH renamed AS (
+    UPDATE "locations" l SET "name" = l."name" || ' (' || d.rn || ')'
+    FROM (
+        SELECT "id", "name", row_number() OVER (
+            PARTITION BY lower(btrim(regexp_replace("name", '\s+', ' ', 'g'))) ORDER BY "dateAdded", "id"
+        ) AS rn
+        FROM "locations"
+    ) d
+    WHERE d."id" = l."id" AND d.rn > 1
+    RETURNING d."name" AS old_name, l."name" AS new_name
+)
+UPDATE "player_location_stats" s SET "location" = r.new_name
+FROM renamed r
+WHERE s."location" = r.old_name;
+
+-- AlterTable
+ALTER TABLE "players" ADD COLUMN "normalizedName" TEXT
+    GENERATED ALWAYS AS (lower(btrim(regexp_replace("name", '\s+', ' ', 'g')))) STORED;
+
+-- AlterTable
+ALTER TABLE "locations" ADD COLUMN "normalizedName" TEXT
+    GENERATED ALWAYS AS (lower(btrim(regexp_replace("name", '\s+', ' ', 'g')))) STORED;
+
+-- CreateIndex
+CREATE UNIQUE INDEX "players_normalizedName_key" ON "players"("normalizedName");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "locations_normalizedName_key" ON "locations"("normalizedName");
+
+-- Typeahead search: prefix matches (LIKE 'q%') for short queries...
+CREATE INDEX "players_normalizedName_prefix_idx" ON "players"("normalizedName" text_pattern_ops);
+CREATE INDEX "locations_normalizedName_prefix_idx" ON "locations"("normalizedName" text_pattern_ops);
+
+-- ...and trigram indexes for substring matches (LIKE '%q%') from three characters
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX "players_normalizedName_trgm_idx" ON "players" USING gin ("normalizedName" gin_trgm_ops);
+CREATE INDEX "locations_normalizedName_trgm_idx" ON "locations" USING gin ("normalizedName" gin_trgm_ops);
@@ -0,0 +1,15 @@
+-- Games that ended before this migration get their snapshot on first read.
+
+-- CreateTable
+CREATE TABLE "game_snapshots" (
+    "gameId" TEXT NOT NULL,
+    "version" INTEGER NOT NULL,
+    "full" BYTEA NOT NULL,
+    "summary" BYTEA NOT NULL,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "game_snapshots_pkey" PRIMARY KEY ("gameId")
+);
+
+-- AddForeignKey
+ALTER TABLE "game_snapshots" ADD CONSTRAINT "game_snapshots_gameId_fkey" FOREIGN KEY ("gameId") REFERENCES "games"("id") ON DELETE CASCADE ON UPDATE CASCADE;
@@ -0,0 +1,19 @@
+-- Ratings start empty and are kept up to date by every match insert from here on.
+-- Backfill them from the existing history with:
+--   python analytics.py --database-url $DATABASE_URL --write-ratings
+
+-- CreateTable
+CREATE TABLE "player_ratings" (
+    "playerId" TEXT NOT NULL,
+    "rating" DOUBLE PRECISION NOT NULL DEFAULT 1500,
+    "hands" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "player_ratings_pkey" PRIMARY KEY ("playerId")
+);
+
+-- CreateIndex
+CREATE INDEX "player_ratings_rating_playerId_idx" ON "player_ratings"("rating" DESC, "playerId");
+
+-- AddForeignKey
+ALTER TABLE "player_ratings" ADD CONSTRAINT "player_ratings_playerId_fkey" FOREIGN KEY ("playerId") REFERENCES "players"("id") ON DELETE CASCADE ON UPDATE CASCADE;
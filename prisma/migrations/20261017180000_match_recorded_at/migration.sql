@@ -0,0 +1,11 @@
+-- When the server stored each match, set by the database. Incremental exports page
+-- on ("recordedAt", id) instead of the played-at timestamp, which offline clients
+-- send and can be older than hands already exported. Existing rows take their
+-- played-at time.
+ALTER TABLE "matches" ADD COLUMN "recordedAt" TIMESTAMP(3);
+UPDATE "matches" SET "recordedAt" = "timestamp";
+ALTER TABLE "matches" ALTER COLUMN "recordedAt" SET NOT NULL,
+  ALTER COLUMN "recordedAt" SET DEFAULT CURRENT_TIMESTAMP;
+
+-- CreateIndex
+CREATE INDEX "matches_recordedAt_id_idx" ON "matches"("recordedAt", "id");
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Query plan benchmark for the 250 Card Game API
+Seeds a large synthetic history straight into Postgres and records EXPLAIN ANALYZE
+timings for the queries behind each hot route, with the hot-path indexes dropped
+(before) and recreated (after). Point it at a scratch database, not production.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import psycopg
+
+INDEX_MIGRATIONS = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "prisma", "migrations", name, "migration.sql")
+    for name in ("20261017130000_hot_path_indexes", "20261017140000_export_cursor_index",
+                 "20261017170000_player_ratings", "20261017180000_match_recorded_at")
+]
+
+SEATS = 6  # players per seeded game
+
+
+def log(message, level="INFO"):
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {level}: {message}")
+
+
+def libpq_url(url):
+    """Prisma URLs carry ?schema=..., which libpq rejects; drop it"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "schema"]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def connect(url):
+    return psycopg.connect(libpq_url(url), autocommit=True)
+
+
+def summary_statements(prefix):
+    """SQL that fills game_totals, player_stats and player_location_stats for the games
+    and players whose ids start with "<prefix>-g" and "<prefix>-p", from their hands"""
+    return [
+        f"""INSERT INTO game_totals ("gameId", "playerId", "totalPoints", "matchesWon", "matchesLost")
+           SELECT m."gameId", s."playerId", SUM(s.score),
+                  COUNT(*) FILTER (WHERE m.won = (m."bidderId" = s."playerId" OR mp."playerId" IS NOT NULL)),
+                  COUNT(*) FILTER (WHERE m.won <> (m."bidderId" = s."playerId" OR mp."playerId" IS NOT NULL))
+           FROM match_scores s
+           JOIN matches m ON m.id = s."matchId"
+           LEFT JOIN match_partners mp ON mp."matchId" = s."matchId" AND mp."playerId" = s."playerId"
+           WHERE m."gameId" LIKE '{prefix}-g%'
+           GROUP BY m."gameId", s."playerId\"""",
+        f"""INSERT INTO player_stats ("playerId", "totalMatches", "matchesAsBidder", "matchesAsPartner",
+                                     "wonMatches", "lostMatches", "totalPoints", "highestBid", "bids250", "bids250Won")
+           SELECT s."playerId", COUNT(*),
+                  COUNT(*) FILTER (WHERE m."bidderId" = s."playerId"),
+                  COUNT(*) FILTER (WHERE mp."playerId" IS NOT NULL),
+                  COUNT(*) FILTER (WHERE (m."bidderId" = s."playerId" OR mp."playerId" IS NOT NULL) AND m.won),
+                  COUNT(*) FILTER (WHERE (m."bidderId" = s."playerId" OR mp."playerId" IS NOT NULL) AND NOT m.won),
+                  SUM(s.score),
+                  COALESCE(MAX(m."bidAmount") FILTER (WHERE m."bidderId" = s."playerId"), 0),
+                  COUNT(*) FILTER (WHERE m."bidderId" = s."playerId" AND m."bidAmount" = 250),
+                  COUNT(*) FILTER (WHERE m."bidderId" = s."playerId" AND m."bidAmount" = 250 AND m.won)
+           FROM match_scores s
+           JOIN matches m ON m.id = s."matchId"
+           LEFT JOIN match_partners mp ON mp."matchId" = s."matchId" AND mp."playerId" = s."playerId"
+           WHERE s."playerId" LIKE '{prefix}-p%'
+           GROUP BY s."playerId\"""",
+        f"""INSERT INTO player_location_stats ("playerId", location, matches)
+           SELECT s."playerId", g.location, COUNT(*)
+           FROM match_scores s
+           JOIN matches m ON m.id = s."matchId"
+           JOIN games g ON g.id = m."gameId"
+           WHERE s."playerId" LIKE '{prefix}-p%'
+           GROUP BY s."playerId", g.location""",
+    ]
+
+
+def seed_dataset(conn, matches, players=200, hands_per_game=40):
+    """Replace any previous bench-* rows with a synthetic history of about `matches` hands
+
+    Everything is generated server-side with generate_series, so a million hands
+    takes seconds rather than hours. Running totals and player stats are rebuilt
+    for the seeded rows so the summary tables match the history.
+    """
+    games = max(1, matches // hands_per_game)
+    # Seat k of game g, and the bidder seat of hand n in game g
+    seat = lambda g, k: f"'bench-p' || ((({g}) * {SEATS} + ({k})) % {players} + 1)"
+    bidder_seat = f"((g * 7 + n * 3) % {SEATS})"
+
+    statements = [
+        "DELETE FROM games WHERE id LIKE 'bench-g%'",
+        "DELETE FROM players WHERE id LIKE 'bench-p%'",
+        "DELETE FROM locations WHERE id LIKE 'bench-l%'",
+        f"""INSERT INTO players (id, name, avatar)
+            SELECT 'bench-p' || i, 'Bench Player ' || i, NULL FROM generate_series(1, {players}) i""",
+        """INSERT INTO locations (id, name)
+           SELECT 'bench-l' || i, 'Bench Hall ' || i FROM generate_series(1, 5) i""",
+        f"""INSERT INTO games (id, location, date, "partnerCount", "isActive", "createdAt", "matchCount", version)
+            SELECT 'bench-g' || g, 'Bench Hall ' || (g % 5 + 1), now() - g * interval '1 day', 3,
+                   g = 1, now() - g * interval '1 day', {hands_per_game}, 1
+            FROM generate_series(1, {games}) g""",
+        f"""INSERT INTO game_players (id, "gameId", "playerId")
+            SELECT 'bench-gp-' || g || '-' || k, 'bench-g' || g, {seat('g', 'k')}
+            FROM generate_series(1, {games}) g, generate_series(0, {SEATS - 1}) k""",
+        f"""INSERT INTO matches (id, "gameId", "matchNumber", "bidderId", "bidAmount", won, timestamp)
+            SELECT 'bench-m-' || g || '-' || n, 'bench-g' || g, n, {seat('g', bidder_seat)},
+                   130 + 5 * ((g * 31 + n * 17) % 25), (g + n * 7) % 3 <> 0,
+                   now() - g * interval '1 day' + n * interval '3 minutes'
+            FROM generate_series(1, {games}) g, generate_series(1, {hands_per_game}) n""",
+        f"""INSERT INTO match_partners (id, "matchId", "playerId")
+            SELECT 'bench-mp-' || g || '-' || n || '-' || j, 'bench-m-' || g || '-' || n,
+                   {seat('g', f'({bidder_seat} + j) % {SEATS}')}
+            FROM generate_series(1, {games}) g, generate_series(1, {hands_per_game}) n, generate_series(1, 2) j""",
+        f"""INSERT INTO match_scores (id, "matchId", "playerId", score)
+            SELECT 'bench-ms-' || g || '-' || n || '-' || k, 'bench-m-' || g || '-' || n, {seat('g', 'k')},
+                   CASE
+                     WHEN (g + n * 7) % 3 <> 0 THEN
+                       CASE WHEN k = {bidder_seat} THEN bid + 100
+                            WHEN (k - {bidder_seat} + {SEATS}) % {SEATS} IN (1, 2) THEN bid
+                            ELSE 0 END
+                     ELSE
+                       CASE WHEN (k - {bidder_seat} + {SEATS}) % {SEATS} IN (0, 1, 2) THEN 0 ELSE bid END
+                   END
+            FROM generate_series(1, {games}) g, generate_series(1, {hands_per_game}) n,
+                 generate_series(0, {SEATS - 1}) k,
+                 LATERAL (SELECT 130 + 5 * ((g * 31 + n * 17) % 25) AS bid) b""",
+        # Summary tables, rebuilt for the seeded rows only
+        *summary_statements("bench"),
+        # Ratings are a replay of the whole history (analytics.py); a spread of
+        # placeholder values is enough to exercise the leaderboard read
+        f"""INSERT INTO player_ratings ("playerId", rating, hands)
+            SELECT 'bench-p' || i, 1300 + (i * 37) % 400, {matches} * {SEATS} / {players}
+            FROM generate_series(1, {players}) i""",
+    ]
+
+    log(f"🌱 Seeding {games * hands_per_game} hands across {games} games and {players} players")
+    with conn.transaction():
+        for statement in statements:
+            conn.execute(statement)
+    conn.execute("ANALYZE")
+    return games * hands_per_game
+
+
+# (route, query name, SQL). %(game)s and %(player)s are filled with the busiest seeded rows.
+# The SQL mirrors what Prisma issues for each handler.
+ROUTE_QUERIES = [
+    ("GET /api/games", "newest games",
+     'SELECT * FROM games ORDER BY "createdAt" DESC LIMIT 10'),
+    ("GET /api/games/active", "active game",
+     'SELECT id, version FROM games WHERE "isActive" = true LIMIT 1'),
+    ("POST /api/games", "deactivate active games",
+     'UPDATE games SET "isActive" = false WHERE "isActive" = true'),
+    ("GET /api/games/:gameId", "game matches",
+     'SELECT * FROM matches WHERE "gameId" = %(game)s ORDER BY "matchNumber"'),
+    ("GET /api/games/:gameId", "match scores",
+     'SELECT * FROM match_scores WHERE "matchId" IN (SELECT id FROM matches WHERE "gameId" = %(game)s)'),
+    ("GET /api/games/:gameId/totals", "running totals",
+     'SELECT * FROM game_totals WHERE "gameId" = %(game)s ORDER BY "totalPoints" DESC'),
+    ("GET /api/players/:playerId/stats", "recent bidder/partner matches",
+     '''SELECT won FROM matches m
+        WHERE m."bidderId" = %(player)s
+           OR m.id IN (SELECT "matchId" FROM match_partners WHERE "playerId" = %(player)s)
+        ORDER BY timestamp DESC LIMIT 5'''),
+    ("GET /api/players/:playerId/stats", "recent matches",
+     '''SELECT * FROM matches m
+        WHERE m.id IN (SELECT "matchId" FROM match_scores WHERE "playerId" = %(player)s)
+        ORDER BY timestamp DESC LIMIT 10'''),
+    ("GET /api/export", "first page of matches",
+     '''SELECT id FROM matches WHERE "recordedAt" < LOCALTIMESTAMP - interval '1 minute'
+        ORDER BY "recordedAt", id LIMIT 500'''),
+    ("GET /api/players/:playerId/stats", "most played location",
+     'SELECT * FROM player_location_stats WHERE "playerId" = %(player)s ORDER BY matches DESC LIMIT 1'),
+    ("GET /api/leaderboard", "top ratings",
+     'SELECT * FROM player_ratings ORDER BY rating DESC, "playerId" LIMIT 20'),
+]
+
+
+def load_index_ddl(conn):
+    """(CREATE INDEX statement, name) pairs from the hot-path index migrations, for the
+    indexes that are in the database (later migrations replace some earlier ones)"""
+    ddl = []
+    for path in INDEX_MIGRATIONS:
+        with open(path) as f:
+            ddl += re.findall(r'(CREATE INDEX "([^"]+)"[^;]+;)', f.read())
+    existing = {row[0] for row in conn.execute("SELECT indexname FROM pg_indexes")}
+    return [(statement, name) for statement, name in ddl if name in existing]
+
+
+def explain(conn, sql, params, repeats):
+    """Median execution time (ms) and top plan node over `repeats` EXPLAIN ANALYZE runs"""
+    timings = []
+    node = None
+    for _ in range(repeats):
+        # Roll back so the UPDATE in the list doesn't change anything
+        with conn.transaction(force_rollback=True):
+            row = conn.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + sql, params).fetchone()
+        plan = row[0][0]
+        timings.append(plan["Execution Time"])
+        node = plan["Plan"]["Node Type"]
+    return round(statistics.median(timings), 3), node
+
+
+def run_phase(conn, params, repeats):
+    results = {}
+    for route, name, sql in ROUTE_QUERIES:
+        ms, node = explain(conn, sql, params, repeats)
+        results[f"{route} | {name}"] = {"ms": ms, "plan": node}
+    return results
+
+
+def busiest_rows(conn):
+    game = conn.execute('SELECT "gameId" FROM matches GROUP BY "gameId" ORDER BY COUNT(*) DESC LIMIT 1').fetchone()
+    player = conn.execute('SELECT "playerId" FROM match_scores GROUP BY "playerId" ORDER BY COUNT(*) DESC LIMIT 1').fetchone()
+    if not game or not player:
+        raise SystemExit("No match history to benchmark; run with --seed")
+    return {"game": game[0], "player": player[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN ANALYZE the hot route queries before and after the index migration")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"), help="Postgres URL (defaults to DATABASE_URL)")
+    parser.add_argument("--seed", type=int, metavar="MATCHES", help="seed roughly this many synthetic hands first")
+    parser.add_argument("--players", type=int, default=200, help="size of the seeded player pool")
+    parser.add_argument("--repeats", type=int, default=5, help="EXPLAIN ANALYZE runs per query (median is reported)")
+    parser.add_argument("--output", default="query_plans.json", help="where to write the JSON report")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+
+    with connect(args.database_url) as conn:
+        if args.seed:
+            seed_dataset(conn, args.seed, players=args.players)
+        params = busiest_rows(conn)
+        indexes = load_index_ddl(conn)
+
+        log(f"Dropping {len(indexes)} hot-path indexes for the baseline run")
+        for _, name in indexes:
+            conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+        conn.execute("ANALYZE")
+        before = run_phase(conn, params, args.repeats)
+
+        log("Recreating indexes")
+        for ddl, _ in indexes:
+            conn.execute(ddl)
+        conn.execute("ANALYZE")
+        after = run_phase(conn, params, args.repeats)
+
+    report = {"params": params, "queries": {}}
+    for key in before:
+        speedup = before[key]["ms"] / after[key]["ms"] if after[key]["ms"] else None
+        report["queries"][key] = {"before": before[key], "after": after[key],
+                                  "speedup": round(speedup, 1) if speedup else None}
+        log(f"{key}: {before[key]['ms']}ms ({before[key]['plan']}) -> "
+            f"{after[key]['ms']}ms ({after[key]['plan']})")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    log(f"📄 Query plan report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,14 +7,19 @@ if [ -z "$DATABASE_URL" ]; then
   exit 1
 fi
 
-# Run Prisma migrations (safe for prod if migrations exist)
-# Fall back to db push if migrate fails (first-time deploy)
-if npx prisma migrate deploy; then
+# Call the installed CLI directly; npx spends seconds resolving it on every start
+PRISMA=./node_modules/.bin/prisma
+
+# Skip migrations when the database already has every migration in this image
+# (compared by checksum). Otherwise run Prisma migrations (safe for prod if
+# migrations exist), falling back to db push if migrate fails (first-time deploy)
+if node scripts/schema-current.js; then
+  echo "Schema is current, skipping migrations"
+elif "$PRISMA" migrate deploy; then
   echo "Migrations applied"
 else
   echo "Migrate deploy failed, trying prisma db push"
-  npx prisma db push || true
+  "$PRISMA" db push || true
 fi
 
 exec "$@"
-
@@ -0,0 +1,45 @@
+// Exits 0 when every migration in prisma/migrations is already applied to
+// DATABASE_URL with the same checksum, so the entrypoint can skip
+// `prisma migrate deploy`. Anything else (pending or edited migrations, a database
+// set up with db push, a database that isn't up yet) exits 1 and the entrypoint
+// runs the full migrate. Uses the generated client, which starts in a fraction of
+// the time the Prisma CLI takes.
+const { createHash } = require('crypto')
+const fs = require('fs')
+const path = require('path')
+const { PrismaClient } = require('@prisma/client')
+
+const migrationsDir = path.join(__dirname, '..', 'prisma', 'migrations')
+
+// Prisma records the SHA-256 of each migration.sql in _prisma_migrations.checksum
+const localMigrations = () =>
+  fs.readdirSync(migrationsDir, { withFileTypes: true })
+    .filter(entry => entry.isDirectory())
+    .map(entry => {
+      const sql = fs.readFileSync(path.join(migrationsDir, entry.name, 'migration.sql'))
+      return { name: entry.name, checksum: createHash('sha256').update(sql).digest('hex') }
+    })
+
+async function main() {
+  const prisma = new PrismaClient()
+  try {
+    const applied = await prisma.$queryRaw`
+      SELECT "migration_name", "checksum" FROM "_prisma_migrations"
+      WHERE "finished_at" IS NOT NULL AND "rolled_back_at" IS NULL
+    `
+    const checksums = new Map(applied.map(row => [row.migration_name, row.checksum]))
+    const pending = localMigrations().filter(m => checksums.get(m.name) !== m.checksum)
+    if (pending.length > 0) {
+      console.log(`Schema check: ${pending.length} migration(s) to apply, starting with ${pending[0].name}`)
+      return 1
+    }
+    return 0
+  } catch (e) {
+    console.log(`Schema check: ${e.message.split('\n').pop()}`)
+    return 1
+  } finally {
+    await prisma.$disconnect()
+  }
+}
+
+main().then(code => process.exit(code))
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Synthetic match history for the 250 Card Game
+Generates a realistic multi-year club history in NumPy and bulk-loads it with
+COPY, instead of one API round trip per row:
+
+- a player pool with uneven attendance (a few regulars, a long tail of occasional
+  players), a hidden skill and a boldness that makes some players bid more often
+- games on evenings across the chosen years, tables of 4-10 players, with the
+  partner count POST /api/games assigns (2 up to 5 players, 3 from 6)
+- bids from 130 to 250 in steps of 5, mostly low with a bump at 250
+- results that get less likely as the bid rises and depend on the skill on each side
+- scores derived with the match handler's rules (lib/scoring.js, via analytics.rule_scores)
+
+The same --seed always produces the same history. Generated rows get ids starting
+with "<prefix>-", so a rerun replaces its own rows and nothing else. Summary tables
+are rebuilt for the generated rows, and ratings replayed over the whole history.
+The load runs in one transaction and locks the match tables while it runs, so
+point it at a scale-testing database rather than a live club.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from analytics import ROLE_BIDDER, ROLE_OTHER, ROLE_PARTNER, rule_scores
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Anil", "Asha", "Deepak", "Divya", "Farhan", "Gita", "Harish", "Isha",
+    "Jaya", "Karan", "Kavya", "Lakshmi", "Manoj", "Meera", "Nikhil", "Nisha", "Pooja", "Rahul",
+    "Ravi", "Rekha", "Rohan", "Sanjay", "Shreya", "Sunil", "Tanvi", "Uma", "Vikram", "Zoya",
+]
+LAST_NAMES = [
+    "Agarwal", "Bhat", "Chopra", "Desai", "Gupta", "Iyer", "Jain", "Joshi", "Kapoor", "Khan",
+    "Kumar", "Mehta", "Menon", "Nair", "Patel", "Pillai", "Rao", "Reddy", "Saxena", "Shah",
+    "Sharma", "Singh", "Verma", "Yadav",
+]
+# Existing locations are reused, so these may already be in the database
+LOCATIONS = ["Farmhouse", "Community Center", "Library Hall", "Riverside Cafe", "Old Mill"]
+LOCATION_WEIGHTS = [0.4, 0.25, 0.15, 0.12, 0.08]
+
+TABLE_SIZES = np.arange(4, 11)
+TABLE_SIZE_WEIGHTS = np.array([0.10, 0.20, 0.26, 0.20, 0.12, 0.07, 0.05])
+MAX_TABLE = TABLE_SIZES[-1]
+
+BIDS = np.arange(130, 255, 5)
+BID_250_SHARE = 0.04
+
+HANDS_PER_GAME = (28, 9, 6, 70)  # mean, spread, min, max
+HAND_GAP_MINUTES = (2.5, 6.0)
+
+COPY_CHUNK = 100_000
+
+# Tables whose foreign keys are dropped for the load and added back afterwards
+COPIED_WITH_KEYS = ["game_players", "matches", "match_partners", "match_scores"]
+
+
+def log(message, level="INFO"):
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {level}: {message}")
+
+
+def bid_probabilities():
+    """Falling off with the bid, with BID_250_SHARE of all hands bid at 250"""
+    weights = np.exp(-(BIDS - BIDS[0]) / 30.0)
+    weights[-1] = 0
+    weights *= (1 - BID_250_SHARE) / weights.sum()
+    weights[-1] = BID_250_SHARE
+    return weights
+
+
+def win_probability(bid, skill_edge):
+    """About 77% at 130 and 20% at 250 for evenly matched sides"""
+    logit = 1.2 - 2.6 * (bid - BIDS[0]) / (BIDS[-1] - BIDS[0]) + 1.5 * skill_edge
+    return 1 / (1 + np.exp(-logit))
+
+
+def group_sums(groups, values, n):
+    return np.bincount(groups, weights=values, minlength=n)
+
+
+def generate(seed, matches, players, years, start):
+    """The whole history as arrays: players, games, hands and one row per player per hand"""
+    rng = np.random.default_rng(seed)
+
+    # Players: attendance falls off with rank, skill and boldness are per player
+    attendance = 1 / np.arange(1, players + 1) ** 0.8
+    attendance = attendance[rng.permutation(players)]
+    skill = rng.normal(0, 0.5, players)
+    boldness = rng.lognormal(0, 0.4, players)
+    names = rng.permutation(len(FIRST_NAMES) * len(LAST_NAMES))
+
+    # Games: hands per game, trimmed so the total is exactly `matches`
+    mean, spread, low, high = HANDS_PER_GAME
+    estimate = matches // mean + 2
+    hands_per_game = np.clip(np.round(rng.normal(mean, spread, estimate * 2)), low, high).astype(np.int64)
+    games = int(np.searchsorted(np.cumsum(hands_per_game), matches)) + 1
+    hands_per_game = hands_per_game[:games]
+    hands_per_game[-1] -= hands_per_game.sum() - matches
+
+    span_days = int(years * 365)
+    day = np.sort(rng.integers(0, span_days, games))
+    evening = rng.integers(18 * 60, 21 * 60, games)
+    game_start = np.datetime64(start, "m") + (day * 24 * 60 + evening).astype("timedelta64[m]")
+    location = rng.choice(len(LOCATIONS), games, p=LOCATION_WEIGHTS)
+    table_size = rng.choice(TABLE_SIZES, games, p=TABLE_SIZE_WEIGHTS)
+    partner_count = np.where(table_size <= 5, 2, 3)
+
+    # Seats: weighted sampling without replacement (Gumbel top-k), in chunks of games.
+    # Every game gets MAX_TABLE candidates; seats past its table size stay empty.
+    game_seats = np.empty((games, MAX_TABLE), dtype=np.int64)
+    for first in range(0, games, 10_000):
+        keys = np.log(attendance) + rng.gumbel(size=(min(games, first + 10_000) - first, players))
+        game_seats[first:first + len(keys)] = np.argsort(-keys, axis=1)[:, :MAX_TABLE]
+    seated = np.arange(MAX_TABLE)[None, :] < table_size[:, None]
+    seat_start = np.concatenate([[0], np.cumsum(table_size)])
+    seat_player = game_seats[seated]
+
+    # Hands
+    hand_game = np.repeat(np.arange(games), hands_per_game)
+    hand_first = np.concatenate([[0], np.cumsum(hands_per_game)])[:-1]
+    match_number = np.arange(matches) - hand_first[hand_game] + 1
+    size = table_size[hand_game]
+    hand_seats = game_seats[hand_game]
+    empty_seat = ~seated[hand_game]
+
+    bidder_keys = np.log(boldness[hand_seats]) + rng.gumbel(size=(matches, MAX_TABLE))
+    bidder_keys[empty_seat] = -np.inf
+    bidder_seat = np.argmax(bidder_keys, axis=1)
+
+    partner_keys = rng.random((matches, MAX_TABLE))
+    partner_keys[empty_seat] = np.inf
+    partner_keys[np.arange(matches), bidder_seat] = np.inf
+    partner_seats = np.argsort(partner_keys, axis=1)[:, :2]
+    n_partners = partner_count[hand_game] - 1
+
+    bid = rng.choice(BIDS, matches, p=bid_probabilities())
+    gap = rng.uniform(*HAND_GAP_MINUTES, matches) * 60_000
+    offset = np.cumsum(gap) - np.cumsum(gap)[hand_first][hand_game] + gap[hand_first][hand_game]
+    timestamp = game_start[hand_game].astype("datetime64[ms]") + offset.astype("timedelta64[ms]")
+
+    # One row per player per hand
+    row_hand = np.repeat(np.arange(matches), size)
+    row_seat = np.arange(len(row_hand)) - np.repeat(np.cumsum(size) - size, size)
+    row_player = hand_seats[row_hand, row_seat]
+    role = np.full(len(row_hand), ROLE_OTHER, dtype=np.int8)
+    is_partner = (row_seat == partner_seats[row_hand, 0]) | \
+                 ((row_seat == partner_seats[row_hand, 1]) & (n_partners[row_hand] == 2))
+    role[is_partner] = ROLE_PARTNER
+    role[row_seat == bidder_seat[row_hand]] = ROLE_BIDDER
+
+    on_team = role != ROLE_OTHER
+    team_skill = group_sums(row_hand[on_team], skill[row_player[on_team]], matches) / (n_partners + 1)
+    other_skill = group_sums(row_hand[~on_team], skill[row_player[~on_team]], matches) / (size - n_partners - 1)
+    won = rng.random(matches) < win_probability(bid, team_skill - other_skill)
+    score = rule_scores(bid[row_hand], won[row_hand], role, n_partners[row_hand] == 0)
+
+    combos = len(names)
+    return {
+        "player_names": [f"{FIRST_NAMES[names[i % combos] // len(LAST_NAMES)]} "
+                         f"{LAST_NAMES[names[i % combos] % len(LAST_NAMES)]}"
+                         + (f" {i // combos + 1}" if i >= combos else "")
+                         for i in range(players)],
+        "game_start": game_start, "game_location": location, "partner_count": partner_count,
+        "hands_per_game": hands_per_game, "seat_start": seat_start, "seat_player": seat_player,
+        "hand_game": hand_game, "match_number": match_number,
+        "bidder": hand_seats[np.arange(matches), bidder_seat],
+        "bid": bid, "won": won, "timestamp": timestamp,
+        "row_hand": row_hand, "row_player": row_player, "role": role, "score": score,
+    }
+
+
+def digest(history):
+    """Fingerprint of the generated arrays, to check a seed reproduces the same history"""
+    h = hashlib.sha256()
+    for key in ("hand_game", "bidder", "bid", "won", "row_player", "role", "score"):
+        h.update(np.ascontiguousarray(history[key]).tobytes())
+    return h.hexdigest()[:16]
+
+
+def describe(history):
+    bid, won = history["bid"], history["won"]
+    log(f"{len(bid)} hands in {len(history['hands_per_game'])} games, "
+        f"{history['game_start'][0]} to {history['timestamp'][-1]}")
+    for low, high in [(130, 165), (170, 205), (210, 245), (250, 250)]:
+        band = (bid >= low) & (bid <= high)
+        won_share = f"{won[band].mean():6.1%}" if band.any() else f"{'-':>6}"
+        log(f"  bids {low}-{high}: {band.mean():6.1%} of hands, bidder team won {won_share}")
+    log(f"Digest {digest(history)}")
+
+
+def copy_rows(cur, table, columns, *values):
+    """COPY parallel column lists into a table in text format, a chunk of lines at a time"""
+    quoted = ", ".join(f'"{column}"' for column in columns)
+    with cur.copy(f'COPY {table} ({quoted}) FROM STDIN') as copy:
+        for start in range(0, len(values[0]), COPY_CHUNK):
+            rows = zip(*(column[start:start + COPY_CHUNK] for column in values))
+            copy.write("".join("\t".join(map(str, row)) + "\n" for row in rows))
+
+
+def load(url, history, prefix):
+    import psycopg  # only needed when loading
+
+    from query_plan_benchmark import libpq_url, summary_statements
+
+    ids = lambda kind, n: [f"{prefix}-{kind}{i}" for i in range(1, n + 1)]
+    n_players, n_games = len(history["player_names"]), len(history["hands_per_game"])
+    n_hands, n_rows = len(history["bid"]), len(history["row_hand"])
+    player_ids, game_ids, match_ids = ids("p", n_players), ids("g", n_games), ids("m", n_hands)
+    first_played = history["game_start"].min().astype("datetime64[ms]")
+
+    game_player = history["seat_player"]
+    game_of_seat = np.repeat(np.arange(n_games), np.diff(history["seat_start"]))
+    partners = history["role"] == ROLE_PARTNER
+    game_end = history["timestamp"][np.cumsum(history["hands_per_game"]) - 1] + np.timedelta64(5, "m")
+    names = [f"{name} ({prefix})" for name in history["player_names"]]
+    take = lambda labels, index: [labels[i] for i in index.tolist()]
+
+    with psycopg.connect(libpq_url(url)) as conn:
+        with conn.transaction(), conn.cursor() as cur:
+            cur.execute(f"DELETE FROM games WHERE id LIKE '{prefix}-g%'")
+            cur.execute(f"DELETE FROM players WHERE id LIKE '{prefix}-p%'")
+            cur.executemany("INSERT INTO locations (id, name) VALUES (%s, %s) ON CONFLICT DO NOTHING",
+                            [(f"{prefix}-l{i}", name) for i, name in enumerate(LOCATIONS, 1)])
+            locations = dict(cur.execute("SELECT \"normalizedName\", name FROM locations").fetchall())
+            location_names = [locations[name.lower()] for name in LOCATIONS]
+
+            # Checking a foreign key row by row costs several times the COPY itself;
+            # adding the keys back afterwards validates each one in a single join
+            foreign_keys = cur.execute(
+                """SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid) FROM pg_constraint
+                   WHERE contype = 'f' AND conrelid = ANY(%s::regclass[])""", (COPIED_WITH_KEYS,)).fetchall()
+            for table, name, _ in foreign_keys:
+                cur.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+
+            started = time.perf_counter()
+            copy_rows(cur, "players", ["id", "name", "avatar", "dateAdded"],
+                      player_ids, names,
+                      [f"https://api.dicebear.com/7.x/adventurer/svg?seed={name.replace(' ', '%20')}" for name in names],
+                      [first_played] * n_players)
+            copy_rows(cur, "games", ["id", "location", "date", "partnerCount", "isActive", "matchCount",
+                                     "version", "endedAt", "createdAt"],
+                      game_ids, take(location_names, history["game_location"]), history["game_start"].tolist(),
+                      history["partner_count"].tolist(), [False] * n_games, history["hands_per_game"].tolist(),
+                      (history["hands_per_game"] + 1).tolist(), game_end.tolist(), history["game_start"].tolist())
+            copy_rows(cur, "game_players", ["id", "gameId", "playerId"],
+                      ids("gp", len(game_player)), take(game_ids, game_of_seat), take(player_ids, game_player))
+            copy_rows(cur, "matches", ["id", "gameId", "matchNumber", "bidderId", "bidAmount", "won", "timestamp"],
+                      match_ids, take(game_ids, history["hand_game"]), history["match_number"].tolist(),
+                      take(player_ids, history["bidder"]), history["bid"].tolist(), history["won"].tolist(),
+                      history["timestamp"].tolist())
+            copy_rows(cur, "match_partners", ["id", "matchId", "playerId"],
+                      ids("mp", int(partners.sum())), take(match_ids, history["row_hand"][partners]),
+                      take(player_ids, history["row_player"][partners]))
+            copy_rows(cur, "match_scores", ["id", "matchId", "playerId", "score"],
+                      ids("ms", n_rows), take(match_ids, history["row_hand"]),
+                      take(player_ids, history["row_player"]), history["score"].tolist())
+            for table, name, definition in foreign_keys:
+                cur.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+            copied = time.perf_counter()
+            log(f"📥 Copied {n_players} players, {n_games} games, {n_hands} hands and {n_rows} scores "
+                f"in {copied - started:.1f}s")
+
+            for statement in summary_statements(prefix):
+                cur.execute(statement)
+            log(f"Rebuilt summary tables in {time.perf_counter() - copied:.1f}s")
+        conn.execute("ANALYZE")
+
+
+def replay_ratings(url):
+    from analytics import MatchHistory, player_ratings, write_ratings
+
+    history = MatchHistory.from_postgres(url)
+    written = write_ratings(url, history, *player_ratings(history))
+    log(f"Replayed {history.hands} hands into ratings for {written} players")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and bulk-load a synthetic club history")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"),
+                        help="database to load into (defaults to DATABASE_URL)")
+    parser.add_argument("--seed", type=int, default=250, help="random seed; the same seed gives the same history")
+    parser.add_argument("--matches", type=int, default=100_000, help="hands to generate")
+    parser.add_argument("--players", type=int, default=60, help="size of the player pool")
+    parser.add_argument("--years", type=float, default=3, help="years the games are spread over")
+    parser.add_argument("--start", default="2023-01-01", help="date of the first possible game")
+    parser.add_argument("--prefix", default="syn", help="id prefix of the generated rows")
+    parser.add_argument("--dry-run", action="store_true", help="generate and describe the history without loading it")
+    parser.add_argument("--skip-ratings", action="store_true", help="leave player_ratings as it is")
+    args = parser.parse_args()
+    if args.players < MAX_TABLE:
+        parser.error(f"--players must be at least {MAX_TABLE} to seat the largest tables")
+
+    started = time.perf_counter()
+    history = generate(args.seed, args.matches, args.players, args.years, args.start)
+    log(f"🎲 Generated seed {args.seed} in {time.perf_counter() - started:.1f}s")
+    describe(history)
+    if args.dry_run:
+        return 0
+    if not args.database_url:
+        parser.error("--database-url (or DATABASE_URL) is required unless --dry-run")
+
+    load(args.database_url, history, args.prefix)
+    if not args.skip_ratings:
+        replay_ratings(args.database_url)
+    log(f"✅ Loaded in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())